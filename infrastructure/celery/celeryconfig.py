@@ -25,3 +25,4 @@ app.autodiscover_tasks([
     'modules.grammar.tasks',
     'modules.translator.tasks',
 ])
+app.autodiscover_tasks(['modules.tts.tasks'], related_name='tts_tasks')
@@ -0,0 +1,51 @@
+"""
+Chunk post-translation steps.
+Extension for ChunkTranslator.
+"""
+from ..domain.models import TranslationChunk
+from ..domain.proper_name_protector import ProperNameProtector
+
+
+class ChunkFinisher:
+    """Turn raw model output into a validated chunk."""
+
+    def __init__(self, service):
+        self.service = service
+        self.name_protector = ProperNameProtector()
+
+    def finish(
+        self,
+        chunk_data: dict,
+        raw_translation: str
+    ) -> TranslationChunk:
+        """Restore names, post-process and validate."""
+        original_text = chunk_data["text"]
+
+        restored_translation = (
+            self.name_protector.restore_names(
+                original_text,
+                raw_translation
+            )
+        )
+
+        processed = self.service.post_processor.process(
+            original_text,
+            restored_translation
+        )
+
+        validation = self.service.validator.validate(
+            original_text,
+            processed
+        )
+
+        chunk = TranslationChunk(
+            original_text=original_text,
+            translated_text=processed,
+            start_position=chunk_data["start"],
+            end_position=chunk_data["end"],
+            context_before=chunk_data.get("context_before", ""),
+            context_after=chunk_data.get("context_after", "")
+        )
+
+        chunk.mark_validated(validation)
+        return chunk
@@ -4,7 +4,8 @@ Extension for TranslationService.
 """
 from ..domain.models import TranslationChunk
 from ..domain.value_objects import LanguagePair
-from ..domain.proper_name_protector import ProperNameProtector
+from .chunk_finisher import ChunkFinisher
+from .memory_access import MemoryAccess
 
 
 class ChunkTranslator:
@@ -12,7 +13,8 @@ class ChunkTranslator:
 
     def __init__(self, service):
         self.service = service
-        self.name_protector = ProperNameProtector()
+        self.memory = MemoryAccess(service)
+        self.finisher = ChunkFinisher(service)
 
     def translate_chunk(
         self,
@@ -20,39 +22,56 @@ class ChunkTranslator:
         language_pair: LanguagePair
     ) -> TranslationChunk:
         """Translate single chunk with validation."""
-        original_text = chunk_data["text"]
-        
-        raw_translation = self.service.translator.translate(
-            original_text,
-            language_pair,
-            context=chunk_data.get("context_before")
+        text = chunk_data["text"]
+        context = chunk_data.get("context_before")
+        raw_translation, = self.memory.recall(
+            [text], [context], language_pair
         )
-        
-        restored_translation = (
-            self.name_protector.restore_names(
-                original_text,
-                raw_translation
+        if raw_translation is None:
+            raw_translation = self.service.translator.translate(
+                text,
+                language_pair,
+                context=context
             )
-        )
-
-        processed = self.service.post_processor.process(
-            original_text,
-            restored_translation
-        )
+            self.memory.remember(
+                [text], [context], [raw_translation], language_pair
+            )
+        return self.finisher.finish(chunk_data, raw_translation)
 
-        validation = self.service.validator.validate(
-            original_text,
-            processed
+    def translate_chunks(
+        self,
+        chunks: list[dict],
+        language_pair: LanguagePair
+    ) -> list[TranslationChunk]:
+        """Translate memory misses in one batched call."""
+        texts = [chunk_data["text"] for chunk_data in chunks]
+        contexts = [
+            chunk_data.get("context_before") for chunk_data in chunks
+        ]
+        raw_translations = self.memory.recall(
+            texts, contexts, language_pair
         )
+        missing = [
+            i for i, raw in enumerate(raw_translations)
+            if raw is None
+        ]
 
-        chunk = TranslationChunk(
-            original_text=original_text,
-            translated_text=processed,
-            start_position=chunk_data["start"],
-            end_position=chunk_data["end"],
-            context_before=chunk_data.get("context_before", ""),
-            context_after=chunk_data.get("context_after", "")
-        )
+        if missing:
+            fresh = self.service.translator.translate_batch(
+                [texts[i] for i in missing],
+                language_pair,
+                [contexts[i] for i in missing]
+            )
+            for i, raw in zip(missing, fresh):
+                raw_translations[i] = raw
+            self.memory.remember(
+                [texts[i] for i in missing],
+                [contexts[i] for i in missing],
+                fresh,
+                language_pair
+            )
 
-        chunk.mark_validated(validation)
-        return chunk
+        return [
+            self.finisher.finish(chunk_data, raw)
+            for chunk_data, raw in zip(chunks, raw_translations)
+        ]
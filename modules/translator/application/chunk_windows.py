@@ -0,0 +1,52 @@
+"""
+Windowed chunk translation.
+Extension for TranslationService.
+"""
+from ..domain.translation import Translation
+from ..domain.value_objects import LanguagePair
+
+
+class ChunkWindows:
+    """Feed chunks to the translator batch_chunks at a time."""
+
+    def __init__(self, service):
+        self.service = service
+
+    def translate(
+        self,
+        chunks: list[dict],
+        translation: Translation,
+        language_pair: LanguagePair
+    ) -> None:
+        """Add each translated chunk and update the glossary."""
+        size = self.service.batch_chunks
+        for start in range(0, len(chunks), size):
+            window = chunks[start:start + size]
+            translated_chunks = (
+                self.service.chunk_translator.translate_chunks(
+                    window,
+                    language_pair
+                )
+            )
+
+            for chunk_data, translated_chunk in zip(
+                window, translated_chunks
+            ):
+                translation.add_chunk(translated_chunk)
+                self.service.glossary.update_from_chunk(
+                    chunk_data["text"],
+                    translated_chunk.translated_text
+                )
+
+            self._progress(start + len(window), len(chunks))
+
+    @staticmethod
+    def _progress(done: int, total: int) -> None:
+        """Overwrite the progress line."""
+        percent = (done / total) * 100
+        print(
+            f"Progress: [{done}/{total}] "
+            f"{percent:.1f}% complete",
+            end="\r",
+            flush=True
+        )
@@ -0,0 +1,50 @@
+"""
+Translation memory access for chunk translation.
+Skips the memory when the service has none.
+"""
+from typing import Optional
+
+from ..domain.value_objects import LanguagePair
+
+
+class MemoryAccess:
+    """Recall and store raw model output per chunk."""
+
+    def __init__(self, service):
+        self.service = service
+
+    def recall(
+        self,
+        texts: list[str],
+        contexts: list[Optional[str]],
+        language_pair: LanguagePair
+    ) -> list[Optional[str]]:
+        """Raw translations from memory, None on a miss."""
+        memory = self.service.memory
+        if memory is None:
+            return [None] * len(texts)
+        return memory.lookup(
+            texts,
+            language_pair,
+            self.service.translator.model_signature(language_pair),
+            contexts
+        )
+
+    def remember(
+        self,
+        texts: list[str],
+        contexts: list[Optional[str]],
+        raw_translations: list[str],
+        language_pair: LanguagePair
+    ) -> None:
+        """Store fresh model output in memory."""
+        memory = self.service.memory
+        if memory is None:
+            return
+        memory.store(
+            texts,
+            raw_translations,
+            language_pair,
+            self.service.translator.model_signature(language_pair),
+            contexts
+        )
@@ -3,11 +3,11 @@ Main translation orchestration service.
 Coordinates entire translation pipeline.
 """
 from typing import Optional
-from tqdm import tqdm
 
 from ..domain.translation import Translation
 from ..domain.value_objects import LanguagePair
 from ..domain.translator import ITranslator
+from ..domain.translation_memory import ITranslationMemory
 from ..domain.chunker import SemanticChunker
 from ..domain.glossary_service import GlossaryService
 from ..domain.post_processor import TranslationPostProcessor
@@ -15,19 +15,32 @@ from ..domain.validation_service import ValidationService
 from .language_detector import LanguageDetector
 from .chunk_translator import ChunkTranslator
 from .chunk_merger import ChunkMerger
+from .chunk_windows import ChunkWindows
 
 
 class TranslationService:
     """Orchestrate full translation workflow."""
 
-    def __init__(self, translator: ITranslator):
+    def __init__(
+        self,
+        translator: ITranslator,
+        batch_chunks: int = 64,
+        memory: Optional[ITranslationMemory] = None
+    ):
+        """
+        batch_chunks: chunks per translate_batch call.
+        memory: reuse earlier output for known chunks.
+        """
         self.translator = translator
+        self.batch_chunks = batch_chunks
+        self.memory = memory
         self.chunker = SemanticChunker()
         self.glossary = GlossaryService()
         self.post_processor = TranslationPostProcessor()
         self.validator = ValidationService()
         self.language_detector = LanguageDetector()
         self.chunk_translator = ChunkTranslator(self)
+        self.windows = ChunkWindows(self)
         self.merger = ChunkMerger()
 
     def translate_text(
@@ -55,27 +68,7 @@ class TranslationService:
 
         print(f"\nTranslating {len(chunks)} chunks...")
 
-        for idx, chunk_data in enumerate(chunks, 1):
-            percent = (idx / len(chunks)) * 100
-            print(
-                f"Progress: [{idx}/{len(chunks)}] "
-                f"{percent:.1f}% complete",
-                end="\r",
-                flush=True
-            )
-            
-            translated_chunk = (
-                self.chunk_translator.translate_chunk(
-                    chunk_data,
-                    language_pair
-                )
-            )
-            translation.add_chunk(translated_chunk)
-
-            self.glossary.update_from_chunk(
-                chunk_data["text"],
-                translated_chunk.translated_text
-            )
+        self.windows.translate(chunks, translation, language_pair)
 
         print("\n\nMerging chunks...")
         merged = self.merger.merge_chunks(
@@ -0,0 +1 @@
+"""Benchmarks - Standalone performance scripts for translation."""
@@ -0,0 +1,41 @@
+"""
+Legacy chunker.
+The find()-based reference for the chunker benchmark.
+"""
+import re
+
+from modules.translator.domain.chunker import SemanticChunker
+
+
+def legacy_chunks(chunker: SemanticChunker, text: str):
+    """The old chunker: text.find per chunk, contexts re-joined."""
+    paragraphs = [
+        p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()
+    ]
+    splitter = chunker.splitter
+    current_pos = 0
+    for para_idx, paragraph in enumerate(paragraphs):
+        sentences = [
+            s.strip() for s in splitter.SENTENCE_END.split(paragraph)
+            if s.strip()
+        ]
+        for group in chunker.splitter.group_sentences(
+            sentences, chunker.max_tokens
+        ):
+            start = text.find(group[0], current_pos)
+            if start == -1:
+                start = current_pos
+            end = text.find(group[-1], start)
+            end = start if end == -1 else end + len(group[-1])
+            yield {
+                "text": text[start:end],
+                "start": start,
+                "end": end,
+                "context_before": chunker.context.get_context_before(
+                    paragraphs, para_idx
+                ),
+                "context_after": chunker.context.get_context_after(
+                    paragraphs, para_idx
+                ),
+            }
+            current_pos = end
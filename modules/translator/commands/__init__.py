@@ -0,0 +1,6 @@
+"""
+Command module exports.
+"""
+from .translate_cmd import translate
+
+__all__ = ['translate']
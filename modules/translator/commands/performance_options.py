@@ -0,0 +1,47 @@
+"""
+Batching and translation memory CLI support.
+Shared flags, memory setup and the closing report.
+"""
+from typing import Optional
+
+import click
+
+from ..infrastructure.sqlite_memory import (
+    DEFAULT_TM_PATH,
+    SqliteTranslationMemory
+)
+
+
+def performance_options(command):
+    """Add --max-batch-tokens, --tm-path, --no-tm."""
+    command = click.option(
+        '--no-tm',
+        is_flag=True,
+        help='Always run the model; skip translation memory'
+    )(command)
+    command = click.option(
+        '--tm-path',
+        default=DEFAULT_TM_PATH,
+        help='Translation memory database'
+    )(command)
+    return click.option(
+        '--max-batch-tokens',
+        default=4096,
+        type=int,
+        help='Padded source tokens per generate call'
+    )(command)
+
+
+def open_memory(
+    tm_path: str,
+    no_tm: bool
+) -> Optional[SqliteTranslationMemory]:
+    """Translation memory unless --no-tm."""
+    return None if no_tm else SqliteTranslationMemory(tm_path)
+
+
+def echo_performance(translator, memory) -> None:
+    """Padding waste and memory hit rate."""
+    click.echo(translator.padding.summary())
+    if memory:
+        click.echo(memory.stats.summary())
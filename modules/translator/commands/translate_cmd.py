@@ -0,0 +1,75 @@
+"""
+Translate command.
+Translate a text file and cache the result.
+"""
+import click
+
+from ..application.translation_service import (
+    TranslationService
+)
+from ..infrastructure.disk_cache import DiskCacheRepository
+from ..infrastructure.m2m100_adapter import M2M100Adapter
+from .performance_options import (
+    echo_performance,
+    open_memory,
+    performance_options
+)
+
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.argument('output_file', type=click.Path())
+@click.option(
+    '--source',
+    '-s',
+    help='Source language (auto-detect if omitted)'
+)
+@click.option('--target', '-t', required=True)
+@click.option('--use-gpu/--no-gpu', default=True)
+@performance_options
+def translate(
+    input_file,
+    output_file,
+    source,
+    target,
+    use_gpu,
+    max_batch_tokens,
+    tm_path,
+    no_tm
+):
+    """Translate text file."""
+    click.echo(f"\nLoading text from {input_file}...")
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    words = len(text.split())
+    click.echo(f"Text loaded: {words:,} words")
+
+    device = "GPU" if use_gpu else "CPU"
+    click.echo(f"Using device: {device}")
+
+    translator = M2M100Adapter(
+        use_gpu=use_gpu,
+        model_size="418M",
+        max_batch_tokens=max_batch_tokens
+    )
+    memory = open_memory(tm_path, no_tm)
+    service = TranslationService(translator, memory=memory)
+    cache = DiskCacheRepository()
+
+    translation = service.translate_text(
+        text,
+        target_language=target,
+        source_language=source
+    )
+
+    cache.save(translation)
+    click.echo(f"\nCached: {translation.translation_id}")
+    click.echo(f"Glossary terms: {len(translation.glossary)}")
+    echo_performance(translator, memory)
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(translation.final_translation)
+
+    click.echo(f"Saved to {output_file}\n")
@@ -0,0 +1,76 @@
+"""
+Length-bucketed batch planning.
+Groups inputs of similar length under a token budget.
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class PaddingStats:
+    """Real vs padded token positions across batches."""
+    batches: int = 0
+    tokens: int = 0
+    padded_tokens: int = 0
+
+    def record(self, lengths: list[int]):
+        """Count one batch padded to its longest input."""
+        self.batches += 1
+        self.tokens += sum(lengths)
+        self.padded_tokens += len(lengths) * max(lengths, default=0)
+
+    @property
+    def waste(self) -> float:
+        """Fraction of padded positions that are padding."""
+        if not self.padded_tokens:
+            return 0.0
+        return 1 - self.tokens / self.padded_tokens
+
+    def summary(self) -> str:
+        """One-line report for the CLI."""
+        return (
+            f"Batches: {self.batches}, tokens: {self.tokens}, "
+            f"padding waste: {self.waste:.1%}"
+        )
+
+
+class LengthBucketPlanner:
+    """Plan padded batches for sequence generation."""
+
+    def __init__(
+        self,
+        max_tokens: int = 4096,
+        max_batch_size: int = 64
+    ):
+        self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
+
+    def plan(self, lengths: list[int]) -> list[list[int]]:
+        """
+        Split input indices into batches.
+
+        Inputs are taken shortest first, so a batch pads
+        to its last member; a batch closes when one more
+        input would push count x longest over the budget.
+        An input longer than the budget runs alone.
+        """
+        order = sorted(
+            range(len(lengths)),
+            key=lambda i: lengths[i]
+        )
+        batches: list[list[int]] = []
+        current: list[int] = []
+
+        for index in order:
+            padded = (len(current) + 1) * lengths[index]
+            full = (
+                padded > self.max_tokens
+                or len(current) >= self.max_batch_size
+            )
+            if current and full:
+                batches.append(current)
+                current = []
+            current.append(index)
+
+        if current:
+            batches.append(current)
+        return batches
@@ -0,0 +1,35 @@
+"""
+Bucketed batch execution.
+Runs planned batches and restores input order.
+"""
+from typing import Callable
+
+from .batch_planner import LengthBucketPlanner, PaddingStats
+
+BatchFn = Callable[[list[int]], list[str]]
+
+
+class BucketedBatches:
+    """Planner plus padding stats for one translator."""
+
+    def __init__(self, max_tokens: int = 4096):
+        self.planner = LengthBucketPlanner(max_tokens)
+        self.padding = PaddingStats()
+
+    def run(
+        self,
+        lengths: list[int],
+        translate: BatchFn
+    ) -> list[str]:
+        """
+        Translate every input, one planned batch at a time.
+
+        translate gets the input indices of a batch and
+        returns its outputs in the same order.
+        """
+        results = [""] * len(lengths)
+        for batch in self.planner.plan(lengths):
+            self.padding.record([lengths[i] for i in batch])
+            for index, output in zip(batch, translate(batch)):
+                results[index] = output
+        return results
@@ -5,9 +5,11 @@ Splits text intelligently preserving context.
 import re
 from typing import Iterator
 
-from .splitter import SentenceSplitter
+from .splitter import SentenceSplitter, Span
 from .context import ContextExtractor
 
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
 
 class SemanticChunker:
     """Split text maintaining narrative coherence."""
@@ -23,59 +25,54 @@ class SemanticChunker:
 
     def chunk_text(self, text: str) -> Iterator[dict]:
         """Split text into contextual chunks."""
-        paragraphs = self._split_paragraphs(text)
-        current_pos = 0
+        spans = self._paragraph_spans(text)
+        paragraphs = [text[start:end] for start, end in spans]
 
         for para_idx, paragraph in enumerate(paragraphs):
-            sentences = self.splitter.split_sentences(
-                paragraph
+            offset = spans[para_idx][0]
+            # Shared by every chunk of the paragraph
+            before = self.context.get_context_before(
+                paragraphs, para_idx
             )
-
-            for chunk_sentences in self.splitter.group_sentences(
-                sentences,
-                self.max_tokens
-            ):
-                first_sentence_start = text.find(
-                    chunk_sentences[0],
-                    current_pos
-                )
-                
-                if first_sentence_start == -1:
-                    first_sentence_start = current_pos
-                
-                last_sentence = chunk_sentences[-1]
-                last_sentence_end = text.find(
-                    last_sentence,
-                    first_sentence_start
-                )
-                
-                if last_sentence_end == -1:
-                    last_sentence_end = first_sentence_start
-                else:
-                    last_sentence_end += len(last_sentence)
-                
-                start = first_sentence_start
-                end = last_sentence_end
-                chunk_text = text[start:end]
-
+            after = self.context.get_context_after(
+                paragraphs, para_idx
+            )
+            for start, end in self._chunk_spans(paragraph):
                 yield {
-                    "text": chunk_text,
-                    "start": start,
-                    "end": end,
-                    "context_before": self.context.get_context_before(
-                        paragraphs, para_idx
-                    ),
-                    "context_after": self.context.get_context_after(
-                        paragraphs, para_idx
-                    ),
+                    "text": paragraph[start:end],
+                    "start": offset + start,
+                    "end": offset + end,
+                    "context_before": before,
+                    "context_after": after,
                 }
 
-                current_pos = end
+    def _chunk_spans(self, paragraph: str) -> Iterator[Span]:
+        """Offsets of each sentence group in the paragraph."""
+        # Sentence estimates sum to at most the paragraph's
+        if self.splitter.estimate_tokens(paragraph) <= self.max_tokens:
+            yield 0, len(paragraph)
+            return
+
+        spans = self.splitter.sentence_spans(paragraph)
+        first = 0
+        for group in self.splitter.group_sentences(
+            [paragraph[start:end] for start, end in spans],
+            self.max_tokens
+        ):
+            last = first + len(group) - 1
+            yield spans[first][0], spans[last][1]
+            first = last + 1
 
-    def _split_paragraphs(self, text: str) -> list[str]:
-        """Split by double newline or clear breaks."""
-        return [
-            p.strip()
-            for p in re.split(r'\n\s*\n', text)
-            if p.strip()
-        ]
+    def _paragraph_spans(self, text: str) -> list[Span]:
+        """Stripped paragraphs split by double newline."""
+        spans = []
+        start = 0
+        breaks = [m.span() for m in PARAGRAPH_BREAK.finditer(text)]
+        for end, next_start in breaks + [(len(text), len(text))]:
+            part = text[start:end]
+            body = part.strip()
+            if body:
+                lead = start + len(part) - len(part.lstrip())
+                spans.append((lead, lead + len(body)))
+            start = next_start
+        return spans
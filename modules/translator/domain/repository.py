@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from uuid import UUID
 
+from ..domain.models import TranslationChunk
 from ..domain.translation import Translation
 
 
@@ -24,6 +25,15 @@ class ITranslationRepository(ABC):
         """Retrieve by ID."""
         pass
 
+    @abstractmethod
+    def get_chunk(
+        self,
+        translation_id: UUID,
+        index: int
+    ) -> Optional[TranslationChunk]:
+        """Retrieve one chunk by position."""
+        pass
+
     @abstractmethod
     def delete(self, translation_id: UUID) -> None:
         """Remove translation."""
@@ -5,6 +5,8 @@ Continuation of SemanticChunker.
 import re
 from typing import Iterator
 
+Span = tuple[int, int]
+
 
 class SentenceSplitter:
     """Handle sentence-level operations."""
@@ -19,6 +21,21 @@ class SentenceSplitter:
         sentences = self.SENTENCE_END.split(paragraph)
         return [s.strip() for s in sentences if s.strip()]
 
+    def sentence_spans(self, paragraph: str) -> list[Span]:
+        """
+        Offsets of split_sentences() in a stripped paragraph.
+
+        Matches take all whitespace between sentences, so
+        the pieces need no further stripping.
+        """
+        spans = []
+        start = 0
+        for match in self.SENTENCE_END.finditer(paragraph):
+            spans.append((start, match.start()))
+            start = match.end()
+        spans.append((start, len(paragraph)))
+        return spans
+
     def estimate_tokens(self, text: str) -> int:
         """Rough token count (words * 1.3)."""
         words = len(text.split())
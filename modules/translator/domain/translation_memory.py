@@ -0,0 +1,63 @@
+"""
+Translation memory interface.
+Segment-level reuse of model output by source content.
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from .value_objects import LanguagePair
+
+
+@dataclass
+class MemoryStats:
+    """Lookup counters for one run."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from memory."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """One-line report for the CLI."""
+        return (
+            f"Translation memory: {self.hits} hits, "
+            f"{self.misses} misses ({self.hit_rate:.0%}), "
+            f"{self.evictions} evicted"
+        )
+
+
+class ITranslationMemory(ABC):
+    """
+    Raw translations keyed by normalized source text and
+    context, language pair and model signature.
+    """
+
+    stats: MemoryStats
+
+    @abstractmethod
+    def lookup(
+        self,
+        texts: list[str],
+        language_pair: LanguagePair,
+        model: str,
+        contexts: Optional[list[Optional[str]]] = None
+    ) -> list[Optional[str]]:
+        """Stored translation per text, None on a miss."""
+        pass
+
+    @abstractmethod
+    def store(
+        self,
+        texts: list[str],
+        translations: list[str],
+        language_pair: LanguagePair,
+        model: str,
+        contexts: Optional[list[Optional[str]]] = None
+    ) -> None:
+        """Remember model output for texts."""
+        pass
@@ -25,9 +25,10 @@ class ITranslator(ABC):
     def translate_batch(
         self,
         texts: list[str],
-        language_pair: LanguagePair
+        language_pair: LanguagePair,
+        contexts: Optional[list[Optional[str]]] = None
     ) -> list[str]:
-        """Translate multiple texts efficiently."""
+        """Translate multiple texts, each with optional context."""
         pass
 
     @abstractmethod
@@ -37,3 +38,10 @@ class ITranslator(ABC):
     ) -> bool:
         """Check if model for pair is loaded."""
         pass
+
+    def model_signature(
+        self,
+        language_pair: LanguagePair
+    ) -> str:
+        """Model and generation settings, for memory keys."""
+        return type(self).__name__
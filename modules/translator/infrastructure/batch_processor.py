@@ -2,43 +2,62 @@
 Batch processing and model management.
 Extension methods for MarianTranslatorAdapter.
 """
-import torch
+from typing import Optional
 
+from ..domain.bucketed_batches import BucketedBatches
 from ..domain.value_objects import LanguagePair
-from .model_manager import ModelManager
+from .marian_generation import MarianGeneration
 from .translation_utils import TranslationUtils
 
 
 class BatchProcessor:
     """Handle batch translation operations."""
 
-    def __init__(self, adapter):
+    def __init__(self, adapter, max_tokens: int = 4096):
         self.adapter = adapter
         self.utils = TranslationUtils()
+        self.batches = BucketedBatches(max_tokens)
+        self.padding = self.batches.padding
 
     def translate_batch(
         self,
         texts: list[str],
-        language_pair: LanguagePair
+        language_pair: LanguagePair,
+        contexts: Optional[list[Optional[str]]] = None
     ) -> list[str]:
-        """Translate multiple texts in batches."""
+        """
+        Translate texts in length-bucketed batches.
+
+        Each text is joined to its context as translate()
+        does; inputs are packed shortest first under the
+        token budget and come back in input order.
+        """
+        if not texts:
+            return []
+
         model_key = self.utils.get_model_key(language_pair)
         self.adapter._ensure_model_loaded(
             model_key,
             language_pair
         )
 
-        batches = self.utils.batch_texts(texts)
-        translations = []
+        prefixed = self.utils.model_inputs(
+            texts,
+            contexts or [None] * len(texts),
+            language_pair
+        )
+        lengths = MarianGeneration.token_lengths(
+            self.adapter.tokenizers[model_key],
+            prefixed
+        )
 
-        for batch in batches:
-            batch_result = self._translate_batch_internal(
-                batch,
+        return self.batches.run(
+            lengths,
+            lambda batch: self._translate_batch_internal(
+                [prefixed[i] for i in batch],
                 model_key
             )
-            translations.extend(batch_result)
-
-        return translations
+        )
 
     def _translate_batch_internal(
         self,
@@ -46,26 +65,9 @@ class BatchProcessor:
         model_key: str
     ) -> list[str]:
         """Process single batch."""
-        tokenizer = self.adapter.tokenizers[model_key]
-        model = self.adapter.models[model_key]
-
-        inputs = tokenizer(
-            texts,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=512
-        ).to(self.adapter.device)
-
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs,
-                max_length=512,
-                num_beams=5,
-                early_stopping=True
-            )
-
-        return [
-            tokenizer.decode(out, skip_special_tokens=True)
-            for out in outputs
-        ]
+        return MarianGeneration.generate(
+            self.adapter.tokenizers[model_key],
+            self.adapter.models[model_key],
+            self.adapter.device,
+            texts
+        )
@@ -0,0 +1,30 @@
+"""
+Block decoding for translation packs.
+Rebuild chunks from their block records.
+"""
+from uuid import UUID
+
+from ..domain.models import TranslationChunk
+
+
+class BlockDecoder:
+    """Inverse of BlockEncoder.encode for one chunk."""
+
+    @staticmethod
+    def decode(block: dict, record: dict) -> TranslationChunk:
+        """Rebuild a chunk from its block."""
+        original = record.get("original_text")
+        if original is None:
+            local = record["start"] - block["span_start"]
+            original = block["span"][
+                local:local + record["end"] - record["start"]
+            ]
+        return TranslationChunk(
+            chunk_id=UUID(record["chunk_id"]),
+            original_text=original,
+            translated_text=record["translated_text"],
+            start_position=record["start"],
+            end_position=record["end"],
+            context_before=block["contexts"][record["context_before"]],
+            context_after=block["contexts"][record["context_after"]],
+        )
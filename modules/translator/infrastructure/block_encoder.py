@@ -0,0 +1,62 @@
+"""
+Block encoding for translation packs.
+Chunks stored as offsets into spans of the source.
+"""
+FORMAT_VERSION = 1
+BLOCK_SIZE = 64
+
+
+class BlockEncoder:
+    """
+    Block k holds the source from its first chunk's start
+    up to the next block's, so the blocks concatenate
+    back to the original text and each chunk is stored
+    as offsets into its block. Contexts (whole
+    neighbouring paragraphs) are kept once per block and
+    referenced by index. Reading one chunk reads one block.
+    """
+
+    @staticmethod
+    def bounds(chunks: list, source_length: int) -> list:
+        """Source offsets where each block starts, plus the end."""
+        starts = [
+            chunks[i].start_position
+            for i in range(0, len(chunks), BLOCK_SIZE)
+        ]
+        bounds = [0] + [
+            min(max(s, 0), source_length) for s in starts[1:]
+        ] + [source_length]
+        for i in range(1, len(bounds)):
+            bounds[i] = max(bounds[i], bounds[i - 1])
+        return bounds
+
+    @staticmethod
+    def encode(chunks: list, span: str, span_start: int) -> dict:
+        """Chunk records with contexts stored once."""
+        contexts: dict[str, int] = {}
+
+        def ref(text: str) -> int:
+            return contexts.setdefault(text, len(contexts))
+
+        records = []
+        for chunk in chunks:
+            record = {
+                "chunk_id": str(chunk.chunk_id),
+                "start": chunk.start_position,
+                "end": chunk.end_position,
+                "translated_text": chunk.translated_text,
+                "context_before": ref(chunk.context_before),
+                "context_after": ref(chunk.context_after),
+            }
+            start = chunk.start_position - span_start
+            end = chunk.end_position - span_start
+            if start < 0 or span[start:end] != chunk.original_text:
+                record["original_text"] = chunk.original_text
+            records.append(record)
+
+        return {
+            "span": span,
+            "span_start": span_start,
+            "contexts": list(contexts),
+            "chunks": records,
+        }
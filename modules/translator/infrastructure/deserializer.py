@@ -37,7 +37,7 @@ class CacheDeserializer:
             translation.chunks.append(chunk)
 
         for key, gloss_data in data["glossary"].items():
-            entry = CacheDeserializer._deserialize_glossary(
+            entry = CacheDeserializer.deserialize_glossary(
                 gloss_data
             )
             translation.glossary[key] = entry
@@ -66,7 +66,7 @@ class CacheDeserializer:
         )
 
     @staticmethod
-    def _deserialize_glossary(data: dict) -> GlossaryEntry:
+    def deserialize_glossary(data: dict) -> GlossaryEntry:
         """Rebuild glossary entry."""
         return GlossaryEntry(
             source_term=data["source_term"],
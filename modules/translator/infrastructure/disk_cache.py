@@ -1,34 +1,39 @@
 """
 Disk-based translation cache.
-Stores translations as JSON files.
+Stores translations as compact sharded packs.
 """
-import json
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
+from ..domain.models import TranslationChunk
 from ..domain.repository import ITranslationRepository
 from ..domain.translation import Translation
-from .serializer import CacheSerializer
-from .deserializer import CacheDeserializer
+from .legacy_cache import LegacyJsonCache
+from .pack_reader import PackReader
+from .pack_writer import PackWriter
 
 
 class DiskCacheRepository(ITranslationRepository):
-    """File system translation storage."""
+    """
+    File system translation storage.
+
+    New entries are pack zips under a two-level
+    fan-out; JSON files from older versions still load.
+    """
 
     def __init__(self, cache_dir: str = ".cache/translations"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.serializer = CacheSerializer()
-        self.deserializer = CacheDeserializer()
+        self.legacy = LegacyJsonCache(self.cache_dir)
 
     def save(self, translation: Translation) -> None:
-        """Save to disk as JSON."""
-        file_path = self._get_path(translation.translation_id)
-        data = self.serializer.serialize(translation)
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Save to disk as a compressed pack."""
+        PackWriter.write(
+            self._get_path(translation.translation_id),
+            translation
+        )
+        self.legacy.delete(translation.translation_id)
 
     def get_by_id(
         self,
@@ -36,25 +41,34 @@ class DiskCacheRepository(ITranslationRepository):
     ) -> Optional[Translation]:
         """Load from disk."""
         file_path = self._get_path(translation_id)
+        if file_path.exists():
+            return PackReader.read(file_path)
+        return self.legacy.load(translation_id)
 
-        if not file_path.exists():
-            return None
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        return self.deserializer.deserialize(data)
+    def get_chunk(
+        self,
+        translation_id: UUID,
+        index: int
+    ) -> Optional[TranslationChunk]:
+        """Load one chunk without the whole aggregate."""
+        file_path = self._get_path(translation_id)
+        if file_path.exists():
+            return PackReader.read_chunk(file_path, index)
+        return self.legacy.load_chunk(translation_id, index)
 
     def delete(self, translation_id: UUID) -> None:
         """Remove file."""
-        file_path = self._get_path(translation_id)
-        if file_path.exists():
-            file_path.unlink()
+        self._get_path(translation_id).unlink(missing_ok=True)
+        self.legacy.delete(translation_id)
 
     def exists(self, translation_id: UUID) -> bool:
         """Check file exists."""
-        return self._get_path(translation_id).exists()
+        return (
+            self._get_path(translation_id).exists()
+            or self.legacy.path(translation_id).exists()
+        )
 
     def _get_path(self, translation_id: UUID) -> Path:
-        """Get file path for ID."""
-        return self.cache_dir / f"{translation_id}.json"
+        """Two-level fan-out keeps directories small."""
+        name = str(translation_id)
+        return self.cache_dir / name[:2] / f"{name}.zip"
@@ -0,0 +1,52 @@
+"""
+Legacy JSON translation cache.
+Flat files written before packs existed.
+"""
+import json
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from ..domain.models import TranslationChunk
+from ..domain.translation import Translation
+from .deserializer import CacheDeserializer
+
+
+class LegacyJsonCache:
+    """Read and remove <cache_dir>/<id>.json entries."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.deserializer = CacheDeserializer()
+
+    def path(self, translation_id: UUID) -> Path:
+        """Flat JSON path used by older versions."""
+        return self.cache_dir / f"{translation_id}.json"
+
+    def load(self, translation_id: UUID) -> Optional[Translation]:
+        """The stored aggregate, or None."""
+        legacy_path = self.path(translation_id)
+        if not legacy_path.exists():
+            return None
+
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        return self.deserializer.deserialize(data)
+
+    def load_chunk(
+        self,
+        translation_id: UUID,
+        index: int
+    ) -> Optional[TranslationChunk]:
+        """One chunk, parsed from the whole file."""
+        translation = self.load(translation_id)
+        if translation is None:
+            return None
+        if not 0 <= index < len(translation.chunks):
+            return None
+        return translation.chunks[index]
+
+    def delete(self, translation_id: UUID) -> None:
+        """Remove the file if present."""
+        self.path(translation_id).unlink(missing_ok=True)
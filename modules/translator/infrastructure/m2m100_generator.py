@@ -0,0 +1,77 @@
+"""
+M2M-100 padded beam search.
+Tokenizes, generates and decodes one batch.
+"""
+import torch
+
+from ..domain.value_objects import LanguagePair
+from .m2m100_lengths import M2M100Lengths
+from .m2m100_settings import GENERATION, LENGTHS, M2M100Settings
+
+
+class M2M100Generator:
+    """Batch generation over a loaded M2M-100 model."""
+
+    def __init__(self, tokenizer, model, device: torch.device):
+        self.tokenizer = tokenizer
+        self.model = model
+        self.device = device
+
+    def token_lengths(
+        self,
+        texts: list[str],
+        language_pair: LanguagePair
+    ) -> list[int]:
+        """Source token count of each text."""
+        self.tokenizer.src_lang = M2M100Settings.lang_code(
+            language_pair.source
+        )
+        return [
+            len(ids) for ids in self.tokenizer(
+                texts,
+                truncation=True,
+                max_length=LENGTHS["max_input"]
+            ).input_ids
+        ]
+
+    def generate(
+        self,
+        texts: list[str],
+        language_pair: LanguagePair
+    ) -> list[str]:
+        """One padded beam search over all texts."""
+        self.tokenizer.src_lang = M2M100Settings.lang_code(
+            language_pair.source
+        )
+        target_lang = M2M100Settings.lang_code(
+            language_pair.target
+        )
+
+        encoded = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=LENGTHS["max_input"]
+        ).to(self.device)
+
+        generated = self.model.generate(
+            **encoded,
+            forced_bos_token_id=self.tokenizer.get_lang_id(
+                target_lang
+            ),
+            **M2M100Lengths.controls(
+                encoded,
+                self.tokenizer.eos_token_id,
+                GENERATION["num_beams"]
+            ),
+            **GENERATION
+        )
+
+        return [
+            translation.strip()
+            for translation in self.tokenizer.batch_decode(
+                generated,
+                skip_special_tokens=True
+            )
+        ]
@@ -0,0 +1,40 @@
+"""
+M2M-100 output length bounds.
+Batch-wide max length, per-row minimum.
+"""
+from transformers import LogitsProcessorList
+
+from .m2m100_settings import LENGTHS
+from .row_min_length import RowMinLength
+
+
+class M2M100Lengths:
+    """Length arguments for one padded generate() call."""
+
+    @staticmethod
+    def controls(
+        encoded,
+        eos_token_id: int,
+        num_beams: int
+    ) -> dict:
+        """
+        max_length and a per-row minimum length processor.
+
+        Longest input caps the batch; each row keeps the
+        floor it would get if translated alone.
+        """
+        input_length = encoded.input_ids.shape[1]
+        max_length = min(
+            int(input_length * LENGTHS["max_ratio"]),
+            LENGTHS["max_input"]
+        )
+        floors = [
+            max(LENGTHS["min_floor"], int(n * LENGTHS["min_ratio"]))
+            for n in encoded.attention_mask.sum(dim=1).tolist()
+        ]
+        return {
+            "max_length": max_length,
+            "logits_processor": LogitsProcessorList([
+                RowMinLength(floors, eos_token_id, num_beams)
+            ]),
+        }
@@ -0,0 +1,37 @@
+"""
+M2M-100 model loading.
+Downloads and places the tokenizer and model.
+"""
+import torch
+from transformers import M2M100ForConditionalGeneration
+from transformers import M2M100Tokenizer
+
+from .m2m100_generator import M2M100Generator
+
+
+class M2M100Loader:
+    """Load M2M-100 with progress output."""
+
+    @staticmethod
+    def load(
+        model_name: str,
+        device: torch.device
+    ) -> M2M100Generator:
+        """Tokenizer and model on device, ready to generate."""
+        print(f"\n[1/3] Loading {model_name}...")
+        print("      (First time: downloading ~2GB model)")
+        print("      This may take 5-10 minutes...\n")
+        
+        print("[2/3] Loading tokenizer...", end="", flush=True)
+        tokenizer = M2M100Tokenizer.from_pretrained(
+            model_name
+        )
+        print(" OK")
+        
+        print("[3/3] Loading model to device...", end="", flush=True)
+        model = M2M100ForConditionalGeneration\
+            .from_pretrained(model_name).to(device)
+        print(" OK")
+        
+        print(f"\n[OK] Model ready on {device}\n")
+        return M2M100Generator(tokenizer, model, device)
@@ -0,0 +1,54 @@
+"""
+M2M-100 language codes and generation settings.
+Everything that changes the model's output.
+"""
+import json
+
+LANG_CODE_MAP = {
+    "es": "es",
+    "pt": "pt",
+    "en": "en",
+    "fr": "fr",
+    "de": "de",
+}
+
+GENERATION = {
+    "num_beams": 5,
+    "no_repeat_ngram_size": 3,
+    "repetition_penalty": 1.2,
+    "early_stopping": True,
+}
+
+# Output length bounds, relative to input tokens
+LENGTHS = {
+    "max_input": 1024,
+    "max_ratio": 2.0,
+    "min_floor": 10,
+    "min_ratio": 0.5,
+}
+
+
+class M2M100Settings:
+    """Lookups over the settings above."""
+
+    @staticmethod
+    def lang_code(lang: str) -> str:
+        """Map language code to M2M-100 format."""
+        if lang not in LANG_CODE_MAP:
+            raise ValueError(f"Unsupported language: {lang}")
+        return LANG_CODE_MAP[lang]
+
+    @staticmethod
+    def signature(model_name: str, max_tokens: int) -> str:
+        """
+        Model name and effective generation settings.
+
+        The token budget is included because max_length
+        follows the longest input in each batch.
+        """
+        return json.dumps([
+            model_name,
+            GENERATION,
+            LENGTHS,
+            max_tokens,
+        ], sort_keys=True)
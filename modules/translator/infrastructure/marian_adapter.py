@@ -3,7 +3,7 @@ MarianMT translator adapter.
 Implements ITranslator using Helsinki-NLP models.
 """
 from typing import Optional
-import torch
+import json
 from transformers import MarianMTModel, MarianTokenizer
 
 from ..domain.translator import ITranslator
@@ -11,19 +11,24 @@ from ..domain.value_objects import LanguagePair
 from .model_manager import ModelManager
 from .translation_utils import TranslationUtils
 from .batch_processor import BatchProcessor
+from .marian_generation import GENERATION, LENGTHS, MarianGeneration
 from .adapter_extensions import AdapterExtensions
-from .language_prefix import LanguagePrefixHandler
 
 
 class MarianTranslatorAdapter(ITranslator):
     """MarianMT implementation with quality focus."""
 
-    def __init__(self, use_gpu: bool = True):
+    def __init__(
+        self,
+        use_gpu: bool = True,
+        max_batch_tokens: int = 4096
+    ):
         self.device = ModelManager.setup_device(use_gpu)
         self.models: dict[str, MarianMTModel] = {}
         self.tokenizers: dict[str, MarianTokenizer] = {}
         self.utils = TranslationUtils()
-        self.batch_proc = BatchProcessor(self)
+        self.batch_proc = BatchProcessor(self, max_batch_tokens)
+        self.padding = self.batch_proc.padding
 
     def translate(
         self,
@@ -35,52 +40,38 @@ class MarianTranslatorAdapter(ITranslator):
         model_key = self.utils.get_model_key(language_pair)
         self._ensure_model_loaded(model_key, language_pair)
 
-        input_text = self.utils.prepare_input(text, context)
-        tokenizer = self.tokenizers[model_key]
-        model = self.models[model_key]
-
-        model_name = ModelManager.get_model_name(language_pair)
-        prefixed_text = LanguagePrefixHandler.add_prefix(
-            input_text,
-            language_pair,
-            model_name
-        )
-
-        inputs = tokenizer(
-            prefixed_text,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=512
-        ).to(self.device)
-
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs,
-                max_length=512,
-                num_beams=5,
-                no_repeat_ngram_size=3,
-                repetition_penalty=1.2,
-                early_stopping=True
-            )
-
-        translation = tokenizer.decode(
-            outputs[0],
-            skip_special_tokens=True
-        )
-        return translation.strip()
+        return MarianGeneration.generate(
+            self.tokenizers[model_key],
+            self.models[model_key],
+            self.device,
+            self.utils.model_inputs([text], [context], language_pair)
+        )[0]
 
     def translate_batch(
         self,
         texts: list[str],
-        language_pair: LanguagePair
+        language_pair: LanguagePair,
+        contexts: Optional[list[Optional[str]]] = None
     ) -> list[str]:
         """Delegate to batch processor."""
         return self.batch_proc.translate_batch(
             texts,
-            language_pair
+            language_pair,
+            contexts
         )
 
+    def model_signature(
+        self,
+        language_pair: LanguagePair
+    ) -> str:
+        """Marian model and effective generation settings."""
+        return json.dumps([
+            ModelManager.get_model_name(language_pair),
+            GENERATION,
+            LENGTHS,
+            self.batch_proc.batches.planner.max_tokens,
+        ], sort_keys=True)
+
     def is_model_loaded(
         self,
         language_pair: LanguagePair
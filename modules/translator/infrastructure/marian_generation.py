@@ -0,0 +1,75 @@
+"""
+MarianMT beam search.
+Shared by single and batched translation.
+"""
+import torch
+from transformers import LogitsProcessorList
+
+from .row_max_length import RowMaxLength
+
+MAX_LENGTH = 512
+
+# Beam search settings for every Marian call
+GENERATION = {
+    "num_beams": 5,
+    "no_repeat_ngram_size": 3,
+    "repetition_penalty": 1.2,
+    "early_stopping": True,
+}
+
+# Output cap per row, relative to its input tokens
+LENGTHS = {
+    "max_ratio": 2,
+    "min_cap": 16,
+}
+
+
+class MarianGeneration:
+    """Tokenize, generate and decode one padded batch."""
+
+    @staticmethod
+    def token_lengths(tokenizer, texts: list[str]) -> list[int]:
+        """Input token count of each text."""
+        return [
+            len(ids) for ids in tokenizer(
+                texts,
+                truncation=True,
+                max_length=MAX_LENGTH
+            ).input_ids
+        ]
+
+    @staticmethod
+    def generate(
+        tokenizer,
+        model,
+        device: torch.device,
+        texts: list[str]
+    ) -> list[str]:
+        """Translations in order; each row capped by its own input."""
+        inputs = tokenizer(
+            texts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=MAX_LENGTH
+        ).to(device)
+        caps = [
+            min(max(LENGTHS["max_ratio"] * n, LENGTHS["min_cap"]),
+                MAX_LENGTH)
+            for n in inputs.attention_mask.sum(dim=1).tolist()
+        ]
+
+        with torch.no_grad():
+            outputs = model.generate(
+                **inputs,
+                max_length=max(caps),
+                logits_processor=LogitsProcessorList([RowMaxLength(
+                    caps, tokenizer.eos_token_id, GENERATION["num_beams"]
+                )]),
+                **GENERATION
+            )
+
+        return [
+            tokenizer.decode(out, skip_special_tokens=True).strip()
+            for out in outputs
+        ]
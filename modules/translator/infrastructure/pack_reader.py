@@ -0,0 +1,75 @@
+"""
+Translation pack reader.
+Loads a whole pack, or one chunk from its block.
+"""
+import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from ..domain.models import TranslationChunk
+from ..domain.translation import Translation
+from ..domain.value_objects import LanguagePair
+from .block_decoder import BlockDecoder
+from .deserializer import CacheDeserializer
+
+
+class PackReader:
+    """Read packs written by PackWriter."""
+
+    @staticmethod
+    def read(path: Path) -> Translation:
+        """Load the whole aggregate."""
+        with zipfile.ZipFile(path) as pack:
+            meta = json.loads(pack.read("meta.json"))
+            blocks = [
+                PackReader._read_block(pack, k)
+                for k in range(meta["blocks"])
+            ]
+            final = pack.read("final.txt").decode('utf-8')
+
+        translation = Translation(
+            original_text="".join(b["span"] for b in blocks),
+            language_pair=LanguagePair(
+                source=meta["language_pair"]["source"],
+                target=meta["language_pair"]["target"]
+            ),
+            translation_id=UUID(meta["translation_id"]),
+            created_at=datetime.fromisoformat(meta["created_at"])
+        )
+        for block in blocks:
+            translation.chunks.extend(
+                BlockDecoder.decode(block, record)
+                for record in block["chunks"]
+            )
+        for key, entry in meta["glossary"].items():
+            translation.glossary[key] = (
+                CacheDeserializer.deserialize_glossary(entry)
+            )
+        if meta["completed_at"]:
+            translation.completed_at = datetime.fromisoformat(
+                meta["completed_at"]
+            )
+            translation.final_translation = final
+        return translation
+
+    @staticmethod
+    def read_chunk(
+        path: Path,
+        index: int
+    ) -> Optional[TranslationChunk]:
+        """Load one chunk, reading only its block."""
+        with zipfile.ZipFile(path) as pack:
+            meta = json.loads(pack.read("meta.json"))
+            if not 0 <= index < meta["chunk_count"]:
+                return None
+            block_index, offset = divmod(index, meta["block_size"])
+            block = PackReader._read_block(pack, block_index)
+        return BlockDecoder.decode(block, block["chunks"][offset])
+
+    @staticmethod
+    def _read_block(pack: zipfile.ZipFile, index: int) -> dict:
+        """Parse one block member."""
+        return json.loads(pack.read(f"blocks/{index:05d}.json"))
@@ -0,0 +1,68 @@
+"""
+Translation pack writer.
+One compressed zip per translation, chunks in blocks.
+"""
+import json
+import os
+import zipfile
+from pathlib import Path
+
+from ..domain.translation import Translation
+from .block_encoder import BLOCK_SIZE, FORMAT_VERSION, BlockEncoder
+from .serializer import CacheSerializer
+
+
+class PackWriter:
+    """Zip members: meta.json, final.txt, blocks/NNNNN.json."""
+
+    @staticmethod
+    def write(path: Path, translation: Translation) -> None:
+        """Write the pack atomically."""
+        chunks = translation.chunks
+        source = translation.original_text
+        bounds = BlockEncoder.bounds(chunks, len(source))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        with zipfile.ZipFile(
+            temp, 'w', zipfile.ZIP_DEFLATED
+        ) as pack:
+            meta = PackWriter._meta(translation, len(bounds) - 1)
+            pack.writestr("meta.json", json.dumps(meta))
+            pack.writestr("final.txt", translation.final_translation)
+            for k in range(len(bounds) - 1):
+                start, end = bounds[k], bounds[k + 1]
+                block = BlockEncoder.encode(
+                    chunks[k * BLOCK_SIZE:(k + 1) * BLOCK_SIZE],
+                    source[start:end],
+                    start
+                )
+                pack.writestr(
+                    f"blocks/{k:05d}.json",
+                    json.dumps(block, ensure_ascii=False)
+                )
+        os.replace(temp, path)
+
+    @staticmethod
+    def _meta(translation: Translation, blocks: int) -> dict:
+        """Everything but the chunks and final text."""
+        return {
+            "format": FORMAT_VERSION,
+            "translation_id": str(translation.translation_id),
+            "language_pair": {
+                "source": translation.language_pair.source,
+                "target": translation.language_pair.target,
+            },
+            "created_at": translation.created_at.isoformat(),
+            "completed_at": (
+                translation.completed_at.isoformat()
+                if translation.completed_at else None
+            ),
+            "glossary": {
+                k: CacheSerializer.serialize_glossary(v)
+                for k, v in translation.glossary.items()
+            },
+            "chunk_count": len(translation.chunks),
+            "block_size": BLOCK_SIZE,
+            "blocks": blocks,
+        }
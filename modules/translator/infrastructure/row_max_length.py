@@ -0,0 +1,31 @@
+"""
+Per-row maximum output length for batched generation.
+Keeps each row's cap independent of its batch mates.
+"""
+import torch
+from transformers import LogitsProcessor
+
+
+class RowMaxLength(LogitsProcessor):
+    """Force EOS on each row once it reaches its own cap."""
+
+    def __init__(
+        self,
+        caps: list[int],
+        eos_token_id: int,
+        num_beams: int
+    ):
+        """caps: one maximum length per input row."""
+        self.caps = torch.tensor(caps).repeat_interleave(num_beams)
+        self.eos_token_id = eos_token_id
+
+    def __call__(
+        self,
+        input_ids: torch.LongTensor,
+        scores: torch.FloatTensor
+    ) -> torch.FloatTensor:
+        """Leave only EOS on rows at their cap."""
+        full = input_ids.shape[-1] >= self.caps.to(scores.device) - 1
+        scores[full] = -float("inf")
+        scores[full, self.eos_token_id] = 0
+        return scores
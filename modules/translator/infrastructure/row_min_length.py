@@ -0,0 +1,32 @@
+"""
+Per-row minimum output length for batched generation.
+Keeps each row's floor independent of its batch mates.
+"""
+import torch
+from transformers import LogitsProcessor
+
+
+class RowMinLength(LogitsProcessor):
+    """Block EOS on each row until it reaches its own floor."""
+
+    def __init__(
+        self,
+        floors: list[int],
+        eos_token_id: int,
+        num_beams: int
+    ):
+        """floors: one minimum length per input row."""
+        self.floors = torch.tensor(floors).repeat_interleave(
+            num_beams
+        )
+        self.eos_token_id = eos_token_id
+
+    def __call__(
+        self,
+        input_ids: torch.LongTensor,
+        scores: torch.FloatTensor
+    ) -> torch.FloatTensor:
+        """Mask EOS on rows still under their floor."""
+        short = input_ids.shape[-1] < self.floors.to(scores.device)
+        scores[short, self.eos_token_id] = -float("inf")
+        return scores
@@ -0,0 +1,43 @@
+"""
+Translation memory segment keys.
+Whitespace-insensitive hashes of text and context.
+"""
+import hashlib
+import json
+from typing import Optional
+
+from ..domain.value_objects import LanguagePair
+
+
+class SegmentKey:
+    """Key one segment by everything that shapes its output."""
+
+    @staticmethod
+    def key(
+        text: str,
+        language_pair: LanguagePair,
+        model: str,
+        context: Optional[str] = None
+    ) -> str:
+        """Hash normalized text and context with pair and model."""
+        payload = json.dumps([
+            " ".join(text.split()),
+            " ".join((context or "").split()),
+            language_pair.source,
+            language_pair.target,
+            model
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def keys(
+        texts: list[str],
+        language_pair: LanguagePair,
+        model: str,
+        contexts: Optional[list[Optional[str]]] = None
+    ) -> list[str]:
+        """One key per text, paired with its context."""
+        return [
+            SegmentKey.key(t, language_pair, model, c)
+            for t, c in zip(texts, contexts or [None] * len(texts))
+        ]
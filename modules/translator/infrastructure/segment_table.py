@@ -0,0 +1,73 @@
+"""
+SQLite segments table.
+Queries behind SqliteTranslationMemory.
+"""
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    key TEXT PRIMARY KEY,
+    translation TEXT NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+# Stay under SQLite's bound parameter limit
+LOOKUP_BATCH = 500
+
+
+class SegmentTable:
+    """Fetch, insert, touch and evict segment rows."""
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(SCHEMA)
+
+    def fetch(self, keys: list[str]) -> dict[str, str]:
+        """Stored translations by key, marked as just used."""
+        found = {}
+        for start in range(0, len(keys), LOOKUP_BATCH):
+            batch = keys[start:start + LOOKUP_BATCH]
+            marks = ",".join("?" * len(batch))
+            found.update(self.conn.execute(
+                "SELECT key, translation FROM segments "
+                f"WHERE key IN ({marks})",
+                batch
+            ))
+
+        if found:
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE segments SET last_used = ? WHERE key = ?",
+                    [(time.time(), key) for key in found]
+                )
+        return found
+
+    def insert(self, rows: list[tuple[str, str]]) -> None:
+        """Insert or replace (key, translation) rows."""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO segments VALUES (?, ?, ?)",
+                [(key, translation, now) for key, translation in rows]
+            )
+
+    def count(self) -> int:
+        """Number of stored rows."""
+        count, = self.conn.execute(
+            "SELECT COUNT(*) FROM segments"
+        ).fetchone()
+        return count
+
+    def drop_oldest(self, excess: int) -> None:
+        """Delete the excess least recently used rows."""
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM segments WHERE key IN ("
+                "SELECT key FROM segments "
+                "ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
@@ -24,7 +24,7 @@ class CacheSerializer:
                 for c in translation.chunks
             ],
             "glossary": {
-                k: CacheSerializer._serialize_glossary(v)
+                k: CacheSerializer.serialize_glossary(v)
                 for k, v in translation.glossary.items()
             },
             "created_at": translation.created_at.isoformat(),
@@ -49,7 +49,7 @@ class CacheSerializer:
         }
 
     @staticmethod
-    def _serialize_glossary(entry: GlossaryEntry) -> dict:
+    def serialize_glossary(entry: GlossaryEntry) -> dict:
         """Serialize glossary entry."""
         return {
             "source_term": entry.source_term,
@@ -0,0 +1,79 @@
+"""
+SQLite translation memory.
+One row per segment, evicted least recently used.
+"""
+from pathlib import Path
+from typing import Optional
+
+from ..domain.translation_memory import ITranslationMemory, MemoryStats
+from ..domain.value_objects import LanguagePair
+from .segment_key import SegmentKey
+from .segment_table import SegmentTable
+
+DEFAULT_TM_PATH = ".cache/translation_memory.sqlite3"
+DEFAULT_MAX_ENTRIES = 500_000
+
+
+class SqliteTranslationMemory(ITranslationMemory):
+    """Translation memory in a single SQLite file."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_TM_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.stats = MemoryStats()
+        self._count: Optional[int] = None
+        self.table = SegmentTable(path)
+
+    def lookup(
+        self,
+        texts: list[str],
+        language_pair: LanguagePair,
+        model: str,
+        contexts: Optional[list[Optional[str]]] = None
+    ) -> list[Optional[str]]:
+        """Stored translation per text, None on a miss."""
+        keys = SegmentKey.keys(texts, language_pair, model, contexts)
+        found = self.table.fetch(keys)
+        results = [found.get(key) for key in keys]
+        hits = sum(r is not None for r in results)
+        self.stats.hits += hits
+        self.stats.misses += len(results) - hits
+        return results
+
+    def store(
+        self,
+        texts: list[str],
+        translations: list[str],
+        language_pair: LanguagePair,
+        model: str,
+        contexts: Optional[list[Optional[str]]] = None
+    ) -> None:
+        """Remember model output and enforce the entry cap."""
+        keys = SegmentKey.keys(texts, language_pair, model, contexts)
+        count = self._current_count()
+        self.table.insert(list(zip(keys, translations)))
+
+        # Replaced rows overcount; _evict() recounts exactly
+        self._count = count + len(texts)
+        if self._count > self.max_entries:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used rows over max_entries."""
+        self._count = self.table.count()
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        self.table.drop_oldest(excess)
+        self.stats.evictions += excess
+        self._count = self.max_entries
+
+    def _current_count(self) -> int:
+        """Row count, queried once per process."""
+        if self._count is None:
+            self._count = self.table.count()
+        return self._count
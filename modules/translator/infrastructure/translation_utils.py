@@ -5,6 +5,8 @@ Extension for MarianTranslatorAdapter.
 from typing import Optional
 
 from ..domain.value_objects import LanguagePair
+from .language_prefix import LanguagePrefixHandler
+from .model_manager import ModelManager
 
 
 class TranslationUtils:
@@ -25,13 +27,20 @@ class TranslationUtils:
         """Generate cache key for model."""
         return f"{language_pair.source}-{language_pair.target}"
 
+
     @staticmethod
-    def batch_texts(
+    def model_inputs(
         texts: list[str],
-        batch_size: int = 8
-    ) -> list[list[str]]:
-        """Split texts into batches."""
+        contexts: list[Optional[str]],
+        language_pair: LanguagePair
+    ) -> list[str]:
+        """Join each text to its context, then add the prefix."""
+        model_name = ModelManager.get_model_name(language_pair)
         return [
-            texts[i:i + batch_size]
-            for i in range(0, len(texts), batch_size)
+            LanguagePrefixHandler.add_prefix(
+                TranslationUtils.prepare_input(text, context),
+                language_pair,
+                model_name
+            )
+            for text, context in zip(texts, contexts)
         ]
@@ -11,6 +11,7 @@ from ..application.translation_service import (
     TranslationService
 )
 from ..infrastructure.disk_cache import DiskCacheRepository
+from ..infrastructure.sqlite_memory import SqliteTranslationMemory
 
 
 class TranslationTask(Task):
@@ -35,7 +36,8 @@ class TranslationTask(Task):
         """Lazy load service."""
         if self._service is None:
             self._service = TranslationService(
-                self.translator
+                self.translator,
+                memory=SqliteTranslationMemory()
             )
         return self._service
 
@@ -0,0 +1,48 @@
+"""
+Unit tests for length-bucketed batching.
+"""
+from modules.translator.domain.batch_planner import (
+    LengthBucketPlanner, PaddingStats
+)
+
+
+def test_planner_groups_similar_lengths():
+    """Batches are length-sorted and stay under budget."""
+    lengths = [50, 3, 48, 4, 500, 5, 49]
+    planner = LengthBucketPlanner(max_tokens=150)
+
+    batches = planner.plan(lengths)
+
+    assert sorted(i for b in batches for i in b) == list(
+        range(len(lengths))
+    )
+    assert batches[0] == [1, 3, 5]
+    assert [4] in batches
+    for batch in batches:
+        longest = max(lengths[i] for i in batch)
+        assert len(batch) == 1 or len(batch) * longest <= 150
+
+
+def test_planner_caps_batch_size():
+    """No batch exceeds max_batch_size inputs."""
+    planner = LengthBucketPlanner(max_tokens=10**6, max_batch_size=4)
+
+    batches = planner.plan([7] * 10)
+
+    assert [len(b) for b in batches] == [4, 4, 2]
+
+
+def test_bucketing_cuts_padding_waste():
+    """Sorted buckets pad less than input-order groups."""
+    lengths = [5, 60, 6, 58, 4, 61, 7, 59]
+    in_order, bucketed = PaddingStats(), PaddingStats()
+
+    for start in range(0, len(lengths), 2):
+        in_order.record(lengths[start:start + 2])
+    for batch in LengthBucketPlanner(max_tokens=130).plan(lengths):
+        bucketed.record([lengths[i] for i in batch])
+
+    assert bucketed.tokens == in_order.tokens == sum(lengths)
+    assert in_order.waste > 0.4
+    assert bucketed.waste < 0.1
+    assert "padding waste" in bucketed.summary()
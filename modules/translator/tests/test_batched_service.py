@@ -0,0 +1,57 @@
+"""
+Unit tests for batched chunk translation in the service.
+"""
+from modules.translator.application.translation_service import (
+    TranslationService
+)
+from modules.translator.domain.translator import ITranslator
+
+
+class UpperTranslator(ITranslator):
+    """Records batch calls and upper-cases text."""
+
+    def __init__(self):
+        self.batches = []
+        self.contexts = []
+
+    def translate(self, text, language_pair, context=None):
+        return text.upper()
+
+    def translate_batch(self, texts, language_pair, contexts=None):
+        self.batches.append(list(texts))
+        self.contexts.extend(contexts)
+        return [text.upper() for text in texts]
+
+    def is_model_loaded(self, language_pair):
+        return True
+
+
+def test_service_translates_in_batches_in_order():
+    """Chunks go out in windows and merge back in order."""
+    text = "\n\n".join(f"Paragraph number {i}." for i in range(5))
+    translator = UpperTranslator()
+    service = TranslationService(translator, batch_chunks=2)
+
+    translation = service.translate_text(
+        text, target_language="es", source_language="en"
+    )
+
+    assert [len(b) for b in translator.batches] == [2, 2, 1]
+    assert translation.final_translation == text.upper()
+
+
+def test_batches_carry_each_chunk_context():
+    """Batched chunks get the context translate() would."""
+    text = "\n\n".join(f"Paragraph number {i}." for i in range(3))
+    translator = UpperTranslator()
+    service = TranslationService(translator, batch_chunks=2)
+    chunks = list(service.chunker.chunk_text(text))
+
+    service.translate_text(
+        text, target_language="es", source_language="en"
+    )
+
+    assert translator.contexts == [
+        chunk.get("context_before") for chunk in chunks
+    ]
+    assert any(translator.contexts)
@@ -0,0 +1,22 @@
+"""
+Unit tests for bucketed batch execution.
+"""
+from modules.translator.domain.bucketed_batches import BucketedBatches
+
+
+def test_outputs_return_in_input_order():
+    """Batches run shortest first; results keep input order."""
+    lengths = [9, 2, 7, 1]
+    texts = ["nine", "two", "seven", "one"]
+    calls = []
+
+    def translate(batch):
+        calls.append(batch)
+        return [texts[i].upper() for i in batch]
+
+    runner = BucketedBatches(max_tokens=16)
+    results = runner.run(lengths, translate)
+
+    assert results == ["NINE", "TWO", "SEVEN", "ONE"]
+    assert calls[0][0] == 3
+    assert runner.padding.batches == len(calls)
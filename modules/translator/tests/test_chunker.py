@@ -38,3 +38,31 @@ def test_chunker_preserves_context():
 
     for chunk in chunks[1:]:
         assert chunk["context_before"]
+
+
+def test_chunk_offsets_match_text():
+    """Each chunk's start/end slice back to its text."""
+    text = (
+        "  One. Two is here. One.\n\n"
+        "Three and four. Five.\n  \n\nOne.  "
+    )
+    chunker = SemanticChunker(max_tokens=3)
+
+    chunks = list(chunker.chunk_text(text))
+
+    assert [c["text"] for c in chunks][-1] == "One."
+    for chunk in chunks:
+        assert text[chunk["start"]:chunk["end"]] == chunk["text"]
+    assert [c["start"] for c in chunks] == sorted(
+        c["start"] for c in chunks
+    )
+
+
+def test_repeated_sentence_keeps_its_own_offset():
+    """A sentence seen earlier is located where it occurs."""
+    text = "Yes. No.\n\nYes."
+    chunker = SemanticChunker(max_tokens=100)
+
+    chunks = list(chunker.chunk_text(text))
+
+    assert (chunks[-1]["start"], chunks[-1]["end"]) == (10, 14)
@@ -0,0 +1,69 @@
+"""
+Unit tests for the compact translation cache.
+"""
+from modules.translator.application.translation_service import (
+    TranslationService
+)
+from modules.translator.domain.translator import ITranslator
+from modules.translator.infrastructure.disk_cache import (
+    DiskCacheRepository
+)
+
+PARAGRAPH = (
+    "Gregor woke from troubled dreams. He lay on his back. "
+    "The room was quiet and the rain fell on the window."
+)
+
+
+class EchoTranslator(ITranslator):
+    """Returns the text reversed word by word."""
+
+    def translate(self, text, language_pair, context=None):
+        return " ".join(reversed(text.split()))
+
+    def translate_batch(self, texts, language_pair, contexts=None):
+        return [self.translate(t, language_pair) for t in texts]
+
+    def is_model_loaded(self, language_pair):
+        return True
+
+
+def _translation(paragraphs=150):
+    text = "\n\n".join(
+        f"{i}. {PARAGRAPH}" for i in range(paragraphs)
+    )
+    service = TranslationService(EchoTranslator())
+    return service.translate_text(text, "es", source_language="en")
+
+
+def _fields(chunk):
+    return (
+        chunk.chunk_id, chunk.original_text, chunk.translated_text,
+        chunk.start_position, chunk.end_position,
+        chunk.context_before, chunk.context_after
+    )
+
+
+def test_round_trip_and_single_chunk(tmp_path):
+    """Packs load back whole or one chunk at a time."""
+    translation = _translation()
+    translation.chunks[3].original_text = "edited elsewhere"
+    cache = DiskCacheRepository(str(tmp_path))
+
+    cache.save(translation)
+    loaded = cache.get_by_id(translation.translation_id)
+
+    assert loaded.original_text == translation.original_text
+    assert loaded.final_translation == translation.final_translation
+    assert loaded.glossary == translation.glossary
+    assert loaded.completed_at == translation.completed_at
+    assert list(map(_fields, loaded.chunks)) == list(
+        map(_fields, translation.chunks)
+    )
+    for i in (0, 3, 64, len(translation.chunks) - 1):
+        chunk = cache.get_chunk(translation.translation_id, i)
+        assert _fields(chunk) == _fields(translation.chunks[i])
+    assert cache.get_chunk(
+        translation.translation_id, len(translation.chunks)
+    ) is None
+
@@ -0,0 +1,44 @@
+"""
+Unit tests for the cache against the legacy JSON format.
+"""
+import json
+
+from modules.translator.infrastructure.disk_cache import (
+    DiskCacheRepository
+)
+from modules.translator.infrastructure.serializer import (
+    CacheSerializer
+)
+from .test_disk_cache import _fields, _translation
+
+
+def test_pack_is_smaller_than_legacy_json(tmp_path):
+    """Offsets, shared contexts and compression cut size."""
+    translation = _translation()
+    cache = DiskCacheRepository(str(tmp_path))
+    cache.save(translation)
+
+    legacy = json.dumps(
+        CacheSerializer.serialize(translation),
+        indent=2, ensure_ascii=False
+    ).encode('utf-8')
+    pack, = tmp_path.glob("*/*.zip")
+
+    assert pack.stat().st_size * 5 < len(legacy)
+
+
+def test_legacy_json_still_loads(tmp_path):
+    """Entries saved by older versions stay readable."""
+    translation = _translation(paragraphs=3)
+    legacy = tmp_path / f"{translation.translation_id}.json"
+    legacy.write_text(
+        json.dumps(CacheSerializer.serialize(translation)),
+        encoding='utf-8'
+    )
+    cache = DiskCacheRepository(str(tmp_path))
+
+    assert cache.exists(translation.translation_id)
+    chunk = cache.get_chunk(translation.translation_id, 1)
+    assert _fields(chunk) == _fields(translation.chunks[1])
+    cache.delete(translation.translation_id)
+    assert not cache.exists(translation.translation_id)
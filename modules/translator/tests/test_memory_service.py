@@ -0,0 +1,48 @@
+"""
+Unit tests for the service reading through the memory.
+"""
+from modules.translator.application.translation_service import (
+    TranslationService
+)
+from modules.translator.domain.translator import ITranslator
+from modules.translator.infrastructure.sqlite_memory import (
+    SqliteTranslationMemory
+)
+
+
+class CountingTranslator(ITranslator):
+    """Upper-cases text and counts texts sent to the model."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def translate(self, text, language_pair, context=None):
+        self.calls += 1
+        return text.upper()
+
+    def translate_batch(self, texts, language_pair, contexts=None):
+        self.calls += len(texts)
+        return [text.upper() for text in texts]
+
+    def is_model_loaded(self, language_pair):
+        return True
+
+
+def test_second_run_skips_the_model(tmp_path):
+    """A re-translated book is served from memory."""
+    text = "\n\n".join(f"Paragraph number {i}." for i in range(4))
+    path = str(tmp_path / "tm.db")
+    first, second = CountingTranslator(), CountingTranslator()
+
+    TranslationService(
+        first, memory=SqliteTranslationMemory(path)
+    ).translate_text(text, "es", source_language="en")
+    memory = SqliteTranslationMemory(path)
+    translation = TranslationService(
+        second, memory=memory
+    ).translate_text(text, "es", source_language="en")
+
+    assert first.calls == 4
+    assert second.calls == 0
+    assert memory.stats.hit_rate == 1.0
+    assert translation.final_translation == text.upper()
@@ -0,0 +1,52 @@
+"""
+Unit tests for the SQLite translation memory.
+"""
+from modules.translator.domain.value_objects import LanguagePair
+from modules.translator.infrastructure.sqlite_memory import (
+    SqliteTranslationMemory
+)
+
+PAIR = LanguagePair(source="en", target="es")
+
+
+def test_lookup_normalizes_and_separates_models(tmp_path):
+    """Whitespace is ignored; pair and model are not."""
+    memory = SqliteTranslationMemory(str(tmp_path / "tm.db"))
+    memory.store(["Hello  world"], ["Hola mundo"], PAIR, "m1")
+
+    assert memory.lookup(["Hello world\n"], PAIR, "m1") == [
+        "Hola mundo"
+    ]
+    assert memory.lookup(["Hello world"], PAIR, "m2") == [None]
+    other = LanguagePair(source="en", target="pt")
+    assert memory.lookup(["Hello world"], other, "m1") == [None]
+    assert memory.stats.hits == 1
+    assert memory.stats.misses == 2
+
+
+def test_context_is_part_of_the_key(tmp_path):
+    """The same text after another context is a miss."""
+    memory = SqliteTranslationMemory(str(tmp_path / "tm.db"))
+    memory.store(["It was."], ["Fue."], PAIR, "m", ["Before."])
+
+    assert memory.lookup(
+        ["It was.", "It was.", "It was."], PAIR, "m",
+        ["Before.", "Other.", None]
+    ) == ["Fue.", None, None]
+
+
+def test_least_recently_used_are_evicted(tmp_path):
+    """Rows over max_entries go oldest-use first."""
+    memory = SqliteTranslationMemory(
+        str(tmp_path / "tm.db"), max_entries=2
+    )
+    memory.store(["a"], ["A"], PAIR, "m")
+    memory.store(["b"], ["B"], PAIR, "m")
+    memory.lookup(["a"], PAIR, "m")
+    memory.store(["c"], ["C"], PAIR, "m")
+
+    assert memory.lookup(["a", "b", "c"], PAIR, "m") == [
+        "A", None, "C"
+    ]
+    assert memory.stats.evictions == 1
+
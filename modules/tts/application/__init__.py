@@ -0,0 +1,3 @@
+"""
+Application layer - TTS use case orchestration.
+"""
@@ -0,0 +1,52 @@
+"""
+Benchmark Report - Throughput, real-time factor and memory.
+"""
+import resource
+from typing import Dict
+
+STAGES = (
+    "text_prep", "synthesis", "enhancement", "merge", "mp3_encode"
+)
+
+
+class BenchmarkReport:
+    """Summarize one PipelineBenchmark run."""
+
+    @staticmethod
+    def build(
+        text: str,
+        chunks: list,
+        audio_seconds: float,
+        level: str,
+        timings: Dict[str, float]
+    ) -> Dict:
+        """Report dict, stage times in STAGES order."""
+        total = sum(timings.values())
+        return {
+            "chars": len(text),
+            "chunks": len(chunks),
+            "audio_seconds": round(audio_seconds, 2),
+            "enhance_level": level,
+            "total_seconds": round(total, 4),
+            "chars_per_sec": _ratio(len(text), total, 1),
+            "synthesis_chars_per_sec": _ratio(
+                len(text), timings["synthesis"], 1
+            ),
+            "real_time_factor": _ratio(total, audio_seconds, 5),
+            "peak_rss_mb": _peak_rss_mb(),
+            "stages": {
+                name: round(timings[name], 4) for name in STAGES
+            },
+        }
+
+
+def _ratio(value: float, per: float, digits: int) -> float:
+    """Rounded value / per, 0.0 when nothing was produced."""
+    return round(value / per, digits) if per else 0.0
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory of this process."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes on Linux
+    return round(usage.ru_maxrss / 1024, 1)
@@ -0,0 +1,72 @@
+"""
+Benchmark Stages - The work render, one stage at a time.
+"""
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from modules.tts.domain.audio.audio_enhancer import AudioEnhancer
+from modules.tts.domain.audio.enhancing_sink import EnhancingSink
+from modules.tts.domain.audio.mp3_stream_encoder import (
+    Mp3StreamEncoder
+)
+from modules.tts.domain.audio.pcm_spool import PcmSpool
+from modules.tts.domain.audio.silence_bank import silence_block
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.text.pause_tokens import Chunk, lone_pause
+
+
+class BenchmarkStages:
+    """Each stage runs to completion before the next starts."""
+
+    def __init__(
+        self,
+        engine: TTSEngine,
+        work_dir: Path,
+        level: str = "chunk"
+    ):
+        self.engine = engine
+        self.work_dir = Path(work_dir)
+        self.level = level
+
+    def synthesize(self, chunk: Chunk) -> np.ndarray:
+        """Raw speech or silence for one chunk."""
+        pause = lone_pause(chunk)
+        if pause:
+            return silence_block(self.engine.sample_rate, pause.seconds)
+        return self.engine.synthesize_tokens(chunk, enhance=False)
+
+    def enhance(self, chunks, raw) -> List[np.ndarray]:
+        """Per-chunk or whole-work enhancement, as configured."""
+        rate = self.engine.sample_rate
+        if self.level == "chunk":
+            enhancer = AudioEnhancer(rate)
+            return [
+                s if lone_pause(c) else enhancer.enhance_samples(s)
+                for c, s in zip(chunks, raw)
+            ]
+        out = PcmSpool(rate, self.work_dir / "enhanced.pcm")
+        sink = EnhancingSink(out, rate, self.work_dir / "work.f32")
+        for samples in raw:
+            sink.write(samples)
+        sink.finish()
+        return list(out.iter_blocks())
+
+    def merge(self, audio: List[np.ndarray]) -> PcmSpool:
+        """Collect chunk audio in order, as --encode buffered."""
+        spool = PcmSpool(
+            self.engine.sample_rate, self.work_dir / "work.pcm"
+        )
+        for samples in audio:
+            spool.write(samples)
+        return spool
+
+    def encode(self, spool: PcmSpool) -> None:
+        """Stream the merged work through the MP3 encoder."""
+        encoder = Mp3StreamEncoder(
+            self.work_dir / "bench.mp3", spool.sample_rate
+        )
+        for block in spool.iter_blocks():
+            encoder.write(block)
+        encoder.finish()
@@ -0,0 +1,52 @@
+"""
+Buffered Work Encoder - Spool the work PCM, then encode the MP3.
+"""
+from pathlib import Path
+from typing import List, Optional
+
+from modules.tts.domain.audio.metered_sink import MeteredSink
+from modules.tts.domain.audio.pcm_spool import (
+    DEFAULT_MEMORY_BUDGET, PcmSpool
+)
+from modules.tts.domain.text.pause_tokens import Chunk
+from .chunk_renderer import ProgressCallback
+from .encoded_output import count_output
+from .work_finalizer import WorkFinalizer
+
+
+class BufferedWorkEncoder:
+    """Spool the whole work, then encode it at once."""
+
+    def __init__(
+        self,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        bitrate: str = "128k"
+    ):
+        self.memory_budget = memory_budget
+        self.finalizer = WorkFinalizer(bitrate)
+
+    def encode(
+        self,
+        renderer,
+        chunks: List[Chunk],
+        work_dir: Path,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> str:
+        """Render into a PCM spool and return the MP3."""
+        spool = PcmSpool(
+            renderer.sample_rate,
+            work_dir / "work.spool.pcm",
+            self.memory_budget
+        )
+        metrics = renderer.metrics
+        try:
+            renderer.render(
+                chunks,
+                MeteredSink(spool, metrics, "merge"),
+                on_chunk
+            )
+            with metrics.timed("encode"):
+                mp3_file = self.finalizer.finalize(spool, work_dir)
+            return count_output(metrics, mp3_file)
+        finally:
+            spool.close()
@@ -0,0 +1,46 @@
+"""
+Chapter Assembly - Merge a chord's chunk WAVs into one file.
+"""
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from modules.tts.domain.audio.chapter_merger import ChapterMerger
+from modules.tts.domain.core.stage_metrics import StageMetrics
+
+
+class ChapterAssembly:
+    """Encode chunks in order, sum their metrics, clean up."""
+
+    def __init__(self):
+        self.merger = ChapterMerger()
+
+    def run(
+        self,
+        chunks: List[Dict],
+        chapter_name: str,
+        output_path: Optional[str] = None
+    ) -> Tuple[Path, StageMetrics]:
+        """Merged file and the chapter's metrics."""
+        metrics = StageMetrics()
+        for chunk in chunks:
+            metrics += StageMetrics(**chunk["metrics"])
+        
+        if output_path is None:
+            output_path = Path("outputs/temp") / f"{chapter_name}.mp3"
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        chunk_paths = [chunk["path"] for chunk in chunks]
+        with metrics.timed("encode"):
+            success = self.merger.merge_chapter(
+                chunk_paths=chunk_paths,
+                output_path=str(output_path)
+            )
+        
+        if not success:
+            raise Exception(f"Merge failed: {chapter_name}")
+        
+        metrics.record("encode", 0.0, output_path.stat().st_size)
+        for path in chunk_paths:
+            Path(path).unlink(missing_ok=True)
+        return output_path, metrics
@@ -0,0 +1,55 @@
+"""
+Chord Job - One work in flight on the Celery cluster.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from celery.result import AsyncResult
+
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.domain.manifest import Work
+from .work_result import WorkResult
+
+
+@dataclass
+class ChordJob:
+    """
+    A submitted chord, or why there is none.
+
+    Elapsed time runs from this work's own submission,
+    not from the start of the run.
+    """
+    work: Work
+    hashes: List[str] = field(default_factory=list)
+    pending: Optional[AsyncResult] = None
+    error: str = ""
+    output_file: str = ""
+    started: float = field(default_factory=time.perf_counter)
+
+    def ready(self) -> bool:
+        """Done, failed, or never sent."""
+        return self.pending is None or self.pending.ready()
+
+    def result(self) -> WorkResult:
+        """Outcome of the work, timed from submission."""
+        if self.output_file:
+            return WorkResult.succeeded(
+                self.work, self.output_file, 0.0
+            )
+        if self.error:
+            return WorkResult.failed(self.work, self.error)
+        try:
+            merged = self.pending.get()
+        except Exception as e:
+            return self._timed(WorkResult.failed(self.work, str(e)))
+
+        result = WorkResult.succeeded(
+            self.work, merged["output_file"], 0.0
+        )
+        result.metrics = StageMetrics(**merged["metrics"])
+        return self._timed(result)
+
+    def _timed(self, result: WorkResult) -> WorkResult:
+        result.elapsed = time.perf_counter() - self.started
+        return result
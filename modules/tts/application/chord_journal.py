@@ -0,0 +1,31 @@
+"""
+Chord Journal - Encoded-work records for distributed runs.
+"""
+from typing import Optional
+
+from modules.tts.storage.job_journal import JobJournal
+from modules.tts.storage.work_journal import ENCODED
+from .chord_job import ChordJob
+from .work_result import WorkResult
+
+
+class ChordJournal:
+    """Whole-work entries only; without a journal, a no-op."""
+
+    def __init__(self, journal: Optional[JobJournal] = None):
+        self.journal = journal
+
+    def completed_output(self, job: ChordJob) -> str:
+        """Output of an earlier run with the same hashes, or ''."""
+        if not self.journal:
+            return ""
+        journal = self.journal.work(job.work.id)
+        return journal.completed_output(job.hashes)
+
+    def record(self, job: ChordJob, result: WorkResult) -> None:
+        """Journal a freshly encoded work."""
+        if not (self.journal and result.success and job.pending):
+            return
+        journal = self.journal.work(job.work.id)
+        journal.begin(job.hashes, 0)
+        journal.mark(ENCODED, output_file=result.output_file)
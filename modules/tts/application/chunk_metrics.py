@@ -0,0 +1,42 @@
+"""
+Chunk Metrics - Per-chunk slices of a renderer's timings.
+"""
+from typing import Dict, List, Optional
+
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from .chunk_renderer import ProgressCallback
+
+
+class ChunkMetricsRecorder:
+    """
+    Progress callback that records the stage metrics added
+    since the previous chunk finished.
+
+    Chunks replayed from a journal never report progress,
+    so only freshly rendered chunks get a record.
+    """
+
+    def __init__(
+        self,
+        renderer,
+        on_chunk: Optional[ProgressCallback] = None
+    ):
+        self.renderer = renderer
+        self.on_chunk = on_chunk
+        self.records: List[Dict] = []
+        self.start = renderer.metrics.copy()
+        self.last = self.start
+
+    def __call__(self, done: int, total: int) -> None:
+        now = self.renderer.metrics.copy()
+        self.records.append(
+            {"chunk": done, **(now - self.last).to_dict()}
+        )
+        self.last = now
+        if self.on_chunk:
+            self.on_chunk(done, total)
+
+    @property
+    def total(self) -> StageMetrics:
+        """Everything recorded since construction."""
+        return self.renderer.metrics - self.start
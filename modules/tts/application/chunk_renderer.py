@@ -0,0 +1,80 @@
+"""
+Chunk Renderer - Turn prepared chunks into PCM samples.
+"""
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.storage.cache_stats import CacheStats
+from modules.tts.domain.audio.pcm_sink import PcmSink
+from modules.tts.domain.audio.silence_generator import (
+    SilenceGenerator
+)
+from modules.tts.domain.text.pause_tokens import Chunk, lone_pause
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class ChunkRenderer:
+    """Synthesize speech and silence chunks in order."""
+
+    def __init__(self, engine: TTSEngine):
+        self.engine = engine
+        self._silence: Optional[SilenceGenerator] = None
+
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the rendered audio."""
+        return self.engine.sample_rate
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Synthesis cache counters so far."""
+        if not self.engine.cache:
+            return CacheStats()
+        return CacheStats(**vars(self.engine.cache.stats))
+
+    @property
+    def signature(self) -> str:
+        """Voice and settings the audio was rendered with."""
+        return self.engine.render_signature()
+
+    @property
+    def metrics(self) -> StageMetrics:
+        """Stage timings so far (live object)."""
+        return self.engine.metrics
+
+    def render(
+        self,
+        chunks: List[Chunk],
+        sink: PcmSink,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> None:
+        """Append the audio of every chunk to the sink."""
+        for i, chunk in enumerate(chunks):
+            sink.write(self.render_one(chunk))
+            if on_chunk:
+                on_chunk(i + 1, len(chunks))
+
+    def render_one(self, chunk: Chunk) -> np.ndarray:
+        """Generate int16 samples for a single chunk."""
+        pause = lone_pause(chunk)
+        if pause:
+            samples = self._silence_gen().silence_samples(
+                pause.seconds
+            )
+        else:
+            samples = self.engine.synthesize_tokens(chunk)
+        self.metrics.audio_seconds += len(samples) / self.sample_rate
+        return samples
+
+    def close(self) -> None:
+        """Nothing to release for in-process rendering."""
+
+    def _silence_gen(self) -> SilenceGenerator:
+        """Silence generator matching the voice rate."""
+        if self._silence is None:
+            self._silence = SilenceGenerator(self.sample_rate)
+        return self._silence
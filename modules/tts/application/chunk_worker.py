@@ -0,0 +1,50 @@
+"""
+Chunk Worker - Process-local renderer for chunk pools.
+
+The Piper voice is loaded once per worker process and
+reused for every chunk the process receives.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.text.pause_tokens import Chunk
+from modules.tts.storage.cache_stats import CacheStats
+from modules.tts.storage.synthesis_cache import SynthesisCache
+from .chunk_renderer import ChunkRenderer
+
+_renderer: Optional[ChunkRenderer] = None
+
+
+def init_chunk_worker(
+    language: str,
+    cache: Optional[SynthesisCache] = None,
+    options: Optional[EngineOptions] = None
+) -> None:
+    """Warm up the voice for this process."""
+    global _renderer
+    engine = TTSEngine(language, cache, options)
+    engine.load_model()
+    _renderer = ChunkRenderer(engine)
+
+
+def render_chunk(
+    chunk: Chunk
+) -> Tuple[np.ndarray, CacheStats, StageMetrics]:
+    """Render one chunk; also report its cache and timings."""
+    before = _renderer.cache_stats
+    metrics = _renderer.metrics.copy()
+    samples = _renderer.render_one(chunk)
+    return (
+        samples,
+        _renderer.cache_stats - before,
+        _renderer.metrics - metrics
+    )
+
+
+def worker_sample_rate() -> int:
+    """Sample rate of the worker voice."""
+    return _renderer.sample_rate
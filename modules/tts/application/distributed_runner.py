@@ -0,0 +1,70 @@
+"""
+Distributed Work Runner - Fan works out to Celery workers.
+"""
+import time
+from typing import List, Optional
+
+from modules.tts.domain.manifest import Work
+from modules.tts.domain.text.chunk_hash import chunk_hash
+from modules.tts.storage.job_journal import JobJournal
+from .chord_job import ChordJob
+from .chord_journal import ChordJournal
+from .work_chords import WorkChords
+from .work_pool import ResultCallback
+from .work_result import WorkResult
+
+POLL_SECONDS = 0.5
+
+
+class DistributedWorkRunner:
+    """
+    One Celery chord per work, all in flight at once.
+
+    With a journal, works already encoded from the same
+    chunks and settings are skipped; others render whole,
+    as chunk-level resume needs the local PCM log.
+    Results are reported as their chords finish.
+    """
+
+    def __init__(
+        self,
+        chords: WorkChords,
+        journal: Optional[JobJournal] = None
+    ):
+        self.chords = chords
+        self.journal = ChordJournal(journal)
+
+    def run(
+        self,
+        works: List[Work],
+        on_result: ResultCallback
+    ) -> List[WorkResult]:
+        """Submit every work, then collect as they finish."""
+        pending = [self._submit(work) for work in works]
+        results = []
+        while pending:
+            ready = [job for job in pending if job.ready()]
+            if not ready:
+                time.sleep(POLL_SECONDS)
+            for job in ready:
+                pending.remove(job)
+                result = job.result()
+                self.journal.record(job, result)
+                on_result(result)
+                results.append(result)
+        return results
+
+    def _submit(self, work: Work) -> ChordJob:
+        """Send the work's chord unless it is already done."""
+        job = ChordJob(work)
+        try:
+            chunks = self.chords.prepare(work)
+            job.hashes = [
+                chunk_hash(c, self.chords.signature) for c in chunks
+            ]
+            job.output_file = self.journal.completed_output(job)
+            if not job.output_file:
+                job.pending = self.chords.send(work, chunks)
+        except Exception as e:
+            job.error = str(e)
+        return job
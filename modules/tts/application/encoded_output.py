@@ -0,0 +1,11 @@
+"""
+Encoded Output - Charge the finished MP3 to the encode stage.
+"""
+from pathlib import Path
+
+
+def count_output(metrics, mp3_file: str) -> str:
+    """Charge the MP3 size to the encode stage."""
+    if mp3_file and Path(mp3_file).exists():
+        metrics.record("encode", 0.0, Path(mp3_file).stat().st_size)
+    return mp3_file
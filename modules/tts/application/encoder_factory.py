@@ -0,0 +1,24 @@
+"""
+Encoder Factory - Choose streaming or buffered MP3 output.
+"""
+from modules.tts.domain.audio.pcm_spool import (
+    DEFAULT_MEMORY_BUDGET
+)
+from .buffered_work_encoder import BufferedWorkEncoder
+from .work_encoders import StreamingWorkEncoder
+
+ENCODE_MODES = ('stream', 'buffered')
+
+
+class EncoderFactory:
+    """Build the work encoder for a run."""
+
+    @staticmethod
+    def create(
+        mode: str = 'stream',
+        memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ):
+        """Memory budget (bytes) only applies to buffered."""
+        if mode == 'buffered':
+            return BufferedWorkEncoder(memory_budget)
+        return StreamingWorkEncoder()
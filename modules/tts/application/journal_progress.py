@@ -0,0 +1,41 @@
+"""
+Journal Progress - Checkpoint each chunk as it is written.
+"""
+from typing import Optional
+
+from modules.tts.domain.audio.raw_pcm_file import RawPcmFile
+from modules.tts.storage.work_journal import WorkJournal
+from .chunk_renderer import ProgressCallback
+
+
+class JournalProgress:
+    """
+    Progress callback for the inner renderer.
+
+    Counts are offset by the chunks already done; the log
+    is flushed before every journal save so the saved size
+    never runs ahead of the audio on disk.
+    """
+
+    def __init__(
+        self,
+        journal: WorkJournal,
+        log: RawPcmFile,
+        done: int,
+        total: int,
+        on_chunk: Optional[ProgressCallback] = None
+    ):
+        self.journal = journal
+        self.log = log
+        self.done = done
+        self.total = total
+        self.on_chunk = on_chunk
+
+    def __call__(self, finished: int, _total: int) -> None:
+        index = self.done + finished - 1
+        self.journal.record_chunk(index, self.log.size)
+        if self.journal.save_due():
+            self.log.flush()
+            self.journal.save()
+        if self.on_chunk:
+            self.on_chunk(index + 1, self.total)
@@ -0,0 +1,76 @@
+"""
+Journaled Renderer - Resume a work at its first missing chunk.
+"""
+from typing import List, Optional
+
+from modules.tts.domain.audio.metered_sink import MeteredSink
+from modules.tts.domain.audio.pcm_sink import PcmSink
+from modules.tts.domain.audio.raw_pcm_file import RawPcmFile
+from modules.tts.domain.audio.tee_sink import TeeSink
+from modules.tts.domain.text.pause_tokens import Chunk
+from modules.tts.storage.work_journal import MERGED, WorkJournal
+from .chunk_renderer import ProgressCallback
+from .journal_progress import JournalProgress
+
+
+class JournaledRenderer:
+    """
+    Wrap a renderer so progress survives a crash.
+
+    Chunks already in the PCM log are replayed into the
+    sink; only the remaining ones reach the inner renderer.
+    """
+
+    def __init__(
+        self,
+        renderer,
+        journal: WorkJournal,
+        log: RawPcmFile,
+        done: int
+    ):
+        self.renderer = renderer
+        self.journal = journal
+        self.log = log
+        self.done = done
+
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the wrapped renderer."""
+        return self.renderer.sample_rate
+
+    @property
+    def cache_stats(self):
+        """Cache counters of the wrapped renderer."""
+        return self.renderer.cache_stats
+
+    @property
+    def metrics(self):
+        """Stage timings of the wrapped renderer."""
+        return self.renderer.metrics
+
+    def render(
+        self,
+        chunks: List[Chunk],
+        sink: PcmSink,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> None:
+        """Replay logged chunks, then render the rest."""
+        for block in self.log.iter_blocks():
+            sink.write(block)
+
+        progress = JournalProgress(
+            self.journal, self.log, self.done, len(chunks), on_chunk
+        )
+        try:
+            self.renderer.render(
+                chunks[self.done:],
+                TeeSink(
+                    sink,
+                    MeteredSink(self.log, self.metrics, "merge")
+                ),
+                progress
+            )
+        finally:
+            self.log.flush()
+            self.journal.save()
+        self.journal.mark(MERGED)
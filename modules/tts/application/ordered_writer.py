@@ -0,0 +1,76 @@
+"""
+Ordered Writer - Drain enhancement futures into a sink in order.
+"""
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Callable, Deque, List, Optional
+
+from modules.tts.domain.audio.pcm_sink import PcmSink
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.domain.text.pause_tokens import Chunk
+from .chunk_renderer import ProgressCallback
+
+QUEUE_DEPTH_PER_WORKER = 2
+
+
+def resolved(value) -> Future:
+    """A future that is already done."""
+    done: Future = Future()
+    done.set_result(value)
+    return done
+
+
+class OrderedWriter:
+    """
+    Futures resolve to (samples, metrics); oldest first.
+
+    At most ``depth`` chunks are in flight; synthesis waits
+    on the oldest one when the queue is full, so memory
+    stays bounded. Chunks reach the sink in order.
+    """
+
+    def __init__(
+        self,
+        sink: PcmSink,
+        totals: StageMetrics,
+        sample_rate: int,
+        depth: int,
+        on_chunk: Optional[ProgressCallback] = None
+    ):
+        self.sink = sink
+        self.depth = depth
+        self.totals = totals
+        self.sample_rate = sample_rate
+        self.on_chunk = on_chunk
+        self.pending: Deque[Future] = deque()
+        self.written = 0
+        self.total_chunks = 0
+
+    def run(
+        self,
+        pool: Executor,
+        chunks: List[Chunk],
+        submit: Callable[[Executor, Chunk], Future]
+    ) -> None:
+        """Submit every chunk, writing as the queue fills."""
+        self.total_chunks = len(chunks)
+        try:
+            for chunk in chunks:
+                if len(self.pending) >= self.depth:
+                    self._write_oldest()
+                self.pending.append(submit(pool, chunk))
+            while self.pending:
+                self._write_oldest()
+        finally:
+            for future in self.pending:
+                future.cancel()
+
+    def _write_oldest(self) -> None:
+        """Wait for the oldest chunk and append it."""
+        samples, metrics = self.pending.popleft().result()
+        self.totals += metrics
+        self.totals.audio_seconds += len(samples) / self.sample_rate
+        self.sink.write(samples)
+        self.written += 1
+        if self.on_chunk:
+            self.on_chunk(self.written, self.total_chunks)
@@ -0,0 +1,77 @@
+"""
+Parallel Chunk Renderer - Fan one work out across cores.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from modules.tts.domain.audio.pcm_sink import PcmSink
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.storage.cache_stats import CacheStats
+from modules.tts.storage.synthesis_cache import SynthesisCache
+from modules.tts.domain.text.pause_tokens import Chunk
+from .chunk_renderer import ProgressCallback
+from .chunk_worker import (
+    init_chunk_worker, render_chunk, worker_sample_rate
+)
+
+
+class ParallelChunkRenderer:
+    """
+    Synthesize the chunks of a work on warm workers.
+
+    Results are reassembled in chunk index order, so
+    the merged audio is identical to sequential output.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        language: str,
+        batch_size: int = 4,
+        cache: Optional[SynthesisCache] = None,
+        options: Optional[EngineOptions] = None
+    ):
+        self.batch_size = batch_size
+        self.cache_stats = CacheStats()
+        self.metrics = StageMetrics()
+        self._sample_rate: Optional[int] = None
+        self.signature = TTSEngine(
+            language, options=options
+        ).render_signature()
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_chunk_worker,
+            initargs=(language, cache, options)
+        )
+
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate reported by the worker voices."""
+        if self._sample_rate is None:
+            future = self.pool.submit(worker_sample_rate)
+            self._sample_rate = future.result()
+        return self._sample_rate
+
+    def render(
+        self,
+        chunks: List[Chunk],
+        sink: PcmSink,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> None:
+        """Append chunk audio to the sink in index order."""
+        results = self.pool.map(
+            render_chunk, chunks, chunksize=self.batch_size
+        )
+        for done, result in enumerate(results, 1):
+            samples, stats, metrics = result
+            sink.write(samples)
+            self.cache_stats = self.cache_stats + stats
+            self.metrics += metrics
+            if on_chunk:
+                on_chunk(done, len(chunks))
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self.pool.shutdown()
@@ -0,0 +1,48 @@
+"""
+Parallel Work Runner - Largest-first scheduling with retry.
+"""
+from typing import List
+
+from modules.tts.domain.manifest import Work
+from .work_pool import ResultCallback, WorkPool
+from .work_result import WorkResult
+from .work_scheduler import WorkScheduler
+
+
+class ParallelWorkRunner:
+    """Run works across worker processes."""
+
+    def __init__(self, pool: WorkPool, max_retries: int = 1):
+        self.pool = pool
+        self.max_retries = max_retries
+
+    def run(
+        self,
+        works: List[Work],
+        on_result: ResultCallback
+    ) -> List[WorkResult]:
+        """
+        Process works, isolating failures per work.
+
+        Errors inside a work are reported as results.
+        If a worker process dies, the pool is rebuilt
+        and unfinished works are retried.
+        """
+        results: List[WorkResult] = []
+        pending = WorkScheduler.largest_first(works)
+
+        for _ in range(self.max_retries + 1):
+            finished, pending = self.pool.execute(
+                pending, on_result
+            )
+            results.extend(finished)
+            if not pending:
+                return results
+            pending = WorkScheduler.largest_first(pending)
+
+        for work in pending:
+            failure = WorkResult.failed(work, "Worker died")
+            results.append(failure)
+            on_result(failure)
+
+        return results
@@ -0,0 +1,63 @@
+"""
+Pipeline Benchmark - Time every stage of a work render.
+"""
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict
+
+from modules.tts.domain.core.enhanced_text_processor import (
+    EnhancedTextProcessor
+)
+from modules.tts.domain.core.tts_engine import TTSEngine
+from .benchmark_report import BenchmarkReport
+from .benchmark_stages import BenchmarkStages
+
+
+class PipelineBenchmark:
+    """
+    Run text prep, synthesis, enhancement, merge and MP3
+    encoding one after another so each gets its own time.
+
+    Synthesis asks the engine for raw speech, so
+    enhancement is timed on its own.
+    """
+
+    def __init__(
+        self,
+        engine: TTSEngine,
+        work_dir: Path,
+        enhance_level: str = "chunk"
+    ):
+        self.level = enhance_level
+        self.engine = engine
+        self.stages = BenchmarkStages(engine, work_dir, enhance_level)
+        self.timings: Dict[str, float] = {}
+
+    def run(self, text: str) -> Dict:
+        """Render the text once and return the report."""
+        stages = self.stages
+        with self._stage("text_prep"):
+            chunks = EnhancedTextProcessor().prepare_work_text(text)
+        with self._stage("synthesis"):
+            raw = [stages.synthesize(c) for c in chunks]
+        with self._stage("enhancement"):
+            audio = stages.enhance(chunks, raw)
+        with self._stage("merge"):
+            spool = stages.merge(audio)
+        with self._stage("mp3_encode"):
+            stages.encode(spool)
+        spool.close()
+        return BenchmarkReport.build(
+            text,
+            chunks,
+            spool.total_samples / self.engine.sample_rate,
+            self.level,
+            self.timings
+        )
+
+    @contextmanager
+    def _stage(self, name: str):
+        started = time.perf_counter()
+        yield
+        self.timings[name] = time.perf_counter() - started
@@ -0,0 +1,79 @@
+"""
+Pipelined Renderer - Enhance chunks while the next is synthesized.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from modules.tts.domain.audio.pcm_sink import PcmSink
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.text.pause_tokens import Chunk, lone_pause
+from .chunk_renderer import ChunkRenderer, ProgressCallback
+from .ordered_writer import (
+    QUEUE_DEPTH_PER_WORKER, OrderedWriter, resolved
+)
+
+Enhanced = Tuple[np.ndarray, StageMetrics]
+
+
+class PipelinedChunkRenderer(ChunkRenderer):
+    """
+    Overlap per-chunk enhancement with Piper inference.
+
+    The calling thread synthesizes raw speech and hands it
+    to a pool of enhancement threads (ONNX and most of the
+    numpy/scipy chain release the GIL); an OrderedWriter
+    bounds the chunks in flight and keeps their order.
+    """
+
+    def __init__(
+        self,
+        engine: TTSEngine,
+        workers: int,
+        queue_depth: Optional[int] = None
+    ):
+        super().__init__(engine)
+        self.workers = workers
+        self.queue_depth = (
+            queue_depth or workers * QUEUE_DEPTH_PER_WORKER
+        )
+
+    def render(
+        self,
+        chunks: List[Chunk],
+        sink: PcmSink,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> None:
+        """Append the audio of every chunk to the sink."""
+        writer = OrderedWriter(
+            sink, self.metrics, self.sample_rate,
+            self.queue_depth, on_chunk
+        )
+        self.engine.load_enhancer()
+
+        with ThreadPoolExecutor(
+            self.workers, thread_name_prefix="enhance"
+        ) as pool:
+            writer.run(pool, chunks, self._submit)
+
+    def _submit(
+        self,
+        pool: ThreadPoolExecutor,
+        chunk: Chunk
+    ) -> Future:
+        """Synthesize now, enhance on the pool."""
+        pause = lone_pause(chunk)
+        if pause:
+            return resolved((
+                self._silence_gen().silence_samples(pause.seconds),
+                StageMetrics()
+            ))
+        raw = self.engine.synthesize_tokens(chunk, enhance=False)
+        return pool.submit(self._enhance, raw)
+
+    def _enhance(self, raw: np.ndarray) -> Enhanced:
+        """Enhance on a pool thread with private metrics."""
+        metrics = StageMetrics()
+        return self.engine.enhance_pcm(raw, metrics), metrics
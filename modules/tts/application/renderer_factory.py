@@ -0,0 +1,41 @@
+"""
+Renderer Factory - Choose in-process or pooled rendering.
+"""
+from typing import Optional
+
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.storage.synthesis_cache import SynthesisCache
+from .chunk_renderer import ChunkRenderer
+from .parallel_chunk_renderer import ParallelChunkRenderer
+from .pipelined_renderer import PipelinedChunkRenderer
+
+
+class RendererFactory:
+    """Build the chunk renderer for a run."""
+
+    @staticmethod
+    def create(
+        language: str,
+        chunk_workers: int = 1,
+        cache: Optional[SynthesisCache] = None,
+        options: Optional[EngineOptions] = None
+    ):
+        """One warm engine, or a pool of warm engines."""
+        if chunk_workers > 1:
+            return ParallelChunkRenderer(
+                chunk_workers, language,
+                cache=cache, options=options
+            )
+        engine = TTSEngine(language, cache, options)
+        return RendererFactory.for_engine(engine)
+
+    @staticmethod
+    def for_engine(engine: TTSEngine) -> ChunkRenderer:
+        """Inline or pipelined enhancement for one engine."""
+        options = engine.options
+        if options.enhance_workers and options.enhance_level == "chunk":
+            return PipelinedChunkRenderer(
+                engine, options.enhance_workers
+            )
+        return ChunkRenderer(engine)
@@ -0,0 +1,64 @@
+"""
+Resumable Work - Journal-backed encoding of one work.
+"""
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from modules.tts.domain.audio.raw_pcm_file import RawPcmFile
+from modules.tts.storage.work_journal import ENCODED, WorkJournal
+from modules.tts.domain.text.pause_tokens import Chunk
+from modules.tts.domain.text.chunk_hash import chunk_hash
+from .chunk_renderer import ProgressCallback
+from .journaled_renderer import JournaledRenderer
+
+
+class ResumableWork:
+    """Skip finished works and continue partial ones."""
+
+    def __init__(self, journal: WorkJournal, work_dir: Path):
+        self.journal = journal
+        self.log_path = work_dir / "work.pcm"
+        self.work_dir = work_dir
+
+    def encode(
+        self,
+        encoder,
+        renderer,
+        chunks: List[Chunk],
+        on_chunk: Optional[ProgressCallback] = None,
+        wrap: Callable = lambda renderer: renderer
+    ) -> str:
+        """
+        Return the MP3, rendering only what is missing.
+
+        Wrap decorates the journaled renderer, so the PCM log
+        always holds raw chunk audio. Chunk hashes include the
+        renderer's signature, so changing the voice or its
+        settings starts the work over.
+        """
+        hashes = [chunk_hash(c, renderer.signature) for c in chunks]
+        finished = self.journal.completed_output(hashes)
+        if finished:
+            return finished
+
+        done, offset = self.journal.resume_point(hashes)
+        if self._logged_bytes() < offset:
+            done, offset = 0, 0
+        self.journal.begin(hashes, done)
+        log = RawPcmFile(self.log_path, keep_bytes=offset)
+
+        journaled = JournaledRenderer(
+            renderer, self.journal, log, done
+        )
+        mp3_file = encoder.encode(
+            wrap(journaled), chunks, self.work_dir, on_chunk
+        )
+        self.journal.mark(ENCODED, output_file=mp3_file)
+        log.discard()
+        return mp3_file
+
+    def _logged_bytes(self) -> int:
+        """Size of the PCM log left by an earlier run."""
+        if not self.log_path.exists():
+            return 0
+        return self.log_path.stat().st_size
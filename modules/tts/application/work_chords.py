@@ -0,0 +1,71 @@
+"""
+Work Chords - Build the Celery chord for one work.
+"""
+from dataclasses import asdict
+from pathlib import Path
+from typing import List
+
+from celery import chord, group
+from celery.result import AsyncResult
+
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.enhanced_text_processor import (
+    EnhancedTextProcessor
+)
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.manifest import Work
+from modules.tts.domain.text.pause_tokens import Chunk, to_markup
+from modules.tts.domain.work.work_processor import WorkExtractor
+
+
+class WorkChords:
+    """
+    A group of chunk tasks with a merge callback per work.
+
+    The tasks are injected (anything with ``.s()``), so
+    this layer never imports the Celery app. The output
+    directory must be shared with the workers.
+    """
+
+    def __init__(
+        self,
+        synthesize,
+        merge,
+        extractor: WorkExtractor,
+        output: str,
+        language: str,
+        options: EngineOptions
+    ):
+        self.synthesize = synthesize
+        self.merge = merge
+        self.extractor = extractor
+        self.output_dir = Path(output)
+        self.language = language
+        self.options = options
+        self.processor = EnhancedTextProcessor()
+        self.signature = TTSEngine(
+            language, options=options
+        ).render_signature()
+
+    def prepare(self, work: Work) -> List[Chunk]:
+        """Save the work text and return its chunks."""
+        text = self.extractor.extract(work)
+        self.extractor.save_work(work, self.output_dir, text)
+        return self.processor.prepare_work_text(
+            text, add_title_pause=True
+        )
+
+    def send(self, work: Work, chunks: List[Chunk]) -> AsyncResult:
+        """Queue every chunk, merged into work.mp3 at the end."""
+        work_dir = self.output_dir / work.folder_name
+        header = group(
+            self.synthesize.s(
+                to_markup(chunk), f"{i:05d}", self.language,
+                str(work_dir / "chunks"), asdict(self.options)
+            )
+            for i, chunk in enumerate(chunks)
+        )
+        return chord(header)(self.merge.s(
+            work.folder_name,
+            output_path=str(work_dir / "work.mp3")
+        ))
@@ -0,0 +1,47 @@
+"""
+Work Encoders - Stream rendered chunks into the work MP3.
+"""
+from pathlib import Path
+from typing import List, Optional
+
+from modules.tts.domain.audio.metered_sink import MeteredSink
+from modules.tts.domain.audio.mp3_stream_encoder import (
+    Mp3StreamEncoder
+)
+from modules.tts.domain.text.pause_tokens import Chunk
+from .chunk_renderer import ProgressCallback
+from .encoded_output import count_output
+
+
+class StreamingWorkEncoder:
+    """Encode MP3 while the chunks are synthesized."""
+
+    def __init__(self, bitrate: str = "128k"):
+        self.bitrate = bitrate
+
+    def encode(
+        self,
+        renderer,
+        chunks: List[Chunk],
+        work_dir: Path,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> str:
+        """Render into an ffmpeg pipe and return the MP3."""
+        encoder = Mp3StreamEncoder(
+            work_dir / "work.mp3",
+            renderer.sample_rate,
+            self.bitrate
+        )
+        metrics = renderer.metrics
+        try:
+            renderer.render(
+                chunks,
+                MeteredSink(encoder, metrics, "encode", False),
+                on_chunk
+            )
+        except BaseException:
+            encoder.abort()
+            raise
+        with metrics.timed("encode"):
+            mp3_file = encoder.finish()
+        return count_output(metrics, mp3_file)
@@ -0,0 +1,52 @@
+"""
+Work Encoding - Render and encode the chunks of one work.
+"""
+from pathlib import Path
+from typing import List, Optional
+
+from modules.tts.domain.manifest import Work
+from modules.tts.domain.text.pause_tokens import Chunk
+from modules.tts.storage.job_journal import JobJournal
+from .chunk_renderer import ProgressCallback
+from .resumable_work import ResumableWork
+from .work_enhancer import WorkEnhancingRenderer
+
+
+class WorkEncoding:
+    """Plain or journaled encoding, with optional work enhancement."""
+
+    def __init__(
+        self,
+        renderer,
+        encoder,
+        journal: Optional[JobJournal] = None,
+        enhance_work: bool = False
+    ):
+        self.renderer = renderer
+        self.encoder = encoder
+        self.journal = journal
+        self.enhance_work = enhance_work
+
+    def encode(
+        self,
+        work: Work,
+        chunks: List[Chunk],
+        work_dir: Path,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> str:
+        """Generate the work MP3 and return its path."""
+        wrap = WorkEnhancingRenderer.wrapper(self.enhance_work, work_dir)
+
+        if self.journal is None:
+            return self.encoder.encode(
+                wrap(self.renderer), chunks,
+                work_dir, on_chunk
+            )
+
+        resumable = ResumableWork(
+            self.journal.work(work.id), work_dir
+        )
+        return resumable.encode(
+            self.encoder, self.renderer, chunks,
+            on_chunk, wrap
+        )
@@ -0,0 +1,58 @@
+"""
+Work Enhancer - Enhance the whole work stream, then normalize.
+"""
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from modules.tts.domain.audio.enhancing_sink import EnhancingSink
+from modules.tts.domain.audio.pcm_sink import PcmSink
+from modules.tts.domain.text.pause_tokens import Chunk
+from .chunk_renderer import ProgressCallback
+
+
+class WorkEnhancingRenderer:
+    """Renderer wrapper that enhances at the work level."""
+
+    def __init__(self, renderer, work_dir: Path):
+        self.renderer = renderer
+        self.scratch = Path(work_dir) / "work.f32"
+
+    @staticmethod
+    def wrapper(enabled: bool, work_dir: Path) -> Callable:
+        """Wrap renderers for work_dir, or pass them through."""
+        if not enabled:
+            return lambda renderer: renderer
+        return lambda renderer: WorkEnhancingRenderer(
+            renderer, work_dir
+        )
+
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the wrapped renderer."""
+        return self.renderer.sample_rate
+
+    @property
+    def cache_stats(self):
+        """Cache counters of the wrapped renderer."""
+        return self.renderer.cache_stats
+
+    @property
+    def metrics(self):
+        """Stage timings of the wrapped renderer."""
+        return self.renderer.metrics
+
+    def render(
+        self,
+        chunks: List[Chunk],
+        sink: PcmSink,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> None:
+        """Render raw chunks through one enhancement pass."""
+        enhancing = EnhancingSink(
+            sink, self.sample_rate, self.scratch, self.metrics
+        )
+        try:
+            self.renderer.render(chunks, enhancing, on_chunk)
+            enhancing.finish()
+        finally:
+            enhancing.scratch.discard()
@@ -0,0 +1,34 @@
+"""
+Work Finalizer - Encode the spooled work audio to MP3.
+"""
+from pathlib import Path
+
+from modules.tts.domain.audio.mp3_stream_encoder import (
+    Mp3StreamEncoder
+)
+from modules.tts.domain.audio.pcm_spool import PcmSpool
+
+
+class WorkFinalizer:
+    """Produce the final work MP3 from a PCM spool."""
+
+    def __init__(self, bitrate: str = "128k"):
+        self.bitrate = bitrate
+
+    def finalize(self, spool: PcmSpool, work_dir: Path) -> str:
+        """
+        Pipe the spool's blocks into ffmpeg.
+
+        A spilled spool is read back in bounded blocks, so
+        encoding stays within the memory budget too.
+        """
+        encoder = Mp3StreamEncoder(
+            work_dir / "work.mp3", spool.sample_rate, self.bitrate
+        )
+        try:
+            for block in spool.iter_blocks():
+                encoder.write(block)
+        except BaseException:
+            encoder.abort()
+            raise
+        return encoder.finish()
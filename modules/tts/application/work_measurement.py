@@ -0,0 +1,33 @@
+"""
+Work Measurement - Time, cache and stage metrics of one work.
+"""
+import time
+from typing import Optional
+
+from .chunk_metrics import ChunkMetricsRecorder
+from .chunk_renderer import ProgressCallback
+from .work_result import WorkResult
+
+
+class WorkMeasurement:
+    """Started before a work renders, applied on any outcome."""
+
+    def __init__(
+        self,
+        renderer,
+        on_chunk: Optional[ProgressCallback] = None
+    ):
+        self.renderer = renderer
+        self.started = time.perf_counter()
+        self.cache_before = renderer.cache_stats
+        self.recorder = ChunkMetricsRecorder(renderer, on_chunk)
+
+    def apply(self, result: WorkResult) -> WorkResult:
+        """Fill in elapsed time, cache delta and metrics."""
+        result.elapsed = time.perf_counter() - self.started
+        result.cache_stats = (
+            self.renderer.cache_stats - self.cache_before
+        )
+        result.metrics = self.recorder.total
+        result.chunk_metrics = self.recorder.records
+        return result
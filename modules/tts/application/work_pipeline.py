@@ -0,0 +1,79 @@
+"""
+Work Pipeline - Synthesize one manifest work to MP3.
+"""
+from pathlib import Path
+from typing import Optional
+
+from modules.tts.domain.core.enhanced_text_processor import (
+    EnhancedTextProcessor
+)
+from modules.tts.domain.manifest import Work
+from modules.tts.domain.work.work_processor import WorkExtractor
+from modules.tts.storage.job_journal import JobJournal
+from .chunk_renderer import ProgressCallback
+from .work_encoders import StreamingWorkEncoder
+from .work_encoding import WorkEncoding
+from .work_measurement import WorkMeasurement
+from .work_result import WorkResult
+
+
+class WorkPipeline:
+    """Extract, synthesize, merge and encode a work."""
+
+    def __init__(
+        self,
+        renderer,
+        output_dir: Path,
+        on_chunk: Optional[ProgressCallback] = None,
+        encoder=None,
+        journal: Optional[JobJournal] = None,
+        enhance_work: bool = False
+    ):
+        """
+        Renderer: ChunkRenderer or ParallelChunkRenderer.
+        Encoder: streaming (default) or buffered output.
+        Journal: makes works resumable when given.
+        Enhance_work: one enhancement pass over the work
+        (the engine must then skip per-chunk enhancement).
+        """
+        self.renderer = renderer
+        self.output_dir = Path(output_dir)
+        self.on_chunk = on_chunk
+        self.encoding = WorkEncoding(
+            renderer, encoder or StreamingWorkEncoder(),
+            journal, enhance_work
+        )
+        self.processor = EnhancedTextProcessor()
+
+    def run(
+        self,
+        work: Work,
+        extractor: WorkExtractor
+    ) -> WorkResult:
+        """Process a work, capturing any failure."""
+        measurement = WorkMeasurement(self.renderer, self.on_chunk)
+        try:
+            mp3_file = self.process(
+                work, extractor, measurement.recorder
+            )
+            result = WorkResult.succeeded(work, mp3_file, 0.0)
+        except Exception as e:
+            result = WorkResult.failed(work, str(e))
+        return measurement.apply(result)
+
+    def process(
+        self,
+        work: Work,
+        extractor: WorkExtractor,
+        on_chunk: Optional[ProgressCallback] = None
+    ) -> str:
+        """Generate the work MP3 and return its path."""
+        on_chunk = on_chunk or self.on_chunk
+        text = extractor.extract(work)
+        extractor.save_work(work, self.output_dir, text)
+        work_dir = self.output_dir / work.folder_name
+
+        chunks = self.processor.prepare_work_text(
+            text, add_title_pause=True
+        )
+        return self.encoding.encode(work, chunks, work_dir, on_chunk)
@@ -0,0 +1,67 @@
+"""
+Work Pool - One process pool pass over a list of works.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Tuple
+
+from modules.tts.domain.manifest import Work
+from .work_result import WorkResult
+from .work_worker import init_worker, run_work
+
+ResultCallback = Callable[[WorkResult], None]
+
+
+class WorkPool:
+    """Submit works to warm worker processes."""
+
+    def __init__(
+        self,
+        workers: int,
+        language: str,
+        source_file: str,
+        output: str,
+        encoder=None,
+        cache=None,
+        journal=None,
+        options=None,
+        source_stamp=None
+    ):
+        self.workers = workers
+        self.initargs = (
+            language, source_file, cache, options, source_stamp
+        )
+        self.jobargs = (output, encoder, journal)
+
+    def execute(
+        self,
+        works: List[Work],
+        on_result: ResultCallback
+    ) -> Tuple[List[WorkResult], List[Work]]:
+        """
+        Run works in submission order.
+
+        Returns finished results and the works that were
+        interrupted by a crashed worker process.
+        """
+        results, interrupted = [], []
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=self.initargs
+        ) as pool:
+            futures = {
+                pool.submit(run_work, w, *self.jobargs): w
+                for w in works
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    interrupted.append(futures[future])
+                    continue
+                results.append(result)
+                on_result(result)
+
+        return results, interrupted
@@ -0,0 +1,61 @@
+"""
+Work Result - Outcome of processing one work.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from modules.tts.domain.manifest import Work
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.storage.cache_stats import CacheStats
+
+
+@dataclass
+class WorkResult:
+    """Per-work status reported back to the CLI."""
+    work_id: int
+    title: str
+    success: bool
+    elapsed: float = 0.0
+    output_file: str = ""
+    error: str = ""
+    cache_stats: CacheStats = field(default_factory=CacheStats)
+    metrics: StageMetrics = field(default_factory=StageMetrics)
+    chunk_metrics: List[Dict] = field(default_factory=list)
+
+    @property
+    def real_time_factor(self) -> float:
+        """Wall time per second of audio produced."""
+        audio = self.metrics.audio_seconds
+        return self.elapsed / audio if audio else 0.0
+
+    @classmethod
+    def succeeded(
+        cls,
+        work: Work,
+        output_file: str,
+        elapsed: float
+    ) -> 'WorkResult':
+        """Build a success result for a work."""
+        return cls(
+            work_id=work.id,
+            title=work.title,
+            success=True,
+            elapsed=elapsed,
+            output_file=output_file
+        )
+
+    @classmethod
+    def failed(
+        cls,
+        work: Work,
+        error: str,
+        elapsed: float = 0.0
+    ) -> 'WorkResult':
+        """Build a failure result for a work."""
+        return cls(
+            work_id=work.id,
+            title=work.title,
+            success=False,
+            elapsed=elapsed,
+            error=error
+        )
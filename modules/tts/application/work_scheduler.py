@@ -0,0 +1,23 @@
+"""
+Work Scheduler - Order works for parallel execution.
+"""
+from typing import List
+
+from modules.tts.domain.manifest import Work
+
+
+class WorkScheduler:
+    """Schedule the longest works first."""
+
+    @staticmethod
+    def largest_first(works: List[Work]) -> List[Work]:
+        """
+        Sort by estimated size, descending.
+
+        Starting long works early keeps the tail short
+        when the pool drains. Ties keep manifest order.
+        """
+        return sorted(
+            works,
+            key=lambda w: (-w.estimated_lines, w.id)
+        )
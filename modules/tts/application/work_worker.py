@@ -0,0 +1,51 @@
+"""
+Work Worker - Process-local state for pool workers.
+
+Each worker process loads the Piper voice once in
+its initializer and reuses it for every work.
+"""
+from pathlib import Path
+from typing import Optional
+
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.manifest import Work
+from modules.tts.domain.work.source_stamp import SourceStamp
+from modules.tts.domain.work.work_processor import WorkExtractor
+from modules.tts.storage.synthesis_cache import SynthesisCache
+from .renderer_factory import RendererFactory
+from .work_pipeline import WorkPipeline
+from .work_result import WorkResult
+
+_engine: Optional[TTSEngine] = None
+_extractor: Optional[WorkExtractor] = None
+
+
+def init_worker(
+    language: str,
+    source_file: str,
+    cache: Optional[SynthesisCache] = None,
+    options: Optional[EngineOptions] = None,
+    source_stamp: Optional[SourceStamp] = None
+) -> None:
+    """Warm up the voice and source text for this process."""
+    global _engine, _extractor
+    _engine = TTSEngine(language, cache, options)
+    _engine.load_model()
+    _extractor = WorkExtractor(source_file, source_stamp)
+
+
+def run_work(
+    work: Work,
+    output: str,
+    encoder=None,
+    journal=None
+) -> WorkResult:
+    """Process one work with the warm engine."""
+    renderer = RendererFactory.for_engine(_engine)
+    pipeline = WorkPipeline(
+        renderer, Path(output),
+        encoder=encoder, journal=journal,
+        enhance_work=_engine.options.enhance_level == "work"
+    )
+    return pipeline.run(work, _extractor)
@@ -0,0 +1,76 @@
+"""
+Benchmark: per-phrase Piper calls vs padded ONNX batches.
+
+Usage:
+    python -m modules.tts.benchmarks.bench_batch_inference \\
+        boocks/franz-kafka.txt --chars 20000 --language es_MX
+"""
+import argparse
+import time
+
+from modules.tts.domain.core.batch_synthesizer import (
+    BatchSynthesizer
+)
+from modules.tts.domain.core.enhanced_text_processor import (
+    EnhancedTextProcessor
+)
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.synthesis_settings import (
+    synthesis_config
+)
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.text.pause_tokens import Pause
+
+
+def load_phrases(path: str, chars: int):
+    """Phrases between silence markers, as the engine sees them."""
+    with open(path, encoding='utf-8') as f:
+        text = f.read(chars)
+    chunks = EnhancedTextProcessor().prepare_work_text(text)
+    return [
+        token.strip()
+        for chunk in chunks for token in chunk
+        if not isinstance(token, Pause) and token.strip()
+    ]
+
+
+def timed(label: str, phrases, synthesize) -> None:
+    """Print phrases/sec for one strategy."""
+    started = time.perf_counter()
+    audio = synthesize(phrases)
+    elapsed = time.perf_counter() - started
+    samples = sum(len(a) for a in audio)
+    print(
+        f"{label:<14} {len(phrases) / elapsed:8.1f} phrases/s "
+        f"{elapsed:7.2f}s  {samples} samples"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('source')
+    parser.add_argument('--chars', type=int, default=20000)
+    parser.add_argument('--language', default='es_MX')
+    parser.add_argument('--sizes', default='4,8,16,32')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    engine = TTSEngine(
+        language=args.language,
+        options=EngineOptions(batch_size=max(sizes))
+    )
+    engine.load_model()
+    config = synthesis_config()
+    phrases = load_phrases(args.source, args.chars)
+    print(f"{len(phrases)} phrases")
+
+    timed("per-phrase", phrases,
+          lambda p: [engine.phrases().run(t) for t in p])
+    for size in sizes:
+        batcher = BatchSynthesizer(engine.voice, size)
+        timed(f"batch={size}", phrases,
+              lambda p: batcher.synthesize(p, config))
+
+
+if __name__ == '__main__':
+    main()
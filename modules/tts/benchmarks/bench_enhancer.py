@@ -0,0 +1,59 @@
+"""
+Benchmark: per-chunk enhancement, reference vs fused chain.
+
+Usage:
+    python -m modules.tts.benchmarks.bench_enhancer \\
+        --seconds 2,8,30 --runs 20
+"""
+import argparse
+import time
+
+import numpy as np
+
+from modules.tts.domain.audio.audio_enhancer import AudioEnhancer
+
+
+def chunk_audio(seconds: float, sample_rate: int) -> np.ndarray:
+    """Noise-modulated tone standing in for a speech chunk."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    audio = 0.3 * np.sin(2 * np.pi * 180 * t)
+    audio += 0.1 * np.sin(2 * np.pi * 6500 * t) * (t % 0.5 < 0.1)
+    audio += rng.normal(0, 0.03, len(t))
+    return (audio * 30000).astype(np.int16)
+
+
+def per_chunk_ms(enhance, samples, runs: int) -> float:
+    """Mean milliseconds per call."""
+    enhance(samples)
+    started = time.perf_counter()
+    for _ in range(runs):
+        enhance(samples)
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', default='2,8,30')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--sample-rate', type=int, default=22050)
+    args = parser.parse_args()
+
+    enhancer = AudioEnhancer(args.sample_rate)
+    print(f"{'chunk':>7} {'reference':>11} {'fused':>9} speedup")
+    for seconds in map(float, args.seconds.split(',')):
+        samples = chunk_audio(seconds, args.sample_rate)
+        before = per_chunk_ms(
+            enhancer.enhance_samples_reference, samples, args.runs
+        )
+        after = per_chunk_ms(
+            enhancer.enhance_samples, samples, args.runs
+        )
+        print(
+            f"{seconds:6.1f}s {before:9.2f}ms {after:7.2f}ms "
+            f"{before / after:6.2f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: manifest parsing on a synthetic collection.
+
+Compares the one-pass title map with the old per-title
+file scan (timed on a sample of titles, extrapolated).
+
+Usage:
+    python -m modules.tts.benchmarks.bench_manifest_parser \\
+        --megabytes 50 --works 2000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from modules.tts.domain.manifest.index_section import INDEX_END
+from modules.tts.domain.manifest.manifest_parser import (
+    ManifestParser
+)
+from .synthetic_collection import write_collection
+
+
+def legacy_start(parser: ManifestParser, title: str) -> int:
+    """The old resolver: two file scans per title."""
+    title_clean = title.upper().strip()
+    index_end_line = 0
+    for line_num, line in enumerate(parser.lines, 1):
+        if INDEX_END in line.strip():
+            index_end_line = line_num
+            break
+    for line_num, line in enumerate(parser.lines, 1):
+        if line_num <= index_end_line:
+            continue
+        line_clean = line.strip().upper()
+        if line_clean and line_clean == title_clean:
+            return line_num
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--megabytes', type=int, default=50)
+    parser.add_argument('--works', type=int, default=2000)
+    parser.add_argument('--legacy-titles', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        book = Path(tmp) / "collection.txt"
+        write_collection(book, args.megabytes, args.works)
+        size = book.stat().st_size / (1024 * 1024)
+
+        started = time.perf_counter()
+        manifest = ManifestParser(str(book)).parse()
+        elapsed = time.perf_counter() - started
+        print(
+            f"{size:.0f} MB, {manifest.total_works} works: "
+            f"one-pass parse {elapsed:.2f}s"
+        )
+
+        scanner = ManifestParser(str(book))
+        scanner._load_file()
+        titles = [w.title for w in manifest.works]
+        sample = titles[::max(1, len(titles) // args.legacy_titles)]
+        started = time.perf_counter()
+        for title in sample:
+            legacy_start(scanner, title)
+        per_title = (time.perf_counter() - started) / len(sample)
+        print(
+            f"old per-title scan {per_title:.3f}s/title, "
+            f"~{per_title * len(titles):.0f}s for all titles"
+        )
+
+
+if __name__ == "__main__":
+    main()
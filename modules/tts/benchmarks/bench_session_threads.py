@@ -0,0 +1,74 @@
+"""
+Benchmark: synthesis throughput vs. process/thread layout.
+
+Each layout "PxT" runs P worker processes with T intra-op
+threads per ONNX session over the same phrase list.
+
+Usage:
+    python -m modules.tts.benchmarks.bench_session_threads \\
+        boocks/franz-kafka.txt --layouts 1x4,2x2,4x1
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.tts_engine import TTSEngine
+from .bench_batch_inference import load_phrases
+
+_engine = None
+
+
+def _init(language: str, options: EngineOptions) -> None:
+    global _engine
+    _engine = TTSEngine(language, options=options)
+    _engine.load_model()
+
+
+def _synthesize(phrase: str) -> float:
+    samples = _engine.phrases().run(phrase)
+    return len(samples) / _engine.sample_rate
+
+
+def run_layout(args, phrases, processes, threads) -> None:
+    """Time one layout, excluding model load."""
+    options = EngineOptions(
+        intra_op_threads=threads,
+        optimization=args.optimization,
+        execution_mode=args.execution_mode
+    )
+    with ProcessPoolExecutor(
+        processes, initializer=_init,
+        initargs=(args.language, options)
+    ) as pool:
+        list(pool.map(_synthesize, phrases[:processes]))
+        started = time.perf_counter()
+        audio = sum(pool.map(_synthesize, phrases, chunksize=4))
+        elapsed = time.perf_counter() - started
+
+    print(
+        f"{processes}x{threads:<4} "
+        f"{len(phrases) / elapsed:8.1f} phrases/s "
+        f"{audio / elapsed:7.1f} audio-s/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('source')
+    parser.add_argument('--chars', type=int, default=20000)
+    parser.add_argument('--language', default='es_MX')
+    parser.add_argument('--layouts', default='1x1,1x2,2x1,2x2')
+    parser.add_argument('--optimization', default='all')
+    parser.add_argument('--execution-mode', default='sequential')
+    args = parser.parse_args()
+
+    phrases = load_phrases(args.source, args.chars)
+    print(f"{len(phrases)} phrases")
+    for layout in args.layouts.split(','):
+        processes, threads = map(int, layout.split('x'))
+        run_layout(args, phrases, processes, threads)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+"""
+Synthetic Collection - A large indexed book for benchmarks.
+"""
+from pathlib import Path
+
+PARAGRAPH = (
+    "Era una mañana gris y el señor K. caminaba despacio, "
+    "pensando en la carta que nunca llegó.\n"
+)
+
+
+def write_collection(path: Path, megabytes: int, works: int):
+    """Index of works followed by their bodies."""
+    titles = [f"Obra número {i:05d}" for i in range(works)]
+    body_lines = megabytes * 1024 * 1024 // works // len(
+        PARAGRAPH.encode()
+    )
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("ÍNDICE\n")
+        f.writelines(f"$ {t} (1912)\n" for t in titles)
+        f.write("FIN DEL ÍNDICE\n\n")
+        for title in titles:
+            f.write(f"\n{title.upper()}\n\n")
+            f.write(PARAGRAPH * body_lines)
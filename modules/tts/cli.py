@@ -5,6 +5,7 @@ import click
 
 from .commands import parse, process_work, process, test
 from .commands.process_all_cmd import process_all
+from .commands.bench_cmd import bench
 
 
 @click.group()
@@ -18,6 +19,7 @@ cli.add_command(process_work)
 cli.add_command(process_all)
 cli.add_command(process)
 cli.add_command(test)
+cli.add_command(bench)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,69 @@
+"""
+Bench Command - Per-stage throughput of the TTS pipeline.
+"""
+import json
+import tempfile
+from pathlib import Path
+
+import click
+
+from modules.tts.application.pipeline_benchmark import (
+    PipelineBenchmark
+)
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.stub_voice import StubVoice
+from modules.tts.domain.core.tts_engine import TTSEngine
+from .engine_flags import engine_flags
+
+
+@click.command()
+@click.option(
+    '--corpus', type=click.Path(exists=True),
+    default='boocks/america_small.txt',
+    help='Text to render'
+)
+@click.option(
+    '--scale', default=5, type=int,
+    help='Repeat the corpus this many times'
+)
+@click.option('--language', '-l', default='es_MX')
+@click.option(
+    '--stub-voice', is_flag=True,
+    help='Synthetic voice; runs without the Piper model'
+)
+@click.option(
+    '--json-file', type=click.Path(dir_okay=False),
+    help='Also write the report to this file'
+)
+@engine_flags
+def bench(
+    corpus: str,
+    scale: int,
+    language: str,
+    stub_voice: bool,
+    json_file: str,
+    engine_options: EngineOptions
+):
+    """Time text prep, synthesis, enhancement, merge, MP3."""
+    text = Path(corpus).read_text(encoding='utf-8')
+    text = "\n\n".join([text.strip()] * scale)
+
+    engine = TTSEngine(language, options=engine_options)
+    if stub_voice:
+        engine.voice = StubVoice()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        report = PipelineBenchmark(
+            engine, Path(work_dir), engine_options.enhance_level
+        ).run(text)
+
+    report = {
+        "corpus": corpus,
+        "scale": scale,
+        "voice": "stub" if stub_voice else str(engine.model_path),
+        **report
+    }
+    output = json.dumps(report, indent=2)
+    click.echo(output)
+    if json_file:
+        Path(json_file).write_text(output + "\n", encoding='utf-8')
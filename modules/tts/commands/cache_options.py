@@ -0,0 +1,39 @@
+"""
+Cache Options - Shared CLI flags for the synthesis cache.
+"""
+from typing import Optional
+
+import click
+
+from modules.tts.storage.synthesis_cache import (
+    DEFAULT_CACHE_DIR, SynthesisCache
+)
+
+MB = 1024 * 1024
+
+
+def cache_options(command):
+    """Add --cache-dir, --cache-size and --no-cache."""
+    command = click.option(
+        '--no-cache', is_flag=True,
+        help='Always synthesize, ignoring cached segments'
+    )(command)
+    command = click.option(
+        '--cache-size', default=2048, type=int,
+        help='Synthesis cache size limit in MB'
+    )(command)
+    return click.option(
+        '--cache-dir', default=DEFAULT_CACHE_DIR,
+        help='Synthesis cache directory'
+    )(command)
+
+
+def build_cache(
+    cache_dir: str,
+    cache_size: int,
+    no_cache: bool
+) -> Optional[SynthesisCache]:
+    """Cache for the run, or None when disabled."""
+    if no_cache:
+        return None
+    return SynthesisCache(cache_dir, cache_size * MB)
@@ -0,0 +1,55 @@
+"""
+Distributed Mode - process-all on Celery workers.
+"""
+import click
+from click.core import ParameterSource
+
+from modules.tts.application.work_chords import WorkChords
+from modules.tts.application.distributed_runner import (
+    DistributedWorkRunner
+)
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.work.work_processor import WorkExtractor
+
+# Local-run flags that Celery workers cannot honor
+LOCAL_ONLY = (
+    'workers', 'chunk_workers', 'encode', 'memory_budget',
+    'cache_dir', 'cache_size', 'no_cache', 'enhance_workers',
+)
+
+
+def check_distributed(options: EngineOptions) -> None:
+    """Refuse flags that --distributed would ignore."""
+    ctx = click.get_current_context()
+    for name in LOCAL_ONLY:
+        source = ctx.get_parameter_source(name)
+        if source not in (None, ParameterSource.DEFAULT):
+            raise click.BadParameter(
+                "not supported with --distributed",
+                param_hint=f"--{name.replace('_', '-')}"
+            )
+    if options.enhance_level == "work":
+        raise click.BadParameter(
+            "--distributed enhances per chunk",
+            param_hint='--enhance-level'
+        )
+
+
+def process_distributed(
+    works, manifest, output, language, options,
+    journal, on_result
+):
+    """Send one chord per work to the Celery workers."""
+    # The Celery app (and its broker config) loads only here
+    from modules.tts.tasks.tts_tasks import (
+        merge_chapter, synthesize_chunk
+    )
+    with WorkExtractor(
+        manifest.source_file, manifest.source_stamp
+    ) as extractor:
+        chords = WorkChords(
+            synthesize_chunk, merge_chapter, extractor,
+            output, language, options
+        )
+        runner = DistributedWorkRunner(chords, journal)
+        return runner.run(works, on_result)
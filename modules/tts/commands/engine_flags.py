@@ -0,0 +1,73 @@
+"""
+Engine Flags - Shared CLI flags for Piper inference tuning.
+
+Defaults come from the ORT_* environment (shared.config);
+the flags are folded into one ``engine_options`` argument.
+"""
+import functools
+
+import click
+
+from shared.config import onnx_config
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.session_factory import (
+    EXECUTION_MODES, OPTIMIZATION_LEVELS
+)
+from .enhance_flags import ENHANCE_FLAGS, check_enhance_workers
+
+ONNX_FLAGS = [
+    click.option(
+        '--batch-size', default=1, type=int,
+        help='Phrases per ONNX call (1 = one call per phrase)'
+    ),
+    click.option(
+        '--threads', 'intra_op_threads', type=int,
+        default=onnx_config.intra_op_threads,
+        help='Intra-op threads per session (0 = split cores)'
+    ),
+    click.option(
+        '--inter-threads', 'inter_op_threads', type=int,
+        default=onnx_config.inter_op_threads,
+        help='Inter-op threads per session'
+    ),
+    click.option(
+        '--optimization', default=onnx_config.optimization,
+        type=click.Choice(list(OPTIMIZATION_LEVELS)),
+        help='ONNX graph optimization level'
+    ),
+    click.option(
+        '--execution-mode', default=onnx_config.execution_mode,
+        type=click.Choice(list(EXECUTION_MODES)),
+        help='ONNX execution mode'
+    ),
+    click.option(
+        '--optimized-model-dir',
+        default=onnx_config.optimized_model_dir,
+        help='Cache of optimized models, e.g. .cache/onnx '
+             '(off by default)'
+    ),
+]
+
+
+def engine_flags(command):
+    """Add inference flags, passing engine_options instead."""
+    names = [
+        'batch_size', 'intra_op_threads', 'inter_op_threads',
+        'optimization', 'execution_mode',
+        'optimized_model_dir', 'enhance_level', 'enhance_workers'
+    ]
+
+    @functools.wraps(command)
+    def wrapper(**kwargs):
+        options = EngineOptions(
+            cpu_mem_arena=onnx_config.cpu_mem_arena,
+            **{name: kwargs.pop(name) for name in names}
+        )
+        check_enhance_workers(
+            options, kwargs.get('chunk_workers', 1)
+        )
+        return command(engine_options=options, **kwargs)
+
+    for flag in reversed(ONNX_FLAGS + ENHANCE_FLAGS):
+        wrapper = flag(wrapper)
+    return wrapper
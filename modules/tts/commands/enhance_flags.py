@@ -0,0 +1,37 @@
+"""
+Enhance Flags - CLI flags for where and how audio is enhanced.
+"""
+import click
+
+from modules.tts.domain.core.engine_options import EngineOptions
+
+ENHANCE_FLAGS = [
+    click.option(
+        '--enhance-level', default='chunk',
+        type=click.Choice(['chunk', 'work']),
+        help='Enhance each chunk, or the whole work at once'
+    ),
+    click.option(
+        '--enhance-workers', default=0, type=int,
+        help='Threads enhancing chunks during synthesis (0 = inline)'
+    ),
+]
+
+
+def check_enhance_workers(
+    options: EngineOptions,
+    chunk_workers: int
+) -> None:
+    """Refuse --enhance-workers where it would be ignored."""
+    if not options.enhance_workers:
+        return
+    if options.enhance_level != "chunk":
+        raise click.BadParameter(
+            "needs --enhance-level chunk",
+            param_hint='--enhance-workers'
+        )
+    if chunk_workers > 1:
+        raise click.BadParameter(
+            "use either --chunk-workers or --enhance-workers",
+            param_hint='--enhance-workers'
+        )
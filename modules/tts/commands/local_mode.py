@@ -0,0 +1,57 @@
+"""
+Local Mode - process-all in this process or a local pool.
+"""
+from pathlib import Path
+
+import click
+
+from modules.tts.application.parallel_runner import (
+    ParallelWorkRunner
+)
+from modules.tts.application.work_pipeline import WorkPipeline
+from modules.tts.application.work_pool import WorkPool
+from modules.tts.domain.work.work_processor import WorkExtractor
+from .work_progress import echo_result, progress
+
+
+def process_sequential(
+    works, manifest, output, renderer, encoder,
+    journal, on_done, enhance_work
+):
+    """Process works one by one with a shared renderer."""
+    pipeline = WorkPipeline(
+        renderer, Path(output),
+        encoder=encoder, journal=journal,
+        enhance_work=enhance_work
+    )
+    extractor = WorkExtractor(
+        manifest.source_file, manifest.source_stamp
+    )
+    results = []
+
+    try:
+        for i, work in enumerate(works, 1):
+            click.echo(f"\n[{i}/{len(works)}] {work.title}")
+            result = pipeline.run(work, extractor)
+            echo_result(result)
+            on_done(result)
+            results.append(result)
+    finally:
+        renderer.close()
+        extractor.close()
+
+    return results
+
+
+def process_parallel(
+    works, manifest, output, language, workers, encoder,
+    cache, journal, on_done, options
+):
+    """Process works largest-first in a process pool."""
+    pool = WorkPool(
+        workers, language, manifest.source_file,
+        output, encoder, cache, journal, options,
+        manifest.source_stamp
+    )
+    runner = ParallelWorkRunner(pool)
+    return runner.run(works, progress(len(works), on_done))
@@ -0,0 +1,51 @@
+"""
+Metrics Report - Real-time-factor table of a run.
+"""
+from typing import List
+
+import click
+
+from modules.tts.application.work_result import WorkResult
+from modules.tts.domain.core.stage_metrics import (
+    STAGES, StageMetrics
+)
+
+HEADERS = {
+    "synthesis": "synth", "enhancement": "enhance",
+    "merge": "merge", "encode": "encode",
+}
+
+
+def echo_metrics_table(
+    results: List[WorkResult],
+    elapsed: float
+) -> None:
+    """
+    Per-work audio, wall time, RTF and stage seconds.
+
+    The total row uses the run's own wall time; works
+    that ran at once would overstate it if summed.
+    """
+    stages = "".join(f" {HEADERS[s]:>7}" for s in STAGES)
+    click.echo(
+        f"\n{'work':<24} {'audio':>8} {'wall':>8} {'rtf':>6}"
+        + stages
+    )
+    total = StageMetrics()
+    for r in sorted(results, key=lambda r: r.work_id):
+        total += r.metrics
+        label = f"#{r.work_id} {r.title}"
+        click.echo(_row(label, r.metrics, r.elapsed))
+    click.echo(_row("total", total, elapsed))
+
+
+def _row(label: str, metrics: StageMetrics, elapsed: float) -> str:
+    audio = metrics.audio_seconds
+    rtf = f"{elapsed / audio:6.3f}" if audio else f"{'-':>6}"
+    stages = "".join(
+        f" {metrics.seconds.get(s, 0.0):7.1f}" for s in STAGES
+    )
+    return (
+        f"{label[:24]:<24} {audio:7.0f}s {elapsed:7.1f}s "
+        f"{rtf}{stages}"
+    )
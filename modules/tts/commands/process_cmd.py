@@ -5,17 +5,21 @@ import click
 from pathlib import Path
 import json
 
-from modules.tts.domain.core.tts_engine import TTSEngine
-from modules.tts.domain.core.enhanced_text_processor import (
-    EnhancedTextProcessor
-)
 from modules.tts.domain.work.work_processor import WorkExtractor
 from modules.tts.domain.manifest.manifest import Manifest
-from modules.tts.domain.audio.wav_merger import WavMerger
-from modules.tts.domain.audio.mp3_converter import Mp3Converter
-from modules.tts.domain.audio.silence_generator import (
-    SilenceGenerator
+from modules.tts.application.work_pipeline import WorkPipeline
+from modules.tts.application.renderer_factory import (
+    RendererFactory
+)
+from modules.tts.storage.job_journal import JobJournal
+from .cache_options import build_cache, cache_options
+from modules.tts.domain.core.engine_options import EngineOptions
+from .engine_flags import engine_flags
+from .metrics_report import echo_metrics_table
+from .run_logging import (
+    log_result, log_run, metrics_option, open_run_log
 )
+from .render_options import build_encoder, render_options
 
 
 @click.command()
@@ -23,29 +27,71 @@ from modules.tts.domain.audio.silence_generator import (
 @click.argument('work_id', type=int)
 @click.option('--output', '-o', default='outputs/works')
 @click.option('--language', '-l', default='es_MX')
+@render_options
+@metrics_option
+@cache_options
+@engine_flags
 def process_work(
-    manifest_file: str, 
-    work_id: int, 
+    manifest_file: str,
+    work_id: int,
     output: str,
-    language: str
+    language: str,
+    chunk_workers: int,
+    encode: str,
+    memory_budget: int,
+    fresh: bool,
+    metrics_log: str,
+    cache_dir: str,
+    cache_size: int,
+    no_cache: bool,
+    engine_options: EngineOptions
 ):
     """Process single work to audio."""
     manifest = _load_manifest(manifest_file)
     work = _find_work(manifest, work_id)
-    
+
     if not work:
         click.echo(f"Work #{work_id} not found")
         return
-    
+
     click.echo(f"Processing: {work.title}")
-    
-    extractor = WorkExtractor(manifest.source_file)
-    output_dir = Path(output)
-    
-    work_file = extractor.save_work(work, output_dir)
-    click.echo(f"Extracted: {work_file}")
-    
-    _synthesize_work(work, extractor, output_dir, language)
+
+    extractor = WorkExtractor(
+        manifest.source_file, manifest.source_stamp
+    )
+    cache = build_cache(cache_dir, cache_size, no_cache)
+    renderer = RendererFactory.create(
+        language, chunk_workers, cache,
+        engine_options.for_processes(chunk_workers)
+    )
+
+    try:
+        pipeline = WorkPipeline(
+            renderer, Path(output),
+            on_chunk=_echo_progress,
+            encoder=build_encoder(encode, memory_budget),
+            journal=JobJournal.for_manifest(
+                manifest_file, output, fresh
+            ),
+            enhance_work=engine_options.enhance_level == "work"
+        )
+        result = pipeline.run(work, extractor)
+    finally:
+        renderer.close()
+        extractor.close()
+
+    if result.success:
+        click.echo(f"Complete: {result.output_file}")
+    else:
+        click.echo(f"Error: {result.error}")
+
+    if cache:
+        click.echo(result.cache_stats.summary())
+
+    run_log = open_run_log(metrics_log, output)
+    log_result(run_log, result)
+    log_run(run_log, [result], result.elapsed)
+    echo_metrics_table([result], result.elapsed)
 
 
 def _load_manifest(path: str) -> Manifest:
@@ -59,64 +105,6 @@ def _find_work(manifest: Manifest, work_id: int):
     return next((w for w in manifest.works if w.id == work_id), None)
 
 
-def _synthesize_work(work, extractor, output_dir, language):
-    """Generate and merge audio."""
-    work_dir = output_dir / work.folder_name
-    
-    processor = EnhancedTextProcessor()
-    text = extractor.extract(work)
-    chunks = processor.prepare_work_text(text, add_title_pause=True)
-    
-    click.echo(f"Chunks: {len(chunks)}")
-    
-    _generate_chunks(chunks, work_dir, language)
-    _merge_audio(work_dir)
-
-
-def _generate_chunks(chunks, work_dir, language):
-    """Generate TTS audio chunks with silence support."""
-    engine = TTSEngine(language=language)
-    silence_gen = SilenceGenerator()
-    
-    for i, chunk in enumerate(chunks):
-        click.echo(f"[{i+1}/{len(chunks)}]")
-        
-        if chunk.startswith('<silence:'):
-            duration = float(chunk.split(':')[1].rstrip('>'))
-            silence_gen.generate_silence(
-                duration,
-                str(work_dir / f"chunk_{i:03d}.wav")
-            )
-        else:
-            engine.synthesize(chunk, str(work_dir / f"chunk_{i:03d}.wav"))
-
-
-def _merge_audio(work_dir):
-    """Merge chunks and convert to MP3."""
-    click.echo("Merging...")
-    
-    merger = WavMerger()
-    chunks = sorted(work_dir.glob("chunk_*.wav"))
-    wav_file = work_dir / "work.wav"
-    
-    merger.merge(
-        input_files=[str(f) for f in chunks],
-        output_file=str(wav_file)
-    )
-    
-    click.echo("Converting to MP3...")
-    converter = Mp3Converter(bitrate="128k")
-    mp3_file = converter.convert(
-        wav_path=str(wav_file),
-        cleanup=True
-    )
-    
-    if mp3_file:
-        click.echo("Cleaning temp files...")
-        converter.cleanup_chunks(work_dir)
-        click.echo(f"Complete: {mp3_file}")
-    else:
-        click.echo(f"Warning: MP3 conversion failed. WAV: {wav_file}")
-
-
-
+def _echo_progress(done: int, total: int) -> None:
+    """Print chunk progress."""
+    click.echo(f"[{done}/{total}]")
@@ -0,0 +1,35 @@
+"""
+Render Options - Shared CLI flags for rendering works.
+"""
+import click
+
+from modules.tts.application.encoder_factory import (
+    ENCODE_MODES, EncoderFactory
+)
+from .cache_options import MB
+
+
+def render_options(command):
+    """Add --chunk-workers, --encode, --memory-budget, --fresh."""
+    command = click.option(
+        '--fresh', is_flag=True,
+        help='Discard saved progress and start over'
+    )(command)
+    command = click.option(
+        '--memory-budget', default=512, type=int,
+        help='MB of audio kept in RAM with --encode buffered'
+    )(command)
+    command = click.option(
+        '--encode', type=click.Choice(ENCODE_MODES),
+        default='stream',
+        help='Stream MP3 during synthesis or encode at the end'
+    )(command)
+    return click.option(
+        '--chunk-workers', default=1, type=int,
+        help='Synthesize chunks of each work in parallel'
+    )(command)
+
+
+def build_encoder(encode: str, memory_budget: int):
+    """Encoder for the chosen --encode mode."""
+    return EncoderFactory.create(encode, memory_budget * MB)
@@ -0,0 +1,57 @@
+"""
+Run Logging - JSONL records of works and whole runs.
+"""
+from pathlib import Path
+from typing import List, Optional
+
+import click
+
+from modules.tts.application.work_result import WorkResult
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.storage.run_log import RunLog
+
+
+def metrics_option(command):
+    """Add --metrics-log."""
+    return click.option(
+        '--metrics-log', type=click.Path(dir_okay=False),
+        help='JSONL run log (default: <output>/metrics.jsonl)'
+    )(command)
+
+
+def open_run_log(path: Optional[str], output: str) -> RunLog:
+    """Run log at the given path or beside the outputs."""
+    return RunLog(Path(path or Path(output) / "metrics.jsonl"))
+
+
+def log_result(run_log: RunLog, result: WorkResult) -> None:
+    """One line per rendered chunk, then the work line."""
+    for record in result.chunk_metrics:
+        run_log.write("chunk", work_id=result.work_id, **record)
+    run_log.write(
+        "work",
+        work_id=result.work_id,
+        title=result.title,
+        success=result.success,
+        elapsed=round(result.elapsed, 3),
+        real_time_factor=round(result.real_time_factor, 4),
+        **result.metrics.to_dict()
+    )
+
+
+def log_run(
+    run_log: RunLog,
+    results: List[WorkResult],
+    elapsed: float
+) -> None:
+    """Closing line with the run totals and wall time."""
+    total = sum((r.metrics for r in results), StageMetrics())
+    audio = total.audio_seconds
+    run_log.write(
+        "run",
+        works=len(results),
+        failed=sum(not r.success for r in results),
+        elapsed=round(elapsed, 3),
+        real_time_factor=round(elapsed / audio, 4) if audio else 0,
+        **total.to_dict()
+    )
@@ -8,10 +8,8 @@ from modules.tts.domain.core.tts_engine import TTSEngine
 from modules.tts.domain.core.enhanced_text_processor import (
     EnhancedTextProcessor
 )
-from modules.tts.domain.audio.silence_generator import (
-    SilenceGenerator
-)
-from modules.tts.domain.audio.wav_merger import WavMerger
+from modules.tts.domain.audio.pcm_io import PcmIO
+from modules.tts.application.chunk_renderer import ChunkRenderer
 
 
 @click.command()
@@ -31,29 +29,13 @@ def test(text: str, language: str):
         add_title_pause=False
     )
     
-    # Generate chunks
-    engine = TTSEngine(language=language)
-    silence_gen = SilenceGenerator()
-    
-    chunk_files = []
-    for i, chunk in enumerate(chunks):
-        chunk_path = output_dir / f"test_chunk_{i:03d}.wav"
-        
-        if chunk.startswith('<silence:'):
-            duration = float(chunk.split(':')[1].rstrip('>'))
-            silence_gen.generate_silence(duration, str(chunk_path))
-        else:
-            engine.synthesize(chunk, str(chunk_path))
-        
-        chunk_files.append(str(chunk_path))
+    # Render speech and shared silence buffers in order
+    renderer = ChunkRenderer(TTSEngine(language=language))
+    blocks = [renderer.render_one(chunk) for chunk in chunks]
     
-    # Merge all chunks
-    merger = WavMerger()
     output_path = output_dir / "quick_test.wav"
-    merger.merge(chunk_files, str(output_path))
-    
-    # Cleanup chunks
-    for chunk_file in chunk_files:
-        Path(chunk_file).unlink()
+    PcmIO.write_wav(
+        str(output_path), blocks, renderer.sample_rate
+    )
     
     click.echo(f"Audio: {output_path}")
@@ -0,0 +1,58 @@
+"""
+Work Progress - Report finished works as they arrive.
+"""
+from pathlib import Path
+
+import click
+
+from .run_logging import log_result
+
+
+def progress(total, on_done):
+    """Print results as they arrive out of order."""
+    done = []
+
+    def on_result(result):
+        done.append(result)
+        click.echo(f"\n[{len(done)}/{total}] {result.title}")
+        echo_result(result)
+        on_done(result)
+
+    return on_result
+
+
+def result_recorder(manifest, manifest_file, run_log):
+    """Record each finished work in the manifest and run log."""
+    works = {w.id: w for w in manifest.works}
+
+    def on_done(result):
+        status = "encoded" if result.success else "failed"
+        works[result.work_id].status = status
+        manifest.save(Path(manifest_file))
+        log_result(run_log, result)
+
+    return on_done
+
+
+def echo_result(result):
+    """Print the outcome of one work."""
+    minutes, seconds = divmod(int(result.elapsed), 60)
+    if result.success:
+        click.echo(
+            f"  ✓ Complete: {result.output_file} "
+            f"({minutes}m{seconds:02d}s)"
+        )
+    else:
+        click.echo(f"  ✗ Error: {result.title} - {result.error}")
+
+
+def echo_summary(results):
+    """Print totals and list failed works."""
+    failed = [r for r in results if not r.success]
+
+    click.echo("\n" + "=" * 60)
+    click.echo(f"Completed: {len(results) - len(failed)}")
+    click.echo(f"Failed: {len(failed)}")
+
+    for result in sorted(failed, key=lambda r: r.work_id):
+        click.echo(f"  #{result.work_id} {result.title}")
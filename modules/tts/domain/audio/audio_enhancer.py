@@ -1,9 +1,7 @@
 import numpy as np
 import wave
-from pathlib import Path
-from .prosody_enhancer import ProsodyEnhancer
-from .intelligent_deesser import IntelligentDeEsser
-from .audio_filters import AudioFilters
+from .fused_enhancer import FusedEnhancer
+from .reference_enhancer import ReferenceEnhancer
 
 
 class AudioEnhancer:
@@ -12,11 +10,14 @@ class AudioEnhancer:
     best practices for maximum naturalness.
     """
     
-    def __init__(self):
-        self.sample_rate = 22050
-        self.prosody_enhancer = ProsodyEnhancer()
-        self.deesser = IntelligentDeEsser()
-        self.filters = AudioFilters()
+    def __init__(self, sample_rate: int = 22050):
+        self._set_rate(sample_rate)
+    
+    def _set_rate(self, sample_rate: int) -> None:
+        """Build the stages for a sample rate."""
+        self.sample_rate = sample_rate
+        self.reference = ReferenceEnhancer(sample_rate)
+        self.fused = FusedEnhancer(sample_rate)
     
     def enhance(
         self, 
@@ -28,27 +29,11 @@ class AudioEnhancer:
         with wave.open(input_path, 'rb') as wf:
             params = wf.getparams()
             frames = wf.readframes(params.nframes)
-            self.sample_rate = params.framerate
+            if params.framerate != self.sample_rate:
+                self._set_rate(params.framerate)
         
         samples = np.frombuffer(frames, dtype=np.int16)
-        audio = samples.astype(np.float32) / 32768.0
-        
-        # Modern enhancement chain
-        enhanced = self.filters.spectral_boost(audio)
-        enhanced = self.deesser.process(enhanced)
-        enhanced = self.filters.add_presence(enhanced)
-        
-        if add_prosody:
-            enhanced = self.prosody_enhancer.enhance(
-                enhanced,
-                add_micro_timing=True
-            )
-        
-        enhanced = self.filters.soft_limiter(enhanced)
-        enhanced = self.filters.normalize(enhanced)
-        
-        # Convert back to int16
-        samples_out = (enhanced * 32767).astype(np.int16)
+        samples_out = self.enhance_samples(samples, add_prosody)
         
         output = output_path or input_path
         with wave.open(output, 'wb') as wf:
@@ -56,3 +41,19 @@ class AudioEnhancer:
             wf.writeframes(samples_out.tobytes())
         
         return output
+    
+    def enhance_samples(
+        self,
+        samples: np.ndarray,
+        add_prosody: bool = True
+    ) -> np.ndarray:
+        """Apply the enhancement chain to int16 samples."""
+        return self.fused.process(samples, add_prosody)
+    
+    def enhance_samples_reference(
+        self,
+        samples: np.ndarray,
+        add_prosody: bool = True
+    ) -> np.ndarray:
+        """Stage-by-stage chain the fused one must match."""
+        return self.reference.process(samples, add_prosody)
@@ -0,0 +1,49 @@
+"""
+Audio Input - The kinds of chunk audio the mergers accept.
+"""
+import io
+import wave
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+AudioInput = Union[str, Path, bytes, np.ndarray]
+
+
+def wav_file(item: AudioInput):
+    """Path or file object that wave.open accepts."""
+    if isinstance(item, bytes):
+        return io.BytesIO(item)
+    return str(item)
+
+
+def native_rate(item: AudioInput) -> Optional[int]:
+    """Sample rate of a WAV input, if it has one."""
+    if isinstance(item, np.ndarray):
+        return None
+    try:
+        with wave.open(wav_file(item), 'rb') as wav:
+            return wav.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+
+def first_rate(items: Sequence[AudioInput], default: int) -> int:
+    """Rate of the first input that declares one."""
+    for item in items:
+        rate = native_rate(item)
+        if rate:
+            return rate
+    return default
+
+
+def describe(item: AudioInput, index: Optional[int]) -> str:
+    """Chunk number and kind of input, for error messages."""
+    if isinstance(item, bytes):
+        what = f"{len(item)} bytes of audio"
+    elif isinstance(item, np.ndarray):
+        what = f"{len(item)}-sample array"
+    else:
+        what = str(item)
+    return what if index is None else f"chunk {index} ({what})"
@@ -1,80 +1,74 @@
+"""
+Audio Merger - Stream chunks into one output file.
+"""
 from pathlib import Path
-from typing import List
-from pydub import AudioSegment
+from typing import Optional, Sequence
+
+from .audio_input import AudioInput, first_rate
+from .mp3_stream_encoder import Mp3StreamEncoder
+from .pcm_source import PcmSource
+from .wav_stream_writer import WavStreamWriter
+
+DEFAULT_SAMPLE_RATE = 22050
 
 
 class AudioMerger:
-    """Merge audio chunks into final output."""
+    """
+    Merge audio chunks into final output.
+    
+    Chunks are read block by block and written straight to
+    the WAV writer or MP3 encoder, so time is linear in the
+    total length and memory stays constant.
+    """
     
-    def __init__(self, format: str = "mp3"):
+    def __init__(self, format: str = "mp3", bitrate: str = "128k"):
+        if format not in ("mp3", "wav"):
+            raise ValueError(f"Unsupported format: {format}")
         self.format = format
+        self.bitrate = bitrate
     
     def merge_chunks(
         self,
-        chunk_paths: List[str],
-        output_path: str
+        chunks: Sequence[AudioInput],
+        output_path: str,
+        sample_rate: Optional[int] = None
     ) -> bool:
-        """Combine audio files sequentially."""
+        """
+        Combine audio sequentially.
+        
+        Chunks: file paths, WAV bytes or int16 arrays
+        (other dtypes are rejected, not truncated).
+        Sample_rate: defaults to the first WAV chunk's rate.
+        """
         try:
-            combined = self._load_and_combine(chunk_paths)
-            self._export_audio(combined, output_path)
+            rate = sample_rate or first_rate(
+                chunks, DEFAULT_SAMPLE_RATE
+            )
+            self._stream(chunks, output_path, rate)
             return True
         except Exception as e:
             print(f"Merge error: {e}")
             return False
     
-    def _load_and_combine(
-        self, 
-        paths: List[str]
-    ) -> AudioSegment:
-        """Load and concatenate audio chunks."""
-        combined = AudioSegment.empty()
-        
-        for path in paths:
-            chunk = AudioSegment.from_file(path)
-            combined += chunk
-        
-        return combined
-    
-    def _export_audio(
+    def _stream(
         self,
-        audio: AudioSegment,
-        output_path: str
-    ) -> None:
-        """Export merged audio to file."""
-        Path(output_path).parent.mkdir(
-            parents=True, 
-            exist_ok=True
-        )
-        
-        audio.export(
-            output_path,
-            format=self.format,
-            bitrate="128k"
-        )
-
-
-class ChapterMerger:
-    """Merge chapter chunks with metadata."""
-    
-    def __init__(self):
-        self.merger = AudioMerger()
-    
-    def merge_chapter(
-        self,
-        chunk_paths: List[str],
+        chunks: Sequence[AudioInput],
         output_path: str,
-        normalize: bool = True
-    ) -> bool:
-        """Merge with optional normalization."""
-        if normalize:
-            chunk_paths = self._normalize_chunks(chunk_paths)
-        
-        return self.merger.merge_chunks(chunk_paths, output_path)
+        rate: int
+    ) -> None:
+        """Copy every block of every chunk to the output."""
+        sink = self._open(Path(output_path), rate)
+        source = PcmSource(rate)
+        try:
+            for index, chunk in enumerate(chunks):
+                for block in source.blocks(chunk, index):
+                    sink.write(block)
+        except BaseException:
+            sink.abort()
+            raise
+        sink.finish()
     
-    def _normalize_chunks(
-        self, 
-        paths: List[str]
-    ) -> List[str]:
-        """Normalize audio levels (placeholder)."""
-        return paths
+    def _open(self, output_path: Path, rate: int):
+        if self.format == "wav":
+            return WavStreamWriter(output_path, rate)
+        return Mp3StreamEncoder(output_path, rate, self.bitrate)
@@ -0,0 +1,33 @@
+"""
+Chapter Merger - Merge one chapter's chunks into its file.
+"""
+from typing import Sequence
+
+from .audio_input import AudioInput
+from .audio_merger import AudioMerger
+
+
+class ChapterMerger:
+    """Merge chapter chunks with metadata."""
+    
+    def __init__(self):
+        self.merger = AudioMerger()
+    
+    def merge_chapter(
+        self,
+        chunk_paths: Sequence[AudioInput],
+        output_path: str,
+        normalize: bool = True
+    ) -> bool:
+        """Merge with optional normalization."""
+        if normalize:
+            chunk_paths = self._normalize_chunks(chunk_paths)
+        
+        return self.merger.merge_chunks(chunk_paths, output_path)
+    
+    def _normalize_chunks(
+        self, 
+        paths: Sequence[AudioInput]
+    ) -> Sequence[AudioInput]:
+        """Normalize audio levels (placeholder)."""
+        return paths
@@ -0,0 +1,44 @@
+"""
+Enhancement Coefficients - Filters designed once per rate.
+"""
+from functools import lru_cache
+
+import numpy as np
+from scipy import signal
+
+
+@lru_cache(maxsize=None)
+def clarity_highpass(sample_rate: int) -> np.ndarray:
+    """2nd-order 3kHz high-pass for the spectral boost."""
+    return signal.butter(
+        2, 3000, 'high', fs=sample_rate, output='sos'
+    )
+
+
+@lru_cache(maxsize=None)
+def presence_bandpass(sample_rate: int) -> np.ndarray:
+    """2nd-order 1-4kHz band-pass for vocal presence."""
+    return signal.butter(
+        2, [1000, 4000], 'bandpass', fs=sample_rate, output='sos'
+    )
+
+
+@lru_cache(maxsize=None)
+def limiter_kernel() -> np.ndarray:
+    """Normalized Hann smoothing kernel for the limiter."""
+    window = np.hanning(11)
+    return (window / window.sum()).astype(np.float32)
+
+
+@lru_cache(maxsize=None)
+def timing_window() -> np.ndarray:
+    """Normalized Hann window smoothing timing jitter."""
+    window = signal.windows.hann(441)
+    return window / window.sum()
+
+
+@lru_cache(maxsize=None)
+def sibilance_bins(sample_rate: int, nperseg: int) -> np.ndarray:
+    """STFT bin indices covering 5-10kHz."""
+    freqs = np.fft.rfftfreq(nperseg, 1 / sample_rate)
+    return np.where((freqs >= 5000) & (freqs <= 10000))[0]
@@ -0,0 +1,73 @@
+"""
+Enhancing Sink - Enhance a PCM stream, then normalize it.
+"""
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from ..core.stage_metrics import StageMetrics
+from .pcm_sink import PcmSink
+from .raw_pcm_file import RawPcmFile
+from .streaming_enhancer import StreamingEnhancer
+
+BLOCK_SAMPLES = 1 << 16
+TARGET_PEAK = 0.95
+
+
+class EnhancingSink:
+    """
+    First pass: enhance blocks into a float32 scratch file
+    while tracking the peak. Second pass: scale to the
+    target peak and hand int16 blocks to the real sink.
+    """
+
+    def __init__(
+        self,
+        sink: PcmSink,
+        rate: int,
+        scratch: Path,
+        metrics: Optional[StageMetrics] = None
+    ):
+        self.sink = sink
+        self.metrics = metrics or StageMetrics()
+        self.enhancer = StreamingEnhancer(rate)
+        self.scratch = RawPcmFile(scratch, dtype=np.float32)
+        self.buffered: List[np.ndarray] = []
+        self.size = 0
+        self.peak = 0.0
+
+    def write(self, samples: np.ndarray) -> None:
+        """Queue samples, enhancing whole blocks."""
+        self.buffered.append(samples)
+        self.size += len(samples)
+        if self.size >= BLOCK_SAMPLES:
+            self._enhance(np.concatenate(self.buffered))
+            self.buffered, self.size = [], 0
+
+    def finish(self) -> None:
+        """Drain the enhancer and emit normalized audio."""
+        if self.buffered:
+            self._enhance(np.concatenate(self.buffered))
+        with self.metrics.timed("enhancement"):
+            tail = self.enhancer.flush()
+        self._store(tail)
+
+        gain = 32767 * TARGET_PEAK / self.peak if self.peak else 0
+        for block in self.scratch.iter_blocks():
+            with self.metrics.timed("enhancement", len(block) * 2):
+                block = (block * gain).astype(np.int16)
+            self.sink.write(block)
+
+    def _enhance(self, samples: np.ndarray) -> None:
+        """Run one block through the enhancer."""
+        with self.metrics.timed("enhancement"):
+            audio = self.enhancer.process(samples)
+        self._store(audio)
+
+    def _store(self, audio: np.ndarray) -> None:
+        """Keep enhanced audio and update the peak."""
+        if len(audio):
+            self.peak = max(self.peak, float(np.abs(audio).max()))
+            with self.metrics.timed("merge", audio.nbytes):
+                self.scratch.write(audio)
@@ -0,0 +1,76 @@
+"""
+FFmpeg Decoder - Any audio input to int16 mono blocks.
+"""
+import subprocess
+import threading
+from typing import Iterator, Optional
+
+import numpy as np
+from pydub import AudioSegment
+
+from .audio_input import AudioInput, describe
+
+
+def decoded_blocks(
+    item: AudioInput,
+    sample_rate: int,
+    block_frames: int,
+    index: Optional[int] = None
+) -> Iterator[np.ndarray]:
+    """Decode through ffmpeg to s16le at sample_rate."""
+    data = item if isinstance(item, bytes) else None
+    source = "pipe:0" if data is not None else str(item)
+    process = subprocess.Popen(
+        [
+            AudioSegment.converter, "-loglevel", "error",
+            "-i", source, "-f", "s16le", "-ac", "1",
+            "-ar", str(sample_rate), "pipe:1"
+        ],
+        stdin=subprocess.PIPE if data is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    feeder = None
+    broken: list[BrokenPipeError] = []
+    if data is not None:
+        # Feed from a thread so a full stdout can't deadlock
+        feeder = threading.Thread(
+            target=_feed, args=(process.stdin, data, broken),
+            daemon=True
+        )
+        feeder.start()
+
+    finished = False
+    try:
+        while True:
+            raw = process.stdout.read(block_frames * 2)
+            if not raw:
+                break
+            yield np.frombuffer(raw, dtype=np.int16)
+        finished = True
+    finally:
+        if not finished:
+            process.kill()
+        if feeder:
+            feeder.join()
+        stderr = process.stderr.read()
+        process.stdout.close()
+        process.stderr.close()
+        process.wait()
+    if process.returncode != 0 or broken:
+        reason = stderr.decode().strip() or (
+            f"ffmpeg exited with status {process.returncode} "
+            "before reading all input"
+        )
+        raise RuntimeError(
+            f"Cannot decode {describe(item, index)}: {reason}"
+        )
+
+
+def _feed(pipe, data: bytes, broken: list) -> None:
+    """Write input to ffmpeg; a closed pipe goes in broken."""
+    try:
+        with pipe:
+            pipe.write(data)
+    except BrokenPipeError as error:
+        broken.append(error)
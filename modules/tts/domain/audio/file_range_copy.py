@@ -0,0 +1,50 @@
+"""
+File Range Copy - Append a byte range of one file to another.
+"""
+import errno
+import os
+
+COPY_BLOCK = 1 << 20
+
+# Kernel copy not offered for this pair of files or platform
+NO_FAST_PATH = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF,
+    errno.EOPNOTSUPP, errno.ENOTSUP, errno.ESPIPE,
+})
+
+
+def copy_range(src, dst, offset: int, count: int) -> None:
+    """Copy count bytes at offset from src to the end of dst."""
+    dst.flush()
+    try:
+        while count > 0:
+            copied = _kernel_copy(src.fileno(), dst.fileno(), offset, count)
+            if copied <= 0:
+                break
+            offset += copied
+            count -= copied
+    except OSError as error:
+        if error.errno not in NO_FAST_PATH:
+            raise
+        _user_copy(src, dst, offset, count)
+        return
+    _user_copy(src, dst, offset, count)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, offset: int, count: int):
+    """One in-kernel copy step; advances dst's offset."""
+    if hasattr(os, 'copy_file_range'):
+        return os.copy_file_range(src_fd, dst_fd, count, offset)
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _user_copy(src, dst, offset: int, count: int) -> None:
+    """Copy whatever the kernel left through Python buffers."""
+    dst.seek(0, os.SEEK_END)
+    src.seek(offset)
+    while count > 0:
+        block = src.read(min(COPY_BLOCK, count))
+        if not block:
+            raise ValueError("Input ended before its data size")
+        dst.write(block)
+        count -= len(block)
@@ -0,0 +1,36 @@
+"""
+Fused Stages - In-place float32 prosody and limiter steps.
+"""
+import numpy as np
+from scipy import signal
+
+from .enhancement_coefficients import limiter_kernel, timing_window
+
+
+def micro_timing(audio: np.ndarray) -> np.ndarray:
+    """Subtle timing variations (±2%)."""
+    jitter = np.random.uniform(0.98, 1.02, len(audio))
+    jitter = signal.oaconvolve(
+        jitter, timing_window(), mode='same'
+    )
+    idx = np.cumsum(jitter)
+    idx /= idx[-1]
+    idx *= len(audio) - 1
+    np.clip(idx, 0, len(audio) - 1, out=idx)
+    return audio[idx.astype(int)]
+
+
+def soft_limit(audio: np.ndarray) -> np.ndarray:
+    """Soft-knee limiter blended with the dry signal."""
+    compressed = audio.copy()
+    level = np.abs(audio)
+    over = level > 0.8
+    compressed[over] = np.sign(audio[over]) * (
+        0.8 + (level[over] - 0.8) / 4.0
+    )
+    smoothed = np.convolve(
+        compressed, limiter_kernel(), mode='same'
+    )
+    audio *= 0.3
+    audio += smoothed * 0.7
+    return audio
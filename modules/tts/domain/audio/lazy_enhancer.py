@@ -0,0 +1,41 @@
+"""
+Lazy Enhancer - One AudioEnhancer, built on first use.
+"""
+from typing import Optional
+
+import numpy as np
+
+from ..core.stage_metrics import StageMetrics
+from .audio_enhancer import AudioEnhancer
+
+
+class LazyEnhancer:
+    """
+    Enhancement that never fails a chunk.
+
+    Build it with load() before threads share it; errors
+    are reported and the audio passes through unchanged.
+    """
+
+    def __init__(self):
+        self.enhancer: Optional[AudioEnhancer] = None
+
+    def load(self, sample_rate: int) -> None:
+        """Build the enhancer once for the voice rate."""
+        if self.enhancer is None:
+            self.enhancer = AudioEnhancer(sample_rate)
+
+    def enhance(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        metrics: StageMetrics
+    ) -> np.ndarray:
+        """Enhanced copy of audio, timed into metrics."""
+        try:
+            self.load(sample_rate)
+            with metrics.timed("enhancement", audio.nbytes):
+                return self.enhancer.enhance_samples(audio)
+        except Exception as e:
+            print(f"Enhancement warning: {e}")
+            return audio
@@ -0,0 +1,36 @@
+"""
+Metered Sink - Charge sink writes to a pipeline stage.
+"""
+import time
+
+import numpy as np
+
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from .pcm_sink import PcmSink
+
+
+class MeteredSink:
+    """Forward samples, recording write time and bytes."""
+
+    def __init__(
+        self,
+        sink: PcmSink,
+        metrics: StageMetrics,
+        stage: str,
+        count_bytes: bool = True
+    ):
+        """Count_bytes: off when the stage output differs."""
+        self.sink = sink
+        self.metrics = metrics
+        self.stage = stage
+        self.count_bytes = count_bytes
+
+    def write(self, samples: np.ndarray) -> None:
+        """Write through to the wrapped sink."""
+        started = time.perf_counter()
+        self.sink.write(samples)
+        self.metrics.record(
+            self.stage,
+            time.perf_counter() - started,
+            samples.nbytes if self.count_bytes else 0
+        )
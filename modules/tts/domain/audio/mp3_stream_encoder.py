@@ -0,0 +1,69 @@
+"""
+MP3 Stream Encoder - Feed PCM blocks to ffmpeg as they arrive.
+"""
+import subprocess
+from pathlib import Path
+
+import numpy as np
+from pydub import AudioSegment
+
+
+class Mp3StreamEncoder:
+    """
+    Encode int16 mono PCM to MP3 through an ffmpeg pipe.
+
+    Encoding runs alongside synthesis and memory use stays
+    flat regardless of how long the work is.
+    """
+
+    def __init__(
+        self,
+        mp3_path: Path,
+        sample_rate: int,
+        bitrate: str = "128k"
+    ):
+        self.mp3_path = Path(mp3_path)
+        self.mp3_path.parent.mkdir(parents=True, exist_ok=True)
+        self.sample_rate = sample_rate
+        self.process = subprocess.Popen(
+            self._command(bitrate),
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+
+    def write(self, samples: np.ndarray) -> None:
+        """Send samples to the encoder in playback order."""
+        data = np.asarray(samples, dtype=np.int16).tobytes()
+        try:
+            self.process.stdin.write(data)
+        except BrokenPipeError:
+            self.abort()
+            raise RuntimeError("MP3 encoder exited early")
+
+    def finish(self) -> str:
+        """Flush the encoder and return the MP3 path."""
+        _, stderr = self.process.communicate()
+        if self.process.returncode != 0:
+            self.mp3_path.unlink(missing_ok=True)
+            raise RuntimeError(
+                f"MP3 encoding failed: {stderr.decode().strip()}"
+            )
+        return str(self.mp3_path)
+
+    def abort(self) -> None:
+        """Stop the encoder and drop the partial file."""
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.communicate()
+        self.mp3_path.unlink(missing_ok=True)
+
+    def _command(self, bitrate: str) -> list:
+        """ffmpeg arguments matching Mp3Converter output."""
+        return [
+            AudioSegment.converter, "-y", "-loglevel", "error",
+            "-f", "s16le", "-ar", str(self.sample_rate),
+            "-ac", "1", "-i", "pipe:0",
+            "-f", "mp3", "-acodec", "libmp3lame",
+            "-b:a", bitrate, "-q:a", "2",
+            str(self.mp3_path)
+        ]
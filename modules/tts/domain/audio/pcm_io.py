@@ -0,0 +1,38 @@
+"""
+PCM I/O - 16-bit mono WAV files <-> numpy samples.
+"""
+import wave
+from pathlib import Path
+from typing import Iterable, Tuple
+
+import numpy as np
+
+
+class PcmIO:
+    """Read and write int16 sample arrays as WAV."""
+
+    @staticmethod
+    def read_wav(path: str) -> Tuple[np.ndarray, tuple]:
+        """Load samples and WAV params from file."""
+        with wave.open(path, 'rb') as wf:
+            params = wf.getparams()
+            frames = wf.readframes(params.nframes)
+        return np.frombuffer(frames, dtype=np.int16), params
+
+    @staticmethod
+    def write_wav(
+        path: str,
+        blocks: Iterable[np.ndarray],
+        sample_rate: int
+    ) -> str:
+        """Write sample blocks sequentially to a WAV."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        with wave.open(path, 'wb') as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(sample_rate)
+            for block in blocks:
+                wf.writeframes(block.astype(np.int16).tobytes())
+
+        return path
@@ -0,0 +1,13 @@
+"""
+PCM Sink - Destination for rendered int16 samples.
+"""
+from typing import Protocol
+
+import numpy as np
+
+
+class PcmSink(Protocol):
+    """Anything that accepts samples in playback order."""
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append samples."""
@@ -0,0 +1,70 @@
+"""
+PCM Source - Stream int16 mono blocks from any audio input.
+"""
+import wave
+from typing import Iterator, Optional
+
+import numpy as np
+
+from .audio_input import AudioInput, describe, wav_file
+from .ffmpeg_decoder import decoded_blocks
+
+BLOCK_FRAMES = 1 << 16
+
+
+class PcmSource:
+    """
+    Read audio block by block at a fixed sample rate.
+
+    Inputs are file paths, WAV bytes, or int16 sample
+    arrays (assumed to be at the target rate already).
+    Mono 16-bit WAV at the target rate is copied as is;
+    anything else is decoded through an ffmpeg pipe.
+    """
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+
+    def blocks(
+        self,
+        item: AudioInput,
+        index: Optional[int] = None
+    ) -> Iterator[np.ndarray]:
+        """Yield int16 blocks of one input; index names it in errors."""
+        if isinstance(item, np.ndarray):
+            if item.dtype != np.int16:
+                raise TypeError(
+                    f"{describe(item, index)}: expected int16 "
+                    f"samples, got {item.dtype}"
+                )
+            for start in range(0, len(item), BLOCK_FRAMES):
+                yield item[start:start + BLOCK_FRAMES]
+            return
+        try:
+            wav = wave.open(wav_file(item), 'rb')
+        except (wave.Error, EOFError):
+            wav = None
+        if wav and self._copyable(wav):
+            with wav:
+                yield from self._wav_blocks(wav)
+            return
+        if wav:
+            wav.close()
+        yield from decoded_blocks(
+            item, self.sample_rate, BLOCK_FRAMES, index
+        )
+
+    def _copyable(self, wav) -> bool:
+        return (
+            wav.getnchannels() == 1
+            and wav.getsampwidth() == 2
+            and wav.getframerate() == self.sample_rate
+        )
+
+    @staticmethod
+    def _wav_blocks(wav) -> Iterator[np.ndarray]:
+        while True:
+            frames = wav.readframes(BLOCK_FRAMES)
+            if not frames:
+                return
+            yield np.frombuffer(frames, dtype=np.int16)
@@ -0,0 +1,68 @@
+"""
+PCM Spool - Ordered sample buffer with disk spill.
+"""
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from .raw_pcm_file import RawPcmFile
+
+DEFAULT_MEMORY_BUDGET = 512 * 1024 * 1024
+
+
+class PcmSpool:
+    """
+    Collect int16 samples for a whole work.
+
+    Blocks stay in memory until the byte budget is
+    exceeded, then all audio moves to a raw PCM file.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        spill_path: Path,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ):
+        self.sample_rate = sample_rate
+        self.spill_path = Path(spill_path)
+        self.memory_budget = memory_budget
+        self.blocks: List[np.ndarray] = []
+        self.buffered_bytes = 0
+        self.total_samples = 0
+        self.spill: Optional[RawPcmFile] = None
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append samples in playback order."""
+        samples = np.asarray(samples, dtype=np.int16)
+        self.total_samples += len(samples)
+
+        if self.spill:
+            self.spill.write(samples)
+            return
+
+        self.blocks.append(samples)
+        self.buffered_bytes += samples.nbytes
+        if self.buffered_bytes > self.memory_budget:
+            self._spill_to_disk()
+
+    def iter_blocks(self) -> Iterator[np.ndarray]:
+        """Yield all samples in order."""
+        if self.spill:
+            return self.spill.iter_blocks()
+        return iter(self.blocks)
+
+    def close(self) -> None:
+        """Release memory and remove any spill file."""
+        self.blocks = []
+        if self.spill:
+            self.spill.discard()
+
+    def _spill_to_disk(self) -> None:
+        """Move buffered blocks into the raw PCM file."""
+        self.spill = RawPcmFile(self.spill_path)
+        for block in self.blocks:
+            self.spill.write(block)
+        self.blocks = []
+        self.buffered_bytes = 0
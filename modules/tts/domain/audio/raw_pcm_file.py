@@ -0,0 +1,63 @@
+"""
+Raw PCM File - Append-only int16 sample storage on disk.
+"""
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+BLOCK_SAMPLES = 1 << 20
+
+
+class RawPcmFile:
+    """Headerless mono samples (int16 by default) in a file."""
+
+    def __init__(
+        self,
+        path: Path,
+        keep_bytes: int = 0,
+        dtype=np.int16
+    ):
+        """Keep_bytes: existing prefix to resume after."""
+        self.dtype = np.dtype(dtype)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if keep_bytes and self.path.exists():
+            self._handle = open(self.path, 'r+b')
+            self._handle.truncate(keep_bytes)
+            self._handle.seek(0, 2)
+        else:
+            self._handle = open(self.path, 'wb')
+
+    @property
+    def size(self) -> int:
+        """Bytes written so far."""
+        return self._handle.tell()
+
+    def write(self, samples: np.ndarray) -> None:
+        """Write samples at the end of the file."""
+        self._handle.write(samples.astype(self.dtype).tobytes())
+
+    def flush(self) -> None:
+        """Push buffered samples to the OS."""
+        self._handle.flush()
+
+    def iter_blocks(
+        self,
+        block_samples: int = BLOCK_SAMPLES
+    ) -> Iterator[np.ndarray]:
+        """Read the samples back in bounded blocks."""
+        self._handle.flush()
+        with open(self.path, 'rb') as source:
+            while True:
+                data = source.read(
+                    block_samples * self.dtype.itemsize
+                )
+                if not data:
+                    return
+                yield np.frombuffer(data, dtype=self.dtype)
+
+    def discard(self) -> None:
+        """Close and delete the file."""
+        self._handle.close()
+        self.path.unlink(missing_ok=True)
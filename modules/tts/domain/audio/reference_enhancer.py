@@ -0,0 +1,47 @@
+"""
+Reference Enhancer - Stage-by-stage enhancement chain.
+"""
+import numpy as np
+
+from .audio_filters import AudioFilters
+from .intelligent_deesser import IntelligentDeEsser
+from .prosody_enhancer import ProsodyEnhancer
+
+
+class ReferenceEnhancer:
+    """
+    The original chain, one stage object per step.
+
+    FusedEnhancer must match its output; tests and
+    benchmarks compare the two.
+    """
+
+    def __init__(self, sample_rate: int = 22050):
+        self.prosody_enhancer = ProsodyEnhancer(sample_rate)
+        self.deesser = IntelligentDeEsser(sample_rate)
+        self.filters = AudioFilters(sample_rate)
+
+    def process(
+        self,
+        samples: np.ndarray,
+        add_prosody: bool = True
+    ) -> np.ndarray:
+        """Enhance int16 samples, returning int16."""
+        audio = samples.astype(np.float32) / 32768.0
+
+        # Modern enhancement chain
+        enhanced = self.filters.spectral_boost(audio)
+        enhanced = self.deesser.process(enhanced)
+        enhanced = self.filters.add_presence(enhanced)
+
+        if add_prosody:
+            enhanced = self.prosody_enhancer.enhance(
+                enhanced,
+                add_micro_timing=True
+            )
+
+        enhanced = self.filters.soft_limiter(enhanced)
+        enhanced = self.filters.normalize(enhanced)
+
+        # Convert back to int16
+        return (enhanced * 32767).astype(np.int16)
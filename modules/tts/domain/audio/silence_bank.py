@@ -0,0 +1,21 @@
+"""
+Silence Bank - Shared read-only silence buffers.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=128)
+def silence_block(sample_rate: int, duration: float) -> np.ndarray:
+    """
+    Zeroed int16 samples for a pause.
+
+    Pauses repeat thousands of times per work with a
+    handful of durations, so every caller shares one
+    buffer per (rate, duration). It is read-only;
+    sinks only copy or serialize it.
+    """
+    samples = np.zeros(int(sample_rate * duration), np.int16)
+    samples.flags.writeable = False
+    return samples
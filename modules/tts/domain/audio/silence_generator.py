@@ -5,6 +5,8 @@ import numpy as np
 import wave
 from pathlib import Path
 
+from .silence_bank import silence_block
+
 
 class SilenceGenerator:
     """Generate silence segments for audio."""
@@ -18,8 +20,7 @@ class SilenceGenerator:
         output_path: str
     ) -> str:
         """Create silence WAV file."""
-        num_samples = int(self.sample_rate * duration_seconds)
-        silence = np.zeros(num_samples, dtype=np.int16)
+        silence = self.silence_samples(duration_seconds)
         
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         
@@ -31,6 +32,10 @@ class SilenceGenerator:
         
         return output_path
     
+    def silence_samples(self, duration_seconds: float) -> np.ndarray:
+        """Shared read-only int16 silence."""
+        return silence_block(self.sample_rate, duration_seconds)
+    
     def insert_pause_after_title(
         self, 
         text: str,
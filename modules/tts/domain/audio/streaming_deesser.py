@@ -0,0 +1,72 @@
+"""
+Streaming De-Esser - Block-wise STFT sibilance reduction.
+"""
+import numpy as np
+from scipy import signal
+
+from .enhancement_coefficients import sibilance_bins
+
+NPERSEG = 1024
+HOP = NPERSEG // 2
+
+
+class StreamingDeEsser:
+    """
+    Same per-frame rule as FusedEnhancer.deess, but frames
+    are overlap-added across block boundaries so the result
+    does not depend on how the audio was split.
+    """
+
+    def __init__(self, sample_rate: int):
+        self.bins = sibilance_bins(sample_rate, NPERSEG)
+        self.window = signal.get_window('hann', NPERSEG)
+        self.scale = self.window.sum()
+        self.norm = self.window[:HOP] ** 2 + self.window[HOP:] ** 2
+        self.threshold = 10 ** (-20 / 10)
+        self.reduction = 10 ** (-6 / 20)
+        self.pending = np.zeros(HOP, dtype=np.float32)
+        self.overlap = np.zeros(HOP)
+        self.skip = HOP
+        self.received = 0
+        self.emitted = 0
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """Return every sample no later frame will touch."""
+        self.received += len(audio)
+        return self._emit(self._run(audio))
+
+    def flush(self) -> np.ndarray:
+        """Drain the tail with zero padding."""
+        out = self._run(np.zeros(NPERSEG, dtype=np.float32))
+        return self._emit(out)
+
+    def _run(self, audio: np.ndarray) -> np.ndarray:
+        """Overlap-add all frames that are now complete."""
+        self.pending = np.concatenate([self.pending, audio])
+        count = (len(self.pending) - HOP) // HOP
+        if count <= 0:
+            return np.zeros(0)
+
+        frames = np.lib.stride_tricks.sliding_window_view(
+            self.pending, NPERSEG
+        )[::HOP][:count]
+        spectra = np.fft.rfft(frames * self.window, axis=1)
+        band = spectra[:, self.bins] / self.scale
+        loud = (np.abs(band) ** 2).sum(axis=1) > self.threshold
+        spectra[np.ix_(loud, self.bins)] *= self.reduction
+        synth = np.fft.irfft(spectra, NPERSEG, axis=1) * self.window
+
+        heads = synth[:, :HOP]
+        heads[0] += self.overlap
+        heads[1:] += synth[:-1, HOP:]
+        self.overlap = synth[-1, HOP:].copy()
+        self.pending = self.pending[count * HOP:]
+        return (heads / self.norm).ravel()
+
+    def _emit(self, out: np.ndarray) -> np.ndarray:
+        """Drop boundary padding and anything past the input."""
+        drop = min(self.skip, len(out))
+        self.skip -= drop
+        out = out[drop:self.received - self.emitted + drop]
+        self.emitted += len(out)
+        return out.astype(np.float32)
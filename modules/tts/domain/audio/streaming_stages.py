@@ -0,0 +1,65 @@
+"""
+Streaming Stages - Enhancement steps with carried state.
+"""
+import numpy as np
+from scipy import signal
+
+from .enhancement_coefficients import limiter_kernel
+
+
+class StreamingFilter:
+    """Causal SOS filter mixed into the dry signal."""
+
+    def __init__(self, sos: np.ndarray, gain: float):
+        self.sos = sos
+        self.gain = gain
+        self.state = np.zeros((sos.shape[0], 2))
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """Filter a block, continuing from the last one."""
+        filtered, self.state = signal.sosfilt(
+            self.sos, audio, zi=self.state
+        )
+        audio += (filtered * self.gain).astype(np.float32)
+        return audio
+
+    def flush(self) -> np.ndarray:
+        """No latency, nothing held back."""
+        return np.zeros(0, dtype=np.float32)
+
+
+class StreamingLimiter:
+    """
+    Soft-knee limiter whose centered smoothing kernel spans
+    block edges; output lags input by half the kernel.
+    """
+
+    def __init__(self):
+        self.kernel = limiter_kernel()
+        self.delay = len(self.kernel) // 2
+        self.history = np.zeros(len(self.kernel) - 1, np.float32)
+        self.dry = np.zeros(self.delay, np.float32)
+        self.skip = self.delay
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """Limit a block, emitting it delay samples late."""
+        compressed = audio.copy()
+        level = np.abs(audio)
+        over = level > 0.8
+        compressed[over] = np.sign(audio[over]) * (
+            0.8 + (level[over] - 0.8) / 4.0
+        )
+        history = np.concatenate([self.history, compressed])
+        dry = np.concatenate([self.dry, audio])
+        self.history = history[-len(self.history):]
+        self.dry = dry[len(audio):]
+
+        smoothed = np.convolve(history, self.kernel, 'valid')
+        out = dry[:len(audio)] * 0.3 + smoothed * 0.7
+        drop = min(self.skip, len(out))
+        self.skip -= drop
+        return out[drop:]
+
+    def flush(self) -> np.ndarray:
+        """Release the delayed samples."""
+        return self.process(np.zeros(self.delay, np.float32))
@@ -0,0 +1,16 @@
+"""
+Tee Sink - Fan one sample stream out to several sinks.
+"""
+from .pcm_sink import PcmSink
+
+
+class TeeSink:
+    """Send samples to the encoder and the PCM log."""
+
+    def __init__(self, *sinks: PcmSink):
+        self.sinks = sinks
+
+    def write(self, samples) -> None:
+        """Forward samples to every sink."""
+        for sink in self.sinks:
+            sink.write(samples)
@@ -0,0 +1,44 @@
+"""
+Token Audio - Interleave phrase speech with pause silence.
+"""
+from typing import List, Sequence
+
+import numpy as np
+
+from ..text.pause_tokens import Pause, Token
+from .silence_bank import silence_block
+
+
+def spoken_phrases(tokens: Sequence[Token]) -> List[str]:
+    """The non-blank text tokens, stripped, in order."""
+    return [
+        t.strip() for t in tokens
+        if not isinstance(t, Pause) and t.strip()
+    ]
+
+
+def assemble(
+    tokens: Sequence[Token],
+    speech: List[np.ndarray],
+    sample_rate: int
+) -> np.ndarray:
+    """
+    One int16 buffer for the token stream.
+
+    speech holds the audio of spoken_phrases(tokens);
+    pauses become shared silence at sample_rate.
+    """
+    phrases = iter(speech)
+    audio_segments = []
+
+    for token in tokens:
+        if isinstance(token, Pause):
+            audio_segments.append(
+                silence_block(sample_rate, token.seconds)
+            )
+        elif token.strip():
+            audio_segments.append(next(phrases))
+
+    return np.concatenate(
+        audio_segments or [np.zeros(0, dtype=np.int16)]
+    )
@@ -0,0 +1,73 @@
+"""
+WAV Layout - Where a WAV file's format and samples live.
+"""
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple
+
+RIFF_LIMIT = 0xFFFFFFFF
+
+
+@dataclass
+class WavLayout:
+    """Raw fmt chunk and byte span of the data chunk."""
+    fmt_chunk: bytes
+    data_offset: int
+    data_size: int
+
+    @property
+    def params(self) -> Tuple[int, int, int, int]:
+        """(format tag, channels, sample rate, bits per sample)."""
+        tag, channels, rate, _, _, bits = struct.unpack(
+            '<HHIIHH', self.fmt_chunk[:16]
+        )
+        return tag, channels, rate, bits
+
+    @property
+    def block_align(self) -> int:
+        """Bytes per frame."""
+        return struct.unpack('<H', self.fmt_chunk[12:14])[0]
+
+    @classmethod
+    def read(cls, path: str) -> 'WavLayout':
+        """Walk the RIFF chunks up to the data chunk."""
+        file_size = Path(path).stat().st_size
+        with open(path, 'rb') as f:
+            riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+            if riff != b'RIFF' or wave_id != b'WAVE':
+                raise ValueError(f"Not a WAV file: {path}")
+            fmt = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    raise ValueError(f"No data chunk: {path}")
+                chunk_id, size = struct.unpack('<4sI', header)
+                if chunk_id == b'data':
+                    break
+                body = f.read(size + (size & 1))
+                if chunk_id == b'fmt ':
+                    fmt = body[:size]
+            if fmt is None or len(fmt) < 16:
+                raise ValueError(f"No fmt chunk: {path}")
+            offset = f.tell()
+        # Streamed WAVs may leave a placeholder data size
+        size = min(size, file_size - offset)
+        layout = cls(fmt, offset, size)
+        layout.data_size -= size % max(layout.block_align, 1)
+        return layout
+
+    @staticmethod
+    def merged_header(layouts: List['WavLayout']) -> bytes:
+        """Header for the concatenated data of all layouts."""
+        fmt = layouts[0].fmt_chunk
+        data_size = sum(layout.data_size for layout in layouts)
+        riff_size = 4 + (8 + len(fmt) + len(fmt) % 2) + 8 + data_size
+        if riff_size > RIFF_LIMIT:
+            raise ValueError("Merged audio exceeds the 4 GB WAV limit")
+        return b''.join([
+            struct.pack('<4sI4s', b'RIFF', riff_size, b'WAVE'),
+            struct.pack('<4sI', b'fmt ', len(fmt)),
+            fmt + b'\0' * (len(fmt) % 2),
+            struct.pack('<4sI', b'data', data_size),
+        ])
@@ -3,12 +3,20 @@ Native WAV Merger - No ffmpeg required.
 """
 from pathlib import Path
 from typing import List
-import wave
-import numpy as np
+
+from .file_range_copy import copy_range
+from .wav_layout import WavLayout
 
 
 class WavMerger:
-    """Merge WAV files using wave module."""
+    """
+    Merge WAV files by copying their data sections.
+    
+    The header is written once with the final size, then
+    each input's samples are copied file-to-file in the
+    kernel (copy_file_range/sendfile) or in fixed blocks,
+    so memory does not grow with the work length.
+    """
     
     def merge(
         self, 
@@ -17,28 +25,41 @@ class WavMerger:
     ) -> bool:
         """Concatenate WAV files."""
         try:
-            data_chunks = []
-            params = None
-            
-            for input_file in input_files:
-                with wave.open(input_file, 'rb') as wav:
-                    if params is None:
-                        params = wav.getparams()
-                    
-                    frames = wav.readframes(wav.getnframes())
-                    data_chunks.append(frames)
+            layouts = [WavLayout.read(f) for f in input_files]
+            self._check_params(input_files, layouts)
             
             Path(output_file).parent.mkdir(
                 parents=True, 
                 exist_ok=True
             )
             
-            with wave.open(output_file, 'wb') as output:
-                output.setparams(params)
-                output.writeframes(b''.join(data_chunks))
+            with open(output_file, 'wb') as out:
+                out.write(WavLayout.merged_header(layouts))
+                for path, layout in zip(input_files, layouts):
+                    with open(path, 'rb') as src:
+                        copy_range(
+                            src, out,
+                            layout.data_offset, layout.data_size
+                        )
             
             return True
             
         except Exception as e:
             print(f"Merge error: {e}")
             return False
+    
+    @staticmethod
+    def _check_params(
+        paths: List[str],
+        layouts: List[WavLayout]
+    ) -> None:
+        """Every input must share the first one's format."""
+        if not layouts:
+            raise ValueError("No input files")
+        expected = layouts[0].params
+        for path, layout in zip(paths, layouts):
+            if layout.params != expected:
+                raise ValueError(
+                    f"{path}: format {layout.params} != {expected} "
+                    "(tag, channels, rate, bits)"
+                )
@@ -0,0 +1,39 @@
+"""
+WAV Stream Writer - Append PCM blocks to a WAV file.
+"""
+import wave
+from pathlib import Path
+
+import numpy as np
+
+
+class WavStreamWriter:
+    """
+    Int16 mono WAV written block by block.
+
+    Same write/finish/abort surface as Mp3StreamEncoder;
+    the header length is fixed up when the file closes.
+    """
+
+    def __init__(self, wav_path: Path, sample_rate: int):
+        self.wav_path = Path(wav_path)
+        self.wav_path.parent.mkdir(parents=True, exist_ok=True)
+        self.wav = wave.open(str(self.wav_path), 'wb')
+        self.wav.setnchannels(1)
+        self.wav.setsampwidth(2)
+        self.wav.setframerate(sample_rate)
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append samples in playback order."""
+        data = np.asarray(samples, dtype=np.int16).tobytes()
+        self.wav.writeframesraw(data)
+
+    def finish(self) -> str:
+        """Close the file and return its path."""
+        self.wav.close()
+        return str(self.wav_path)
+
+    def abort(self) -> None:
+        """Close and drop the partial file."""
+        self.wav.close()
+        self.wav_path.unlink(missing_ok=True)
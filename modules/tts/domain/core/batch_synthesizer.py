@@ -0,0 +1,61 @@
+"""
+Batch Synthesizer - Amortize ONNX calls across phrases.
+"""
+from typing import List
+
+import numpy as np
+from piper.config import SynthesisConfig
+
+from .onnx_batch_runner import OnnxBatchRunner
+
+
+class BatchSynthesizer:
+    """
+    Phonemize many texts, then infer them in padded batches.
+
+    Sentences are sorted by length before batching so each
+    batch carries little padding; audio is regrouped per text.
+    """
+
+    def __init__(self, voice, batch_size: int = 8):
+        self.voice = voice
+        self.batch_size = batch_size
+        self.runner = OnnxBatchRunner(voice)
+
+    @staticmethod
+    def supports(voice) -> bool:
+        """Batching needs the per-phoneme duration output."""
+        return len(voice.session.get_outputs()) > 1
+
+    def synthesize(
+        self,
+        texts: List[str],
+        config: SynthesisConfig
+    ) -> List[np.ndarray]:
+        """Int16 audio for each text, in input order."""
+        owners, sequences = [], []
+        for index, text in enumerate(texts):
+            for phonemes in self.voice.phonemize(text):
+                if phonemes:
+                    owners.append(index)
+                    sequences.append(
+                        self.voice.phonemes_to_ids(phonemes)
+                    )
+
+        audio = [None] * len(sequences)
+        order = sorted(
+            range(len(sequences)), key=lambda i: len(sequences[i])
+        )
+        for start in range(0, len(order), self.batch_size):
+            rows = order[start:start + self.batch_size]
+            batch = [sequences[i] for i in rows]
+            for i, samples in zip(rows, self.runner.run(batch, config)):
+                audio[i] = samples
+
+        grouped = [[] for _ in texts]
+        for owner, samples in zip(owners, audio):
+            grouped[owner].append(samples)
+        return [
+            np.concatenate(parts or [np.zeros(0, np.int16)])
+            for parts in grouped
+        ]
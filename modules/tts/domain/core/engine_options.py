@@ -0,0 +1,35 @@
+"""
+Engine Options - Inference tuning for TTSEngine.
+"""
+import os
+from dataclasses import dataclass, replace
+
+
+@dataclass
+class EngineOptions:
+    """
+    How Piper inference and enhancement are run.
+
+    Zero thread counts leave the choice to ONNX Runtime.
+    An empty optimized_model_dir disables the model cache.
+    enhance_level "chunk" enhances each chunk in the engine;
+    "work" leaves it to one pass over the whole work.
+    enhance_workers > 0 moves chunk enhancement onto
+    that many threads, overlapping it with inference.
+    """
+    batch_size: int = 1
+    intra_op_threads: int = 0
+    inter_op_threads: int = 0
+    optimization: str = "all"
+    execution_mode: str = "sequential"
+    cpu_mem_arena: bool = True
+    optimized_model_dir: str = ""
+    enhance_level: str = "chunk"
+    enhance_workers: int = 0
+
+    def for_processes(self, processes: int) -> 'EngineOptions':
+        """Share the cores between sessions running at once."""
+        if self.intra_op_threads or processes <= 1:
+            return self
+        threads = max(1, (os.cpu_count() or 1) // processes)
+        return replace(self, intra_op_threads=threads)
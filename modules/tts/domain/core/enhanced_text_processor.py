@@ -1,13 +1,15 @@
 """
 Enhanced Text Processor - With pauses and conversions.
 """
-from typing import List
-import re
+from typing import Iterable, List
 from ..text.pause_aware_chunker import PauseAwareChunker
 from ..text.roman_converter import RomanConverter
 from ..audio.silence_generator import SilenceGenerator
 from ..text.punctuation_pauser import PunctuationPauser
 from ..text.hyphenation_resolver import HyphenationResolver
+from ..text.pause_tokens import Chunk, Pause, Token, lone_pause
+
+LONG_PAUSE_SECONDS = 1.5
 
 
 class EnhancedTextProcessor:
@@ -24,11 +26,12 @@ class EnhancedTextProcessor:
         self, 
         text: str,
         add_title_pause: bool = True
-    ) -> List[str]:
+    ) -> List[Chunk]:
         """
         Process work text with equalizer-based pauses.
         
-        Punctuation → periods conversion via PauseConfig.
+        Returns chunks of text segments and Pause tokens;
+        durations come from PauseConfig.
         """
         text = self.hyphenation.resolve(text)
         text = self._remove_leading_ellipsis(text)
@@ -42,13 +45,11 @@ class EnhancedTextProcessor:
         # Normalize newlines
         text = self._normalize_newlines(text)
         
-        # Convert punctuation to periods (via equalizer)
-        text = self.pauser.add_pauses(text)
-        
-        # Chunk text (only on long silences)
-        chunks = self._chunk_with_silences(text)
+        # Punctuation -> pauses (via equalizer), one pass
+        tokens = self.pauser.tokenize(text)
         
-        return chunks
+        # Chunk tokens (only on long pauses)
+        return self._chunk_tokens(tokens)
     
     def _remove_leading_ellipsis(self, text: str) -> str:
         """Remove leading ellipsis from lines (editorial markers)."""
@@ -80,44 +81,34 @@ class EnhancedTextProcessor:
         
         return f"{title}§PAUSE2000§{rest}"
     
-    def _chunk_with_silences(
+    def _chunk_tokens(
         self, 
-        text: str
-    ) -> List[str]:
+        tokens: Iterable[Token]
+    ) -> List[Chunk]:
         """
-        Chunk text, only split on LONG silences (>=1.5s).
+        Chunk tokens, only split on LONG pauses (>=1.5s).
         
         Short pauses (punctuation <1.5s) stay within chunks.
         This prevents excessive fragmentation.
         """
-        # Split on ALL silence markers
-        pattern = r'<silence:([\d.]+)>'
-        parts = re.split(pattern, text)
-        
         chunks = []
-        i = 0
         
-        while i < len(parts):
-            part = parts[i]
-            
-            # Check if this is a duration (from split group)
-            if i > 0 and re.match(r'[\d.]+$', part):
-                duration = float(part)
-                
-                if duration >= 1.5:
-                    # Long silence - create separate chunk
-                    chunks.append(f"<silence:{part}>")
+        for token in tokens:
+            if isinstance(token, Pause):
+                if (
+                    token.seconds >= LONG_PAUSE_SECONDS
+                    or not chunks
+                    or lone_pause(chunks[-1])
+                ):
+                    # Long pause - separate chunk
+                    chunks.append((token,))
                 else:
-                    # Short silence - append to previous text chunk
-                    if chunks and not chunks[-1].startswith('<silence:'):
-                        chunks[-1] += f" <silence:{part}>"
-                    else:
-                        chunks.append(f"<silence:{part}>")
-                i += 1
-            else:
-                # This is text
-                if part.strip():
-                    chunks.extend(self.chunker.chunk_text(part))
-                i += 1
+                    # Short pause - ends the previous chunk
+                    chunks[-1] += (token,)
+            elif token.strip():
+                chunks.extend(
+                    (part,)
+                    for part in self.chunker.chunk_text(token)
+                )
         
-        return [c for c in chunks if c.strip()]
+        return chunks
@@ -0,0 +1,30 @@
+"""
+Host Fingerprint - What an optimized ONNX graph is tied to.
+"""
+import hashlib
+import platform
+from functools import lru_cache
+
+PROVIDER = "CPUExecutionProvider"
+
+
+@lru_cache(maxsize=1)
+def host_fingerprint() -> str:
+    """Provider, architecture and a hash of the CPU flags."""
+    features = _cpu_features() or platform.processor()
+    digest = hashlib.sha1(features.encode()).hexdigest()[:10]
+    provider = PROVIDER.replace("ExecutionProvider", "").lower()
+    return f"{provider}-{platform.machine()}-{digest}"
+
+
+def _cpu_features() -> str:
+    """Instruction set flags from /proc/cpuinfo, if readable."""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.strip() in ("flags", "Features"):
+                    return " ".join(sorted(value.split()))
+    except OSError:
+        pass
+    return ""
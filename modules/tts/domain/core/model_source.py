@@ -0,0 +1,60 @@
+"""
+Model Source - The Piper graph handed to ONNX Runtime.
+"""
+from pathlib import Path
+from typing import Optional, Union
+
+import onnxruntime as ort
+
+from .engine_options import EngineOptions
+from .host_fingerprint import host_fingerprint
+
+
+class ModelSource:
+    """
+    Voice model, patched with a duration output for batching.
+
+    Batched inference needs per-phrase lengths; Piper can
+    expose them by adding the alignment output in memory.
+    """
+
+    def __init__(self, model_path: Path, options: EngineOptions):
+        self.model_path = Path(model_path)
+        self.options = options
+        self.aligned = options.batch_size > 1
+
+    def load(self) -> Union[str, bytes]:
+        """Path, or patched model bytes when batching."""
+        if not self.aligned:
+            return str(self.model_path)
+        try:
+            import onnx
+            from piper.patch_voice_with_alignment import (
+                add_alignment_output
+            )
+            model = onnx.load(str(self.model_path))
+            add_alignment_output(model)
+            return model.SerializeToString()
+        except (ImportError, ValueError):
+            self.aligned = False
+            return str(self.model_path)
+
+    def optimized_path(self) -> Optional[Path]:
+        """
+        Cache file for this model, level, runtime and host.
+
+        ORT_ENABLE_ALL graphs use kernels picked for this CPU
+        and provider, so another machine gets its own file.
+        """
+        if not self.options.optimized_model_dir:
+            return None
+        stat = self.model_path.stat()
+        name = "-".join([
+            self.model_path.stem,
+            self.options.optimization,
+            "aligned" if self.aligned else "plain",
+            f"ort{ort.__version__}",
+            host_fingerprint(),
+            f"{stat.st_size}-{int(stat.st_mtime)}",
+        ])
+        return Path(self.options.optimized_model_dir) / f"{name}.onnx"
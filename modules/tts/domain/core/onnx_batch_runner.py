@@ -0,0 +1,77 @@
+"""
+ONNX Batch Runner - Padded multi-phrase Piper inference.
+"""
+from typing import List
+
+import numpy as np
+from piper.config import SynthesisConfig
+
+from .onnx_inputs import OnnxInputs
+
+MAX_WAV_VALUE = 32767.0
+
+
+class OnnxBatchRunner:
+    """
+    Run several phoneme id sequences in one session call.
+
+    Audio is cut back to each phrase's own length using the
+    model's duration output, which the session must have,
+    then normalized per phrase exactly like
+    PiperVoice.synthesize.
+    """
+
+    def __init__(self, voice):
+        self.voice = voice
+        self.hop_length = voice.config.hop_length
+        self.inputs = OnnxInputs(voice.config)
+
+    def run(
+        self,
+        batch: List[List[int]],
+        config: SynthesisConfig
+    ) -> List[np.ndarray]:
+        """Int16 audio for every id sequence in the batch."""
+        lengths = np.array([len(ids) for ids in batch])
+        padded = np.zeros((len(batch), lengths.max()), np.int64)
+        for row, ids in enumerate(batch):
+            padded[row, :len(ids)] = ids
+
+        args = {
+            "input": padded,
+            "input_lengths": lengths.astype(np.int64),
+            "scales": self.inputs.scales(config),
+        }
+        speaker = self.inputs.speaker(config)
+        if speaker is not None:
+            args["sid"] = np.full(len(batch), speaker, np.int64)
+
+        result = self.voice.session.run(None, args)
+        if len(result) < 2:
+            raise ValueError("Batching needs the duration output")
+        audio = result[0].reshape(len(batch), -1)
+        return [
+            self._to_int16(
+                audio[row, :self._length(result[1], row, lengths)],
+                config
+            )
+            for row in range(len(batch))
+        ]
+
+    def _length(self, durations, row, lengths) -> int:
+        """Samples belonging to the unpadded phrase."""
+        samples = durations[row, :lengths[row]] * self.hop_length
+        return int(samples.astype(np.int64).sum())
+
+    @staticmethod
+    def _to_int16(audio, config: SynthesisConfig) -> np.ndarray:
+        """Per-phrase normalize, volume, clip, int16."""
+        if config.normalize_audio:
+            peak = np.max(np.abs(audio)) if len(audio) else 0
+            audio = audio / peak if peak >= 1e-8 else audio * 0
+        audio = np.clip(audio * config.volume, -1.0, 1.0)
+        return np.clip(
+            audio.astype(np.float32) * MAX_WAV_VALUE,
+            -MAX_WAV_VALUE, MAX_WAV_VALUE
+        ).astype(np.int16)
+
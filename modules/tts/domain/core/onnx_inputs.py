@@ -0,0 +1,34 @@
+"""
+ONNX Inputs - Piper session arguments from a synthesis config.
+"""
+import numpy as np
+from piper.config import SynthesisConfig
+
+
+class OnnxInputs:
+    """Scales and speaker id, falling back to voice defaults."""
+
+    def __init__(self, voice_config):
+        self.defaults = voice_config
+
+    def scales(self, config: SynthesisConfig) -> np.ndarray:
+        """Noise, length and noise_w scales with defaults."""
+        defaults = self.defaults
+        return np.array([
+            _pick(config.noise_scale, defaults.noise_scale),
+            _pick(config.length_scale, defaults.length_scale),
+            _pick(config.noise_w_scale, defaults.noise_w_scale),
+        ], dtype=np.float32)
+
+    def speaker(self, config: SynthesisConfig):
+        """Speaker id for multi-speaker voices."""
+        if self.defaults.num_speakers <= 1:
+            return None
+        if config.speaker_id is None:
+            return self.defaults.default_speaker_id
+        return config.speaker_id
+
+
+def _pick(value, default):
+    """Config value, falling back to the voice default."""
+    return default if value is None else value
@@ -0,0 +1,70 @@
+"""
+Phrase Synthesizer - Raw Piper speech, through the cache.
+"""
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from .batch_synthesizer import BatchSynthesizer
+from .segment_cache import SegmentCache
+from .synthesis_settings import synthesis_config
+
+
+class PhraseSynthesizer:
+    """Speech for plain phrases, batched when possible."""
+
+    def __init__(
+        self,
+        voice,
+        batcher: Optional[BatchSynthesizer] = None,
+        cache: Optional[SegmentCache] = None,
+        model_path: Path = Path()
+    ):
+        self.voice = voice
+        self.batcher = batcher
+        self.cache = cache
+        self.model_path = model_path
+
+    def synthesize(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate speech audio, reusing cached segments."""
+        if not self.cache:
+            return self.run_many(texts)
+
+        keys = [self.cache_key(text) for text in texts]
+        audio = [self.cache.get(key) for key in keys]
+        missing = [i for i, a in enumerate(audio) if a is None]
+        fresh = self.run_many([texts[i] for i in missing])
+
+        for i, samples in zip(missing, fresh):
+            self.cache.put(keys[i], samples)
+            audio[i] = samples
+        return audio
+
+    def cache_key(self, text: str) -> str:
+        """
+        Everything that determines the raw Piper output.
+
+        Cached audio is pre-enhancement, so enhancer settings
+        stay out of the key.
+        """
+        return self.cache.key(
+            text,
+            str(self.model_path.resolve()),
+            asdict(synthesis_config()),
+            "batch" if self.batcher else "phrase"
+        )
+
+    def run_many(self, texts: List[str]) -> List[np.ndarray]:
+        """Batched inference when enabled, else per phrase."""
+        if self.batcher and texts:
+            return self.batcher.synthesize(texts, synthesis_config())
+        return [self.run(text) for text in texts]
+
+    def run(self, text: str) -> np.ndarray:
+        """Generate speech audio for text with Piper."""
+        chunks = self.voice.synthesize(text, synthesis_config())
+        return np.concatenate([
+            chunk.audio_int16_array for chunk in chunks
+        ] or [np.zeros(0, dtype=np.int16)])
@@ -0,0 +1,21 @@
+"""
+Segment Cache - Store of synthesized speech segments.
+"""
+from typing import Any, Optional, Protocol
+
+import numpy as np
+
+
+class SegmentCache(Protocol):
+    """Where TTSEngine looks up speech before running Piper."""
+
+    stats: Any
+
+    def key(self, text: str, *params) -> str:
+        """Key for text rendered with these parameters."""
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Cached samples, or None on a miss."""
+
+    def put(self, key: str, samples: np.ndarray) -> None:
+        """Remember samples under key."""
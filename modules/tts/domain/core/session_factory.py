@@ -0,0 +1,68 @@
+"""
+Session Factory - Tuned ONNX Runtime sessions for Piper.
+"""
+import os
+from pathlib import Path
+
+import onnxruntime as ort
+
+from .engine_options import EngineOptions
+from .host_fingerprint import PROVIDER
+from .model_source import ModelSource
+
+OPTIMIZATION_LEVELS = {
+    "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+EXECUTION_MODES = {
+    "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": ort.ExecutionMode.ORT_PARALLEL,
+}
+
+
+class OnnxSessionFactory:
+    """Build CPU inference sessions from EngineOptions."""
+
+    @staticmethod
+    def create(
+        model_path: Path,
+        options: EngineOptions
+    ) -> ort.InferenceSession:
+        """Session for the model, reusing optimized graphs."""
+        so = ort.SessionOptions()
+        so.intra_op_num_threads = options.intra_op_threads
+        so.inter_op_num_threads = options.inter_op_threads
+        so.execution_mode = EXECUTION_MODES[options.execution_mode]
+        so.enable_cpu_mem_arena = options.cpu_mem_arena
+        so.graph_optimization_level = (
+            OPTIMIZATION_LEVELS[options.optimization]
+        )
+
+        source = ModelSource(model_path, options)
+        cached = source.optimized_path()
+        if cached and cached.exists():
+            so.graph_optimization_level = (
+                OPTIMIZATION_LEVELS["disable"]
+            )
+            return _session(str(cached), so)
+
+        if cached:
+            temp = cached.with_suffix(f".{os.getpid()}.tmp")
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            so.optimized_model_filepath = str(temp)
+            so.log_severity_level = 3
+            session = _session(source.load(), so)
+            os.replace(temp, cached)
+            return session
+
+        return _session(source.load(), so)
+
+
+def _session(model, so) -> ort.InferenceSession:
+    """CPU session from a path or serialized model."""
+    return ort.InferenceSession(
+        model, sess_options=so, providers=[PROVIDER]
+    )
@@ -0,0 +1,79 @@
+"""
+Stage Metrics - Time, audio and bytes per pipeline stage.
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict
+
+STAGES = ("synthesis", "enhancement", "merge", "encode")
+
+
+@dataclass
+class StageMetrics:
+    """
+    Counters that can be diffed and summed across runs.
+
+    Sinks keep a reference to the object they report to,
+    so accumulation (+=) happens in place.
+    """
+    seconds: Dict[str, float] = field(default_factory=dict)
+    bytes_written: Dict[str, int] = field(default_factory=dict)
+    audio_seconds: float = 0.0
+
+    def record(self, stage: str, seconds: float, nbytes: int = 0):
+        """Add one measurement to a stage."""
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.bytes_written[stage] = (
+            self.bytes_written.get(stage, 0) + nbytes
+        )
+
+    @contextmanager
+    def timed(self, stage: str, nbytes: int = 0):
+        """Time the enclosed block as part of a stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started, nbytes)
+
+    def copy(self) -> 'StageMetrics':
+        """Snapshot for later diffing."""
+        return StageMetrics(
+            dict(self.seconds), dict(self.bytes_written),
+            self.audio_seconds
+        )
+
+    def __iadd__(self, other: 'StageMetrics') -> 'StageMetrics':
+        for stage, seconds in other.seconds.items():
+            self.record(
+                stage, seconds, other.bytes_written.get(stage, 0)
+            )
+        self.audio_seconds += other.audio_seconds
+        return self
+
+    def __add__(self, other: 'StageMetrics') -> 'StageMetrics':
+        total = self.copy()
+        total += other
+        return total
+
+    def __sub__(self, other: 'StageMetrics') -> 'StageMetrics':
+        return StageMetrics(
+            _minus(self.seconds, other.seconds),
+            _minus(self.bytes_written, other.bytes_written),
+            self.audio_seconds - other.audio_seconds
+        )
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly view with every stage present."""
+        return {
+            "audio_seconds": round(self.audio_seconds, 3),
+            "seconds": {
+                s: round(self.seconds.get(s, 0.0), 4) for s in STAGES
+            },
+            "bytes": {s: self.bytes_written.get(s, 0) for s in STAGES},
+        }
+
+
+def _minus(a: Dict, b: Dict) -> Dict:
+    return {k: v - b.get(k, 0) for k, v in a.items()}
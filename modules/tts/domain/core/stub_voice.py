@@ -0,0 +1,48 @@
+"""
+Stub Voice - Model-free stand-in for PiperVoice.
+"""
+import zlib
+from dataclasses import dataclass
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+
+class StubAudioChunk(NamedTuple):
+    """Shape of piper's AudioChunk that TTSEngine reads."""
+    audio_int16_array: np.ndarray
+
+
+@dataclass
+class StubVoiceConfig:
+    """Only the voice config field the pipeline uses."""
+    sample_rate: int = 22050
+
+
+class StubVoice:
+    """
+    Deterministic voiced tone plus noise for any text.
+
+    Audio length follows the text at roughly the real
+    voice's pace, so real-time factors stay meaningful.
+    """
+
+    CHARS_PER_SECOND = 14
+
+    def __init__(self, sample_rate: int = 22050):
+        self.config = StubVoiceConfig(sample_rate)
+
+    def synthesize(
+        self,
+        text: str,
+        syn_config=None
+    ) -> Iterator[StubAudioChunk]:
+        """Yield one chunk of 'speech' for the text."""
+        rate = self.config.sample_rate
+        n = int(len(text) / self.CHARS_PER_SECOND * rate)
+        rng = np.random.default_rng(zlib.crc32(text.encode()))
+        t = np.arange(n) / rate
+        pitch = 140 + 20 * np.sin(2 * np.pi * 3 * t)
+        audio = 0.3 * np.sin(2 * np.pi * pitch * t)
+        audio += rng.normal(0, 0.02, n)
+        yield StubAudioChunk((audio * 26000).astype(np.int16))
@@ -0,0 +1,15 @@
+"""
+Synthesis Settings - Piper parameters for every phrase.
+"""
+from piper.config import SynthesisConfig
+
+
+def synthesis_config() -> SynthesisConfig:
+    """Slower speech (1.2) for clarity."""
+    return SynthesisConfig(
+        length_scale=1.2,
+        noise_scale=0.667,
+        noise_w_scale=0.8,
+        normalize_audio=True,
+        volume=1.0
+    )
@@ -1,11 +1,20 @@
-from typing import Optional
-from pathlib import Path
-from piper import PiperVoice
-from piper.config import SynthesisConfig
-import wave
-import re
+from typing import Optional, Sequence
+from dataclasses import asdict
+import json
 import numpy as np
 
+from ..audio.lazy_enhancer import LazyEnhancer
+from ..audio.pcm_io import PcmIO
+from ..audio.token_audio import assemble, spoken_phrases
+from ..text.pause_tokens import Token, from_markup
+from .batch_synthesizer import BatchSynthesizer
+from .engine_options import EngineOptions
+from .phrase_synthesizer import PhraseSynthesizer
+from .segment_cache import SegmentCache
+from .stage_metrics import StageMetrics
+from .synthesis_settings import synthesis_config
+from .voice_loader import VoiceLoader
+
 
 class TTSEngine:
     """
@@ -13,35 +22,32 @@ class TTSEngine:
     Processes <silence:X> markers for precise pauses.
     """
     
-    MODEL_PATHS = {
-        "es": "models/piper/es_MX-claude-high.onnx",
-        "es_mx": "models/piper/es_MX-claude-high.onnx",
-        "es_es": "models/piper/es_ES-sharvard-medium.onnx",
-    }
-    
-    def __init__(self, language: str = "es_mx"):
+    def __init__(
+        self,
+        language: str = "es_mx",
+        cache: Optional[SegmentCache] = None,
+        options: Optional[EngineOptions] = None
+    ):
         self.language = language
+        self.cache = cache
+        self.options = options or EngineOptions()
         self.voice = None
+        self.batcher: Optional[BatchSynthesizer] = None
+        self.enhancer = LazyEnhancer()
+        self.metrics = StageMetrics()
+        self.model_path = VoiceLoader.model_path(language)
     
     def load_model(self) -> None:
         """Load Piper voice model."""
-        model_path = Path(self.MODEL_PATHS.get(
-            self.language,
-            self.MODEL_PATHS["es"]
-        ))
-        
-        config_path = model_path.with_suffix('.onnx.json')
-        
-        if not model_path.exists():
-            raise FileNotFoundError(
-                f"Model not found: {model_path}"
-            )
-        
-        self.voice = PiperVoice.load(
-            str(model_path),
-            use_cuda=False,
-            config_path=str(config_path)
-        )
+        self.voice = VoiceLoader.load(self.model_path, self.options)
+        self.batcher = VoiceLoader.batcher(self.voice, self.options)
+    
+    @property
+    def sample_rate(self) -> int:
+        """Output sample rate of the loaded voice."""
+        if not self.voice:
+            self.load_model()
+        return self.voice.config.sample_rate
     
     def synthesize(
         self,
@@ -54,86 +60,75 @@ class TTSEngine:
         Processes <silence:X> markers as real silence.
         Uses slower speed (1.2) for clarity.
         """
-        if not self.voice:
-            self.load_model()
-        
         try:
-            Path(output_path).parent.mkdir(
-                parents=True,
-                exist_ok=True
-            )
-            
-            # Split text on silence markers
-            pattern = r'<silence:([\d.]+)>'
-            parts = re.split(pattern, text)
-            
-            audio_segments = []
-            i = 0
-            
-            while i < len(parts):
-                part = parts[i]
-                
-                # Check if this is a duration
-                if i > 0 and re.match(r'[\d.]+$', part):
-                    # Generate silence
-                    duration = float(part)
-                    silence_bytes = self._generate_silence(duration)
-                    audio_segments.append(silence_bytes)
-                    i += 1
-                else:
-                    # Generate speech
-                    if part.strip():
-                        speech_bytes = self._synthesize_text(part.strip())
-                        audio_segments.append(speech_bytes)
-                    i += 1
-            
-            # Combine all segments
-            audio_data = b''.join(audio_segments)
-            
-            with wave.open(output_path, 'wb') as f:
-                f.setnchannels(1)
-                f.setsampwidth(2)
-                f.setframerate(self.voice.config.sample_rate)
-                f.writeframes(audio_data)
-            
-            # Apply audio enhancement
-            self._enhance_audio(output_path)
-            
+            samples = self.synthesize_pcm(text)
+            PcmIO.write_wav(output_path, [samples], self.sample_rate)
             return True
             
         except Exception as e:
             print(f"TTS Error: {e}")
             return False
     
-    def _synthesize_text(self, text: str) -> bytes:
-        """Generate speech audio for text."""
-        config = SynthesisConfig(
-            length_scale=1.2,
-            noise_scale=0.667,
-            noise_w_scale=0.8,
-            normalize_audio=True,
-            volume=1.0
-        )
+    def synthesize_pcm(self, text: str) -> np.ndarray:
+        """
+        Generate enhanced int16 samples in memory.
+        
+        Same output as synthesize() without any WAV
+        file round-trips between stages.
+        """
+        return self.synthesize_tokens(from_markup(text))
+    
+    def synthesize_tokens(
+        self,
+        tokens: Sequence[Token],
+        enhance: bool = True
+    ) -> np.ndarray:
+        """
+        Generate samples for text segments and pauses.
+        
+        enhance=False returns raw speech so the caller can
+        run enhance_pcm() elsewhere.
+        """
+        if not self.voice:
+            self.load_model()
         
-        chunks = list(self.voice.synthesize(text, config))
-        return b''.join([
-            chunk.audio_int16_bytes 
-            for chunk in chunks
-        ])
+        phrases = spoken_phrases(tokens)
+        with self.metrics.timed("synthesis"):
+            speech = self.phrases().synthesize(phrases)
+        self.metrics.record(
+            "synthesis", 0.0, sum(s.nbytes for s in speech)
+        )
+        audio = assemble(tokens, speech, self.sample_rate)
+        if not enhance or self.options.enhance_level != "chunk":
+            return audio
+        return self.enhance_pcm(audio)
     
-    def _generate_silence(self, duration: float) -> bytes:
-        """Generate silence audio."""
-        sample_rate = self.voice.config.sample_rate
-        num_samples = int(sample_rate * duration)
-        silence = np.zeros(num_samples, dtype=np.int16)
-        return silence.tobytes()
+    def phrases(self) -> PhraseSynthesizer:
+        """Raw speech from the loaded voice, through the cache."""
+        return PhraseSynthesizer(
+            self.voice, self.batcher, self.cache, self.model_path
+        )
     
-    def _enhance_audio(self, audio_path: str) -> None:
-        """Apply audio enhancements."""
-        try:
-            from ..audio.audio_enhancer import AudioEnhancer
-            enhancer = AudioEnhancer()
-            enhancer.enhance(audio_path, audio_path)
-        except Exception as e:
-            print(f"Enhancement warning: {e}")
-
+    def render_signature(self) -> str:
+        """Everything besides the text that shapes the output."""
+        return json.dumps({
+            "model": str(self.model_path.resolve()),
+            "synthesis": asdict(synthesis_config()),
+            "enhance_level": self.options.enhance_level,
+        }, sort_keys=True)
+    
+    def load_enhancer(self) -> None:
+        """Build the enhancer once, before threads share it."""
+        self.enhancer.load(self.sample_rate)
+    
+    def enhance_pcm(
+        self,
+        audio: np.ndarray,
+        metrics: Optional[StageMetrics] = None
+    ) -> np.ndarray:
+        """Apply audio enhancements, timed into metrics."""
+        return self.enhancer.enhance(
+            audio,
+            self.sample_rate,
+            self.metrics if metrics is None else metrics
+        )
@@ -0,0 +1,62 @@
+"""
+Voice Loader - Build a Piper voice on a tuned session.
+"""
+import json
+from pathlib import Path
+from typing import Optional
+
+from piper import PiperVoice
+from piper.config import PiperConfig
+
+from .batch_synthesizer import BatchSynthesizer
+from .engine_options import EngineOptions
+from .session_factory import OnnxSessionFactory
+
+
+class VoiceLoader:
+    """Load the voice and, when it can batch, its batcher."""
+
+    MODEL_PATHS = {
+        "es": "models/piper/es_MX-claude-high.onnx",
+        "es_mx": "models/piper/es_MX-claude-high.onnx",
+        "es_es": "models/piper/es_ES-sharvard-medium.onnx",
+    }
+
+    @staticmethod
+    def model_path(language: str) -> Path:
+        """Model for the language, Mexican Spanish by default."""
+        return Path(VoiceLoader.MODEL_PATHS.get(
+            language,
+            VoiceLoader.MODEL_PATHS["es"]
+        ))
+
+    @staticmethod
+    def load(model_path: Path, options: EngineOptions) -> PiperVoice:
+        """Voice from the model and its .onnx.json config."""
+        config_path = model_path.with_suffix('.onnx.json')
+
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"Model not found: {model_path}"
+            )
+
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = PiperConfig.from_dict(json.load(f))
+
+        return PiperVoice(
+            config=config,
+            session=OnnxSessionFactory.create(model_path, options)
+        )
+
+    @staticmethod
+    def batcher(
+        voice: PiperVoice,
+        options: EngineOptions
+    ) -> Optional[BatchSynthesizer]:
+        """Batched inference when asked for and supported."""
+        if options.batch_size <= 1:
+            return None
+        if not BatchSynthesizer.supports(voice):
+            print("No duration output; synthesizing per phrase")
+            return None
+        return BatchSynthesizer(voice, options.batch_size)
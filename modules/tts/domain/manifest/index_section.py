@@ -0,0 +1,69 @@
+"""
+Index Section - Titles listed between ÍNDICE and its end.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+INDEX_START = "ÍNDICE"
+INDEX_END = "FIN DEL ÍNDICE"
+WORK_MARKER = "$"
+
+
+class IndexSection:
+    """Read the index and locate its titles in the body."""
+
+    @staticmethod
+    def titles(lines: List[str]) -> List[Tuple[str, int]]:
+        """Extract work titles from index section."""
+        works = []
+        in_index = False
+        
+        for line in lines:
+            line_stripped = line.strip()
+            
+            if INDEX_START in line_stripped:
+                in_index = True
+                continue
+            
+            if INDEX_END in line_stripped:
+                break
+            
+            if in_index and line_stripped.startswith(WORK_MARKER):
+                title = line_stripped[1:].strip()
+                year = IndexSection.year(title)
+                
+                if year:
+                    title = re.sub(r'\s*\(\d{4}\)\s*$', '', title)
+                
+                works.append((title, year))
+        
+        return works
+    
+    @staticmethod
+    def year(title: str) -> Optional[int]:
+        """Extract year from title."""
+        match = re.search(r'\((\d{4})\)', title)
+        return int(match.group(1)) if match else None
+    
+    @staticmethod
+    def standalone_lines(lines: List[str]) -> Dict[str, int]:
+        """
+        First line number of each non-empty line after ÍNDICE.
+        
+        Built in one pass so every title lookup is O(1).
+        """
+        line_map: Dict[str, int] = {}
+        index_seen = False
+        for line_num, line in enumerate(lines, 1):
+            line_clean = line.strip().upper()
+            
+            if not index_seen and INDEX_END in line.strip():
+                # Skip ÍNDICE section, this line included
+                index_seen = True
+                line_map.clear()
+                continue
+            
+            if line_clean and line_clean not in line_map:
+                line_map[line_clean] = line_num
+        
+        return line_map
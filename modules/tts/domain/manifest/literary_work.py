@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict
+import re
+
+
+@dataclass
+class Work:
+    """Represents a single literary work."""
+    id: int
+    title: str
+    year: Optional[int]
+    start_line: int
+    end_line: int = 0
+    text_content: str = ""
+    chapters: List[str] = field(default_factory=list)
+    status: str = "pending"
+    start_byte: Optional[int] = None
+    end_byte: Optional[int] = None
+    
+    @property
+    def sanitized_title(self) -> str:
+        """Clean title for filesystem."""
+        clean = self.title.strip()
+        clean = re.sub(r'[^\w\s-]', '', clean)
+        clean = re.sub(r'[-\s]+', '_', clean)
+        return clean[:50].upper()
+    
+    @property
+    def folder_name(self) -> str:
+        """Generate folder name."""
+        return f"{self.id:02d}_{self.sanitized_title}"
+    
+    @property
+    def estimated_lines(self) -> int:
+        """Calculate work size."""
+        return self.end_line - self.start_line
+    
+    def to_dict(self) -> Dict:
+        """Convert to JSON-serializable dict."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "year": self.year,
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+            "estimated_lines": self.estimated_lines,
+            "folder_name": self.folder_name,
+            "status": self.status,
+            "start_byte": self.start_byte,
+            "end_byte": self.end_byte
+        }
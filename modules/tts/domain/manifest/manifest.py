@@ -3,50 +3,9 @@ from typing import List, Optional, Dict
 from pathlib import Path
 import json
 from datetime import datetime
-import re
 
-
-@dataclass
-class Work:
-    """Represents a single literary work."""
-    id: int
-    title: str
-    year: Optional[int]
-    start_line: int
-    end_line: int = 0
-    text_content: str = ""
-    chapters: List[str] = field(default_factory=list)
-    
-    @property
-    def sanitized_title(self) -> str:
-        """Clean title for filesystem."""
-        clean = self.title.strip()
-        clean = re.sub(r'[^\w\s-]', '', clean)
-        clean = re.sub(r'[-\s]+', '_', clean)
-        return clean[:50].upper()
-    
-    @property
-    def folder_name(self) -> str:
-        """Generate folder name."""
-        return f"{self.id:02d}_{self.sanitized_title}"
-    
-    @property
-    def estimated_lines(self) -> int:
-        """Calculate work size."""
-        return self.end_line - self.start_line
-    
-    def to_dict(self) -> Dict:
-        """Convert to JSON-serializable dict."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "year": self.year,
-            "start_line": self.start_line,
-            "end_line": self.end_line,
-            "estimated_lines": self.estimated_lines,
-            "folder_name": self.folder_name,
-            "status": "pending"
-        }
+from modules.tts.domain.work.source_stamp import SourceStamp
+from .literary_work import Work
 
 
 @dataclass
@@ -59,6 +18,15 @@ class Manifest:
     created_at: str = field(
         default_factory=lambda: datetime.now().isoformat()
     )
+    source_size: Optional[int] = None
+    source_mtime_ns: Optional[int] = None
+    
+    @property
+    def source_stamp(self) -> Optional[SourceStamp]:
+        """Book size/mtime the byte ranges were taken from."""
+        if self.source_size is None or self.source_mtime_ns is None:
+            return None
+        return SourceStamp(self.source_size, self.source_mtime_ns)
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Manifest':
@@ -69,7 +37,10 @@ class Manifest:
                 title=w['title'],
                 year=w.get('year'),
                 start_line=w['start_line'],
-                end_line=w['end_line']
+                end_line=w['end_line'],
+                status=w.get('status', 'pending'),
+                start_byte=w.get('start_byte'),
+                end_byte=w.get('end_byte')
             )
             for w in data.get('works', [])
         ]
@@ -79,7 +50,9 @@ class Manifest:
             source_file=data['source_file'],
             total_works=data['total_works'],
             works=works,
-            created_at=data.get('created_at', '')
+            created_at=data.get('created_at', ''),
+            source_size=data.get('source_size'),
+            source_mtime_ns=data.get('source_mtime_ns')
         )
     
     def to_dict(self) -> Dict:
@@ -89,6 +62,8 @@ class Manifest:
             "source_file": self.source_file,
             "total_works": self.total_works,
             "created_at": self.created_at,
+            "source_size": self.source_size,
+            "source_mtime_ns": self.source_mtime_ns,
             "works": [w.to_dict() for w in self.works]
         }
     
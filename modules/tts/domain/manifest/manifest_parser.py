@@ -1,19 +1,17 @@
-import re
-from typing import List, Tuple
+from typing import Dict, List, Optional
 from pathlib import Path
-from modules.tts.domain.manifest import Work, Manifest
+from modules.tts.domain.manifest import Manifest
+from .index_section import IndexSection
+from .work_layout import WorkLayout
 
 
 class ManifestParser:
     """Parse book file and generate manifest."""
     
-    INDEX_START = "ÍNDICE"
-    INDEX_END = "FIN DEL ÍNDICE"
-    WORK_MARKER = "$"
-    
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
         self.lines: List[str] = []
+        self._line_map: Optional[Dict[str, int]] = None
         self.author = self._extract_author()
     
     def _extract_author(self) -> str:
@@ -25,8 +23,14 @@ class ManifestParser:
     def parse(self) -> Manifest:
         """Parse file and create manifest."""
         self._load_file()
-        index_works = self._extract_index()
-        works = self._find_work_boundaries(index_works)
+        works = WorkLayout.bound(
+            IndexSection.titles(self.lines),
+            self._find_work_start,
+            len(self.lines)
+        )
+        stamp = WorkLayout.add_byte_ranges(
+            self.file_path, len(self.lines), works
+        )
         
         manifest = Manifest(
             author=self.author,
@@ -34,6 +38,8 @@ class ManifestParser:
             total_works=len(works),
             works=works
         )
+        if stamp:
+            manifest.source_size, manifest.source_mtime_ns = stamp
         
         return manifest
     
@@ -41,94 +47,10 @@ class ManifestParser:
         """Load file into memory."""
         with open(self.file_path, 'r', encoding='utf-8') as f:
             self.lines = f.readlines()
+        self._line_map = None
     
-    def _extract_index(self) -> List[Tuple[str, int]]:
-        """Extract work titles from index section."""
-        works = []
-        in_index = False
-        
-        for line_num, line in enumerate(self.lines, 1):
-            line_stripped = line.strip()
-            
-            if self.INDEX_START in line_stripped:
-                in_index = True
-                continue
-            
-            if self.INDEX_END in line_stripped:
-                break
-            
-            if in_index and line_stripped.startswith(self.WORK_MARKER):
-                title = line_stripped[1:].strip()
-                year = self._extract_year(title)
-                
-                if year:
-                    title = re.sub(r'\s*\(\d{4}\)\s*$', '', title)
-                
-                works.append((title, year))
-        
-        return works
-    
-    def _extract_year(self, title: str) -> int:
-        """Extract year from title."""
-        match = re.search(r'\((\d{4})\)', title)
-        return int(match.group(1)) if match else None
-    
-    def _find_work_boundaries(
-        self, 
-        index_works: List[Tuple[str, int]]
-    ) -> List[Work]:
-        """Find and order works by position."""
-        works = []
-        seen_lines = set()
-        
-        for title, year in index_works:
-            start_line = self._find_work_start(title)
-            
-            if start_line and start_line not in seen_lines:
-                work = Work(
-                    id=0,
-                    title=title,
-                    year=year,
-                    start_line=start_line
-                )
-                works.append(work)
-                seen_lines.add(start_line)
-        
-        works.sort(key=lambda w: w.start_line)
-        
-        for i, work in enumerate(works, 1):
-            work.id = i
-        
-        for i in range(len(works) - 1):
-            works[i].end_line = works[i + 1].start_line - 1
-        
-        if works:
-            works[-1].end_line = len(self.lines)
-        
-        return works
-    
-    def _find_work_start(self, title: str) -> int:
+    def _find_work_start(self, title: str) -> Optional[int]:
         """Find work start (standalone title)."""
-        title_clean = title.upper().strip()
-        
-        # Find where ÍNDICE ends to skip searching there
-        index_end_line = 0
-        for line_num, line in enumerate(self.lines, 1):
-            if self.INDEX_END in line.strip():
-                index_end_line = line_num
-                break
-        
-        for line_num, line in enumerate(self.lines, 1):
-            # Skip ÍNDICE section
-            if line_num <= index_end_line:
-                continue
-            
-            line_clean = line.strip().upper()
-            
-            if not line_clean:
-                continue
-            
-            if line_clean == title_clean:
-                return line_num
-        
-        return None
+        if self._line_map is None:
+            self._line_map = IndexSection.standalone_lines(self.lines)
+        return self._line_map.get(title.upper().strip())
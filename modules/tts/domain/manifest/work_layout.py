@@ -0,0 +1,66 @@
+"""
+Work Layout - Order works and give each its line and byte span.
+"""
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from modules.tts.domain.work.line_index import LineIndex
+from modules.tts.domain.work.source_stamp import SourceStamp
+from .manifest import Work
+
+
+class WorkLayout:
+    """Turn located index titles into numbered, bounded works."""
+
+    @staticmethod
+    def bound(
+        index_works: List[Tuple[str, int]],
+        find_start: Callable[[str], Optional[int]],
+        total_lines: int
+    ) -> List[Work]:
+        """Find and order works by position."""
+        works = []
+        seen_lines = set()
+        
+        for title, year in index_works:
+            start_line = find_start(title)
+            
+            if start_line and start_line not in seen_lines:
+                work = Work(
+                    id=0,
+                    title=title,
+                    year=year,
+                    start_line=start_line
+                )
+                works.append(work)
+                seen_lines.add(start_line)
+        
+        works.sort(key=lambda w: w.start_line)
+        
+        for i, work in enumerate(works, 1):
+            work.id = i
+        
+        for i in range(len(works) - 1):
+            works[i].end_line = works[i + 1].start_line - 1
+        
+        if works:
+            works[-1].end_line = total_lines
+        
+        return works
+    
+    @staticmethod
+    def add_byte_ranges(
+        file_path: Path,
+        total_lines: int,
+        works: List[Work]
+    ) -> Optional[SourceStamp]:
+        """Store each body's byte span; stamp the file read."""
+        stamp = SourceStamp.of(file_path)
+        index = LineIndex.from_file(file_path)
+        if index.line_count != total_lines:
+            return None  # Lone CR newlines; keep line numbers only
+        for work in works:
+            work.start_byte, work.end_byte = index.byte_range(
+                work.start_line + 1, work.end_line
+            )
+        return stamp
@@ -0,0 +1,13 @@
+"""
+Chunk Hash - Identity of a chunk and its render settings.
+"""
+import hashlib
+
+from modules.tts.domain.text.pause_tokens import Chunk, to_markup
+
+
+def chunk_hash(chunk: Chunk, signature: str = "") -> str:
+    """Short hash of a chunk and the settings it is rendered with."""
+    digest = hashlib.sha1(signature.encode())
+    digest.update(to_markup(chunk, sep=" ").encode())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,36 @@
+"""
+Pause Marks - Which marks pause, and for how long.
+"""
+import re
+from typing import Dict, Optional, Pattern
+
+from modules.tts.domain.text.pause_config import PauseConfig
+from modules.tts.domain.text.pause_tokens import Pause
+
+# Marks that become pauses; '¿' and '¡' are dropped.
+PAUSED_MARKS = ('...', '—', '–', ';', ':', ',', '?', '!', '.')
+DROPPED_MARKS = ('¿', '¡')
+
+# Structural markers left by the title and Roman modules.
+STRUCTURAL_MARKERS = {'§PAUSE2000§': 2.0, '§PAUSE500§': 0.5}
+
+PauseTable = Dict[str, Optional[Pause]]
+
+
+def pause_table(config=PauseConfig) -> PauseTable:
+    """Pause emitted for each recognised mark."""
+    table: PauseTable = {
+        mark: Pause(config.get_pause_seconds(mark))
+        for mark in PAUSED_MARKS
+    }
+    table.update(dict.fromkeys(DROPPED_MARKS))
+    for marker, seconds in STRUCTURAL_MARKERS.items():
+        table[marker] = Pause(seconds)
+    return table
+
+
+def mark_pattern(table: PauseTable) -> Pattern:
+    """One alternation over every mark in the table."""
+    # Longest first so '...' wins over '.'
+    marks = sorted(table, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(m) for m in marks))
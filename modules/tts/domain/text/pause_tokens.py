@@ -0,0 +1,47 @@
+"""
+Pause Tokens - Typed text/pause stream for synthesis.
+"""
+import re
+from typing import (
+    Iterable, List, NamedTuple, Optional, Tuple, Union
+)
+
+
+class Pause(NamedTuple):
+    """Silence of a fixed length, in seconds."""
+    seconds: float
+
+
+Token = Union[str, Pause]
+Chunk = Tuple[Token, ...]
+
+SILENCE_TAG = re.compile(r'<silence:([\d.]+)>')
+
+
+def from_markup(text: str) -> List[Token]:
+    """Parse legacy <silence:X> markup into tokens."""
+    parts = SILENCE_TAG.split(text)
+    return [
+        Pause(float(part)) if i % 2 else part
+        for i, part in enumerate(parts)
+        if i % 2 or part
+    ]
+
+
+def to_markup(tokens: Iterable[Token], sep: str = "") -> str:
+    """Render tokens as <silence:X> markup."""
+    out = []
+    for token in tokens:
+        if isinstance(token, Pause):
+            tag = f"<silence:{token.seconds}>"
+            out.append(sep + tag if out else tag)
+        else:
+            out.append(token)
+    return "".join(out)
+
+
+def lone_pause(chunk: Chunk) -> Optional[Pause]:
+    """The pause of a silence-only chunk, else None."""
+    if len(chunk) == 1 and isinstance(chunk[0], Pause):
+        return chunk[0]
+    return None
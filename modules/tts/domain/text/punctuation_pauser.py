@@ -1,13 +1,16 @@
 """
 Punctuation Pauser with Manual Equalizer Configuration.
 """
-import re
+from typing import Iterator
+
 from modules.tts.domain.text.pause_config import PauseConfig
+from modules.tts.domain.text.pause_marks import mark_pattern, pause_table
+from modules.tts.domain.text.pause_tokens import Token, to_markup
 
 
 class PunctuationPauser:
     """
-    Converts punctuation to silence markers.
+    Converts punctuation to pauses.
     
     Uses PauseConfig equalizer for timing control.
     """
@@ -15,13 +18,41 @@ class PunctuationPauser:
     def __init__(self):
         """Initialize with configured pause durations."""
         self.config = PauseConfig
+        self.pauses = pause_table(self.config)
+        self.pattern = mark_pattern(self.pauses)
+    
+    def tokenize(self, text: str) -> Iterator[Token]:
+        """
+        Split text into text segments and Pause tokens.
+        
+        One regex scan over the text; segments around a
+        dropped mark are joined, so '¿Qué' stays one segment.
+        """
+        pending = []
+        pos = 0
+        for match in self.pattern.finditer(text):
+            pending.append(text[pos:match.start()])
+            pos = match.end()
+            pause = self.pauses[match.group()]
+            if pause is None:
+                continue
+            segment = "".join(pending)
+            if segment:
+                yield segment
+            yield pause
+            pending = []
+        
+        pending.append(text[pos:])
+        segment = "".join(pending)
+        if segment:
+            yield segment
     
     def add_pauses(self, text: str) -> str:
         """
         Replace punctuation with <silence:X> markers.
         
-        Uses safe temporary markers without punctuation.
-        Preserves §PAUSEXXXX§ markers from other modules.
+        Markup form of tokenize(), kept for callers that
+        still expect tagged text.
         
         Args:
             text: Input text with punctuation
@@ -29,44 +60,7 @@ class PunctuationPauser:
         Returns:
             Text with punctuation converted to silence markers
         """
-        # Convert punctuation to temp markers
-        text = text.replace('...', '§ELLIPSIS§')
-        text = text.replace('—', '§EMDASH§')
-        text = text.replace('–', '§ENDASH§')
-        text = text.replace(';', '§SEMICOLON§')
-        text = text.replace(':', '§COLON§')
-        text = text.replace(',', '§COMMA§')
-        text = text.replace('¿', '')
-        text = text.replace('¡', '')
-        text = text.replace('?', '§QUESTION§')
-        text = text.replace('!', '§EXCLAMATION§')
-        text = text.replace('.', '§PERIOD§')
-        
-        # Convert temp markers to silence tags
-        text = text.replace('§ELLIPSIS§', 
-            f"<silence:{self.config.get_pause_seconds('...')}>")
-        text = text.replace('§EMDASH§', 
-            f"<silence:{self.config.get_pause_seconds('—')}>")
-        text = text.replace('§ENDASH§', 
-            f"<silence:{self.config.get_pause_seconds('–')}>")
-        text = text.replace('§SEMICOLON§', 
-            f"<silence:{self.config.get_pause_seconds(';')}>")
-        text = text.replace('§COLON§', 
-            f"<silence:{self.config.get_pause_seconds(':')}>")
-        text = text.replace('§COMMA§', 
-            f"<silence:{self.config.get_pause_seconds(',')}>")
-        text = text.replace('§QUESTION§', 
-            f"<silence:{self.config.get_pause_seconds('?')}>")
-        text = text.replace('§EXCLAMATION§', 
-            f"<silence:{self.config.get_pause_seconds('!')}>")
-        text = text.replace('§PERIOD§', 
-            f"<silence:{self.config.get_pause_seconds('.')}>")
-        
-        # Convert structural pause markers (from title/roman)
-        text = text.replace('§PAUSE2000§', '<silence:2.0>')
-        text = text.replace('§PAUSE500§', '<silence:0.5>')
-        
-        return text
+        return to_markup(self.tokenize(text))
     
     def convert_to_piper_format(self, text: str) -> str:
         """
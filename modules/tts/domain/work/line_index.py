@@ -0,0 +1,43 @@
+"""
+Line Index - Byte offsets of the lines of a text file.
+"""
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+
+class LineIndex:
+    """
+    Start offset of every line, plus the end of file.
+
+    Lines end at b'\\n' as in readlines(), so line i spans
+    offsets[i]:offsets[i + 1] and no text is decoded.
+    """
+
+    def __init__(self, offsets: np.ndarray):
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, data) -> 'LineIndex':
+        """Index a bytes-like buffer (bytes or mmap)."""
+        raw = np.frombuffer(data, dtype=np.uint8)
+        ends = np.flatnonzero(raw == 0x0A) + 1
+        tail = [len(raw)] if len(raw) and raw[-1] != 0x0A else []
+        return cls(np.concatenate(([0], ends, tail)))
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'LineIndex':
+        """Index a file on disk."""
+        return cls.build(Path(path).read_bytes())
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, as len(readlines())."""
+        return len(self.offsets) - 1
+
+    def byte_range(self, first: int, stop: int) -> Tuple[int, int]:
+        """Bytes of lines[first:stop], list-slice style."""
+        first = min(max(first, 0), self.line_count)
+        stop = min(max(stop, first), self.line_count)
+        return int(self.offsets[first]), int(self.offsets[stop])
@@ -0,0 +1,44 @@
+"""
+Mapped Book - Read-only memory map of a source file.
+"""
+import mmap
+from pathlib import Path
+from typing import Optional
+
+from .line_index import LineIndex
+
+
+class MappedBook:
+    """Source bytes mapped once, with a lazy line index."""
+    
+    def __init__(self, source_file: str):
+        self.source_file = Path(source_file)
+        self.data = self._map_source()
+        self._index: Optional[LineIndex] = None
+    
+    def __enter__(self) -> 'MappedBook':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Unmap the source file."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+    
+    def _map_source(self):
+        """Read-only view of the source bytes."""
+        if not self.source_file.stat().st_size:
+            return b""
+        with open(self.source_file, 'rb') as f:
+            return mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+    
+    @property
+    def index(self) -> LineIndex:
+        """Line offsets, built on first use."""
+        if self._index is None:
+            self._index = LineIndex.build(self.data)
+        return self._index
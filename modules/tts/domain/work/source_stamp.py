@@ -0,0 +1,17 @@
+"""
+Source Stamp - Size and mtime of the book a manifest indexes.
+"""
+from pathlib import Path
+from typing import NamedTuple
+
+
+class SourceStamp(NamedTuple):
+    """Byte offsets recorded against a file hold while it matches."""
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: Path) -> 'SourceStamp':
+        """Current stamp of a file on disk."""
+        stat = Path(path).stat()
+        return cls(stat.st_size, stat.st_mtime_ns)
@@ -0,0 +1,27 @@
+"""
+Work Files - Per-work text and metadata on disk.
+"""
+import json
+from pathlib import Path
+
+from modules.tts.domain.manifest import Work
+
+
+class WorkFiles:
+    """Write a work's folder: text.txt and metadata.json."""
+    
+    @staticmethod
+    def save(work: Work, output_dir: Path, content: str) -> Path:
+        """Save work to individual file."""
+        work_dir = output_dir / work.folder_name
+        work_dir.mkdir(parents=True, exist_ok=True)
+        
+        work_file = work_dir / "text.txt"
+        with open(work_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        meta_file = work_dir / "metadata.json"
+        with open(meta_file, 'w', encoding='utf-8') as f:
+            json.dump(work.to_dict(), f, indent=2)
+        
+        return work_file
@@ -2,52 +2,66 @@
 Work Processor - Extract and process works.
 """
 from pathlib import Path
-from typing import List
-import json
+from typing import Optional, Tuple
 
 from modules.tts.domain.manifest import Work
+from .mapped_book import MappedBook
+from .source_stamp import SourceStamp
+from .work_files import WorkFiles
 
 
-class WorkExtractor:
-    """Extract work content from source."""
+class WorkExtractor(MappedBook):
+    """
+    Extract work content from source.
     
-    def __init__(self, source_file: str):
-        self.source_file = Path(source_file)
-        self.lines = self._load_lines()
+    The book is memory-mapped once; each work decodes only
+    its own byte range. Ranges stored in the manifest are
+    used only while the book still matches the manifest's
+    stamp, otherwise they come from the line index.
+    """
     
-    def _load_lines(self) -> List[str]:
-        """Load all lines."""
-        with open(self.source_file, 'r', encoding='utf-8') as f:
-            return f.readlines()
+    def __init__(
+        self,
+        source_file: str,
+        stamp: Optional[SourceStamp] = None
+    ):
+        super().__init__(source_file)
+        self.trust_ranges = (
+            stamp is not None
+            and SourceStamp(*stamp) == SourceStamp.of(source_file)
+        )
     
-    def extract(self, work: Work) -> str:
-        """Extract work text with title."""
+    def byte_range(self, work: Work) -> Tuple[int, int]:
+        """Byte span of the work body (title line skipped)."""
+        if self.trust_ranges and work.end_byte is not None:
+            return work.start_byte, work.end_byte
         # start_line points to title in file, skip it
         # Skip title line + empty line after it
-        start = work.start_line + 1
-        end = work.end_line
-        
-        content_lines = self.lines[start:end]
+        return self.index.byte_range(
+            work.start_line + 1, work.end_line
+        )
+    
+    def extract(self, work: Work) -> str:
+        """Extract work text with title."""
+        start, end = self.byte_range(work)
+        body = self.data[start:end].decode('utf-8')
+        if '\r' in body:
+            # Same newlines as reading in text mode
+            body = body.replace('\r\n', '\n').replace('\r', '\n')
         
         # Prepend title for TTS processing
         title_line = work.title + '\n'
-        content = title_line + ''.join(content_lines)
+        content = title_line + body
         
         return content
     
-    def save_work(self, work: Work, output_dir: Path):
+    def save_work(
+        self,
+        work: Work,
+        output_dir: Path,
+        content: Optional[str] = None
+    ) -> Path:
         """Save work to individual file."""
-        work_dir = output_dir / work.folder_name
-        work_dir.mkdir(parents=True, exist_ok=True)
-        
-        work_file = work_dir / "text.txt"
-        content = self.extract(work)
-        
-        with open(work_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        meta_file = work_dir / "metadata.json"
-        with open(meta_file, 'w', encoding='utf-8') as f:
-            json.dump(work.to_dict(), f, indent=2)
-        
-        return work_file
+        if content is None:
+            content = self.extract(work)
+        return WorkFiles.save(work, output_dir, content)
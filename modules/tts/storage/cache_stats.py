@@ -0,0 +1,41 @@
+"""
+Cache Stats - Hit/miss counters for the synthesis cache.
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStats:
+    """Counters that can be diffed and summed across runs."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def __add__(self, other: 'CacheStats') -> 'CacheStats':
+        return CacheStats(
+            self.hits + other.hits,
+            self.misses + other.misses,
+            self.evictions + other.evictions
+        )
+
+    def __sub__(self, other: 'CacheStats') -> 'CacheStats':
+        return CacheStats(
+            self.hits - other.hits,
+            self.misses - other.misses,
+            self.evictions - other.evictions
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """One-line report for the CLI."""
+        return (
+            f"Synthesis cache: {self.hits} hits, "
+            f"{self.misses} misses "
+            f"({self.hit_rate:.0%}), "
+            f"{self.evictions} evicted"
+        )
@@ -0,0 +1,41 @@
+"""
+Job Journal - Per-manifest directory of work journals.
+"""
+import shutil
+from pathlib import Path
+
+from .work_journal import WorkJournal
+
+
+class JobJournal:
+    """
+    One journal file per work under a manifest directory.
+
+    Each work is only ever written by the process that
+    renders it, so pool workers never contend.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    @classmethod
+    def for_manifest(
+        cls,
+        manifest_file: str,
+        output_dir: str,
+        fresh: bool = False
+    ) -> 'JobJournal':
+        """Journal stored beside the work outputs."""
+        name = Path(manifest_file).stem
+        journal = cls(Path(output_dir) / ".jobs" / name)
+        if fresh:
+            journal.clear()
+        return journal
+
+    def work(self, work_id: int) -> WorkJournal:
+        """Journal of a single work."""
+        return WorkJournal(self.root / f"work_{work_id}.json")
+
+    def clear(self) -> None:
+        """Forget all recorded progress."""
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,39 @@
+"""
+Json Record - A dict persisted as one JSON file.
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+
+class JsonRecord:
+    """Loaded on creation, replaced atomically on save."""
+
+    def __init__(self, path: Path, save_interval: float = 2.0):
+        self.path = Path(path)
+        self.save_interval = save_interval
+        self.data = self._load()
+        self._saved_at = 0.0
+
+    def save_due(self) -> bool:
+        """Throttle chunk-level saves."""
+        elapsed = time.monotonic() - self._saved_at
+        return elapsed >= self.save_interval
+
+    def save(self) -> None:
+        """Atomically replace the journal file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_suffix(".tmp")
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f)
+        os.replace(temp, self.path)
+        self._saved_at = time.monotonic()
+
+    def _load(self) -> dict:
+        """Previous journal, or an empty one."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
@@ -0,0 +1,65 @@
+"""
+LRU Directory - Byte-capped file store, oldest use evicted first.
+"""
+from pathlib import Path
+from typing import Optional
+
+from .cache_stats import CacheStats
+
+
+class LruDirectory:
+    """
+    Size accounting for files matching a glob under root.
+
+    The size is scanned once per process and then kept
+    up to date by callers; eviction rescans exactly.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        pattern: str,
+        max_bytes: int,
+        stats: CacheStats
+    ):
+        self.root = root
+        self.pattern = pattern
+        self.max_bytes = max_bytes
+        self.stats = stats
+        self._size: Optional[int] = None
+
+    def size(self) -> int:
+        """Bytes on disk, scanned once per process."""
+        if self._size is None:
+            self._size = sum(
+                e.stat().st_size for e in self.root.glob(self.pattern)
+            )
+        return self._size
+
+    def resize(self, size: int) -> None:
+        """Record the new total and enforce the cap."""
+        self._size = size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under cap."""
+        entries = sorted(
+            (e.stat().st_mtime, e.stat().st_size, e)
+            for e in self.root.glob(self.pattern)
+        )
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if self._size <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            self._size -= size
+            self.stats.evictions += 1
+
+
+def file_size(path: Path) -> int:
+    """Size of an existing entry, 0 if absent."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
@@ -0,0 +1,26 @@
+"""
+Run Log - Structured JSONL record of processing runs.
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+
+
+class RunLog:
+    """
+    Append one JSON object per event to a log file.
+
+    Every line carries the run id, so several runs can
+    share a file and still be told apart.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.run_id = datetime.now().isoformat(timespec='seconds')
+
+    def write(self, event: str, **fields) -> None:
+        """Append an event line."""
+        record = {"run": self.run_id, "event": event, **fields}
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,78 @@
+"""
+Synthesis Cache - Content-addressed store of Piper output.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .cache_stats import CacheStats
+from .lru_directory import LruDirectory, file_size
+
+DEFAULT_CACHE_DIR = ".cache/synthesis"
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+
+class SynthesisCache:
+    """
+    Int16 speech segments stored by content hash.
+
+    Entries are touched on every hit; once the directory
+    grows past max_bytes the least recently used go first.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.disk = LruDirectory(
+            self.cache_dir, "*/*.npy", max_bytes, self.stats
+        )
+
+    @staticmethod
+    def key(text: str, *params) -> str:
+        """Hash normalized text with every output parameter."""
+        normalized = " ".join(text.split())
+        payload = json.dumps(
+            [normalized, *params], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return cached samples, or None on a miss."""
+        path = self._path(key)
+        try:
+            samples = np.load(path)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return samples
+
+    def put(self, key: str, samples: np.ndarray) -> None:
+        """Store samples atomically and enforce the size cap."""
+        path = self._path(key)
+        size = self._current_size() - file_size(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp, 'wb') as f:
+            np.save(f, samples.astype(np.int16))
+        os.replace(temp, path)
+
+        self.disk.resize(size + path.stat().st_size)
+
+    def _current_size(self) -> int:
+        """Bytes on disk, scanned once per process."""
+        return self.disk.size()
+
+    def _path(self, key: str) -> Path:
+        """Two-level fan-out keeps directories small."""
+        return self.cache_dir / key[:2] / f"{key}.npy"
@@ -0,0 +1,67 @@
+"""
+Work Journal - Durable progress record for one work.
+"""
+from pathlib import Path
+from typing import List, Tuple
+
+from .json_record import JsonRecord
+
+PENDING = "pending"
+SYNTHESIZED = "synthesized"
+MERGED = "merged"
+ENCODED = "encoded"
+
+
+class WorkJournal(JsonRecord):
+    """
+    Chunk and work state persisted as a small JSON file.
+
+    Chunks are "synthesized" once their samples sit in the
+    work PCM log (end offset recorded). The work becomes
+    "merged" when every chunk is in the log and "encoded"
+    once the MP3 exists.
+    """
+
+    @property
+    def state(self) -> str:
+        """Current work state."""
+        return self.data.get("state", PENDING)
+
+    def completed_output(self, hashes: List[str]) -> str:
+        """MP3 path if this exact text was already encoded."""
+        chunks = self.data.get("chunks", [])
+        done = (
+            self.state == ENCODED
+            and [c["hash"] for c in chunks] == hashes
+        )
+        output = self.data.get("output_file", "")
+        return output if done and Path(output).exists() else ""
+
+    def resume_point(self, hashes: List[str]) -> Tuple[int, int]:
+        """Leading chunks still valid and their byte length."""
+        done, offset = 0, 0
+        for old, new in zip(self.data.get("chunks", []), hashes):
+            if old["hash"] != new or old["state"] != SYNTHESIZED:
+                break
+            done, offset = done + 1, old["offset"]
+        return done, offset
+
+    def begin(self, hashes: List[str], done: int) -> None:
+        """Reset chunk states after the valid prefix."""
+        chunks = self.data.get("chunks", [])[:done]
+        chunks += [
+            {"hash": h, "state": PENDING, "offset": 0}
+            for h in hashes[done:]
+        ]
+        self.data = {"state": PENDING, "chunks": chunks}
+        self.save()
+
+    def record_chunk(self, index: int, offset: int) -> None:
+        """Mark a chunk synthesized, ending at offset."""
+        chunk = self.data["chunks"][index]
+        chunk["state"], chunk["offset"] = SYNTHESIZED, offset
+
+    def mark(self, state: str, **fields) -> None:
+        """Set the work state and persist immediately."""
+        self.data.update(state=state, **fields)
+        self.save()
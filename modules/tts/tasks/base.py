@@ -0,0 +1,45 @@
+"""
+Celery task base for TTS workers.
+"""
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+from celery import Task
+
+from modules.tts.application.chunk_renderer import ChunkRenderer
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.tts_engine import TTSEngine
+
+
+class SynthesisTask(Task):
+    """Base task keeping Piper voices warm per worker."""
+
+    _renderers: Dict[Tuple[str, str], ChunkRenderer] = {}
+
+    def renderer(
+        self,
+        language: str,
+        options: Optional[dict] = None
+    ) -> ChunkRenderer:
+        """
+        Lazy load one renderer per language and options.
+        
+        Unset thread counts are split between this worker's
+        processes, so a host is not oversubscribed.
+        """
+        options = options or {}
+        key = (language, json.dumps(options, sort_keys=True))
+        if key not in self._renderers:
+            processes = (
+                self.app.conf.worker_concurrency or os.cpu_count()
+            )
+            engine = TTSEngine(
+                language,
+                options=EngineOptions(**options).for_processes(
+                    processes or 1
+                )
+            )
+            engine.load_model()
+            self._renderers[key] = ChunkRenderer(engine)
+        return self._renderers[key]
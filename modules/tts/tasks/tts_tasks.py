@@ -1,61 +1,65 @@
 from infrastructure.celery.celeryconfig import app
-from modules.tts.domain.core.tts_engine import TTSEngine
-from modules.tts.domain.audio_merger import ChapterMerger
-from modules.tts.storage.minio_client import MinIOClient
+from modules.tts.application.chapter_assembly import ChapterAssembly
+from modules.tts.domain.audio.pcm_io import PcmIO
+from modules.tts.domain.text.pause_tokens import from_markup
+from .base import SynthesisTask
+from dataclasses import asdict
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 
-@app.task(name='tts.synthesize_chunk')
+@app.task(base=SynthesisTask, bind=True, name='tts.synthesize_chunk')
 def synthesize_chunk(
+    self,
     text: str,
     chunk_id: str,
     language: str = "es",
-    speaker_wav: str = None
-) -> str:
-    """Generate audio for single text chunk."""
-    engine = TTSEngine(language=language)
+    chunk_dir: str = "outputs/temp/chunks",
+    options: dict = None
+) -> Dict:
+    """
+    Generate audio for single text chunk.
     
-    output_dir = Path("outputs/temp/chunks")
+    Text carries <silence:X> markers; the WAV goes to
+    chunk_dir, which the merging worker must also see.
+    """
+    renderer = self.renderer(language, options)
+    before = renderer.metrics.copy()
+    
+    output_dir = Path(chunk_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     output_path = output_dir / f"{chunk_id}.wav"
-    
-    success = engine.synthesize(
-        text=text,
-        output_path=str(output_path),
-        speaker_wav=speaker_wav
+    samples = renderer.render_one(tuple(from_markup(text)))
+    PcmIO.write_wav(
+        str(output_path), [samples], renderer.sample_rate
     )
     
-    if success:
-        return str(output_path)
-    
-    raise Exception(f"TTS failed for chunk {chunk_id}")
+    return {
+        "path": str(output_path),
+        "metrics": asdict(renderer.metrics - before),
+    }
 
 
 @app.task(name='tts.merge_chapter')
 def merge_chapter(
-    chunk_paths: List[str],
+    chunks: List[Dict],
     chapter_name: str,
-    output_bucket: str = None
-) -> str:
-    """Merge audio chunks into chapter file."""
-    merger = ChapterMerger()
+    output_bucket: str = None,
+    output_path: str = None
+) -> Dict:
+    """
+    Merge audio chunks into chapter file.
     
-    output_dir = Path("outputs/temp")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    output_path = output_dir / f"{chapter_name}.mp3"
-    
-    success = merger.merge_chapter(
-        chunk_paths=chunk_paths,
-        output_path=str(output_path)
+    Chord callback for synthesize_chunk results, in
+    chunk order; the chunk WAVs are removed afterwards.
+    """
+    output_path, metrics = ChapterAssembly().run(
+        chunks, chapter_name, output_path
     )
     
-    if not success:
-        raise Exception(f"Merge failed: {chapter_name}")
-    
     if output_bucket:
+        from modules.tts.storage.minio_client import MinIOClient
         storage = MinIOClient()
         storage.upload_file(
             str(output_path),
@@ -63,4 +67,7 @@ def merge_chapter(
             output_bucket
         )
     
-    return str(output_path)
+    return {
+        "output_file": str(output_path),
+        "metrics": asdict(metrics),
+    }
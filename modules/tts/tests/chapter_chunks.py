@@ -0,0 +1,37 @@
+"""
+Chapter Chunks - Synthesize each chapter chunk to its own WAV.
+"""
+from pathlib import Path
+from typing import List
+
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.audio.silence_generator import (
+    SilenceGenerator
+)
+from modules.tts.domain.text.pause_tokens import (
+    Chunk, lone_pause, to_markup
+)
+
+
+def generate_chunks(chunks: List[Chunk], output_dir: Path) -> None:
+    """Write chunk_NNN.wav for every chunk, in order."""
+    engine = TTSEngine(language="es_mx")
+    silence_gen = SilenceGenerator()
+
+    print("\nGenerating audio chunks...")
+    for i, chunk in enumerate(chunks, 1):
+        print(f"  [{i}/{len(chunks)}]", end=" ")
+
+        chunk_path = output_dir / f"chunk_{i:03d}.wav"
+
+        pause = lone_pause(chunk)
+        if pause:
+            print(f"Silence {pause.seconds}s")
+            silence_gen.generate_silence(
+                pause.seconds,
+                str(chunk_path)
+            )
+        else:
+            text = to_markup(chunk, sep=" ")
+            print(f"{len(text)} chars")
+            engine.synthesize(text, str(chunk_path))
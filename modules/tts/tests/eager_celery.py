@@ -0,0 +1,49 @@
+"""
+Eager Celery - In-process broker and chord runner for tests.
+"""
+import pytest
+
+from infrastructure.celery.celeryconfig import app
+from modules.tts.application.distributed_runner import (
+    DistributedWorkRunner
+)
+from modules.tts.application.work_chords import WorkChords
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.stub_voice import StubVoice
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.manifest import Work
+from modules.tts.domain.work.work_processor import WorkExtractor
+from modules.tts.tasks.tts_tasks import merge_chapter, synthesize_chunk
+
+BOOK = "CAPÍTULO\n\nHola, mundo. ¿Qué tal?\n\nBien; gracias.\n"
+WORK = Work(
+    id=1, title="Capítulo", year=None, start_line=1, end_line=5
+)
+
+
+@pytest.fixture
+def eager(monkeypatch):
+    """Run tasks in-process and use the stub voice."""
+    monkeypatch.setattr(
+        TTSEngine, "load_model",
+        lambda self: setattr(self, "voice", StubVoice())
+    )
+    saved = dict(app.conf)
+    app.conf.update(
+        task_always_eager=True, task_eager_propagates=True,
+        broker_url="memory://", result_backend="cache+memory://"
+    )
+    monkeypatch.setattr(app, "_local", type(app._local)())
+    yield
+    app.conf.update(saved)
+
+
+def chord_runner(tmp_path, journal=None):
+    """Runner over a one-work book written to tmp_path."""
+    book = tmp_path / "book.txt"
+    book.write_text(BOOK, encoding='utf-8')
+    chords = WorkChords(
+        synthesize_chunk, merge_chapter, WorkExtractor(str(book)),
+        str(tmp_path / "out"), "es", EngineOptions()
+    )
+    return DistributedWorkRunner(chords, journal)
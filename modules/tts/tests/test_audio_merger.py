@@ -0,0 +1,73 @@
+"""
+Unit tests for the streaming audio merger.
+"""
+import io
+import wave
+
+import numpy as np
+
+from modules.tts.domain.audio.audio_merger import AudioMerger
+from modules.tts.domain.audio.pcm_io import PcmIO
+
+
+def _wav_bytes(samples, rate):
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def test_wav_merge_concatenates_paths_and_buffers(tmp_path):
+    """Files, WAV bytes and arrays come out in order."""
+    rng = np.random.default_rng(1)
+    parts = [
+        rng.integers(-3000, 3000, n).astype(np.int16)
+        for n in (70000, 10, 5000)
+    ]
+    first = PcmIO.write_wav(str(tmp_path / "a.wav"), [parts[0]], 16000)
+    chunks = [first, _wav_bytes(parts[1], 16000), parts[2]]
+    out = tmp_path / "out.wav"
+
+    assert AudioMerger("wav").merge_chunks(chunks, str(out))
+
+    samples, params = PcmIO.read_wav(str(out))
+    assert params.framerate == 16000
+    assert np.array_equal(samples, np.concatenate(parts))
+
+
+def test_mismatched_rate_is_resampled(tmp_path):
+    """A 44.1 kHz chunk is decoded to the output rate."""
+    tone = (np.sin(np.arange(44100) / 10) * 8000).astype(np.int16)
+    chunks = [np.zeros(22050, np.int16), _wav_bytes(tone, 44100)]
+    out = tmp_path / "out.wav"
+
+    assert AudioMerger("wav").merge_chunks(chunks, str(out), 22050)
+
+    samples, _ = PcmIO.read_wav(str(out))
+    assert abs(len(samples) - 44100) < 100
+    assert np.abs(samples[22050:]).max() > 4000
+
+
+def test_float_arrays_are_rejected(tmp_path, capsys):
+    """Float samples fail instead of truncating to zero."""
+    chunks = [np.zeros(10, np.int16), np.full(10, 0.5)]
+    out = tmp_path / "out.wav"
+
+    assert not AudioMerger("wav").merge_chunks(chunks, str(out), 16000)
+
+    assert "chunk 1" in capsys.readouterr().out
+    assert not out.exists()
+
+
+def test_undecodable_bytes_name_the_chunk(tmp_path, capsys):
+    """Decode errors say which chunk failed."""
+    chunks = [np.zeros(10, np.int16), b"not audio at all"]
+    out = tmp_path / "out.wav"
+
+    assert not AudioMerger("wav").merge_chunks(chunks, str(out), 16000)
+
+    message = capsys.readouterr().out
+    assert "Cannot decode chunk 1 (16 bytes of audio)" in message
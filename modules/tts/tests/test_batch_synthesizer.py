@@ -0,0 +1,76 @@
+"""
+Unit tests for padded batch inference.
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from piper.config import SynthesisConfig
+
+from modules.tts.domain.core.batch_synthesizer import (
+    BatchSynthesizer
+)
+
+HOP = 4
+
+
+class FakeSession:
+    """Each id yields one hop of samples; pad id 0 is silent."""
+
+    def __init__(self, durations: bool):
+        self.durations = durations
+        self.calls = 0
+
+    def get_outputs(self):
+        return [None, None] if self.durations else [None]
+
+    def run(self, _names, args):
+        self.calls += 1
+        ids = args["input"].astype(np.float32)
+        audio = np.repeat(ids / 100.0, HOP, axis=1)[:, None, :]
+        if self.durations:
+            return [audio, np.ones_like(ids)]
+        return [audio]
+
+
+def _voice(durations: bool):
+    config = SimpleNamespace(
+        hop_length=HOP, noise_scale=0.6, length_scale=1.0,
+        noise_w_scale=0.8, num_speakers=1
+    )
+    return SimpleNamespace(
+        config=config,
+        session=FakeSession(durations),
+        phonemize=lambda text: [list(text)],
+        phonemes_to_ids=lambda ph: [ord(c) - 96 for c in ph]
+    )
+
+
+def _single(text):
+    ids = [ord(c) - 96 for c in text]
+    return np.repeat(np.array(ids) / max(ids), HOP)
+
+
+def test_batches_match_per_phrase_audio():
+    """Durations cut padding off every phrase exactly."""
+    texts = ["abc", "z", "hello", "ab"]
+    config = SynthesisConfig(normalize_audio=True)
+    voice = _voice(durations=True)
+
+    audio = BatchSynthesizer(voice, 2).synthesize(texts, config)
+
+    assert voice.session.calls == 2
+    for text, samples in zip(texts, audio):
+        expected = _single(text) * 32767
+        assert np.array_equal(samples, expected.astype(np.int16))
+
+
+def test_refuses_models_without_durations():
+    """No guessing at phrase ends from the padded audio."""
+    voice = _voice(durations=False)
+    assert not BatchSynthesizer.supports(voice)
+
+    with pytest.raises(ValueError):
+        BatchSynthesizer(voice, 2).synthesize(
+            ["abc", "z"], SynthesisConfig()
+        )
@@ -7,12 +7,9 @@ from pathlib import Path
 from modules.tts.domain.core.enhanced_text_processor import (
     EnhancedTextProcessor
 )
-from modules.tts.domain.core.tts_engine import TTSEngine
-from modules.tts.domain.audio.silence_generator import (
-    SilenceGenerator
-)
 from modules.tts.domain.audio.wav_merger import WavMerger
 from modules.tts.domain.audio.mp3_converter import Mp3Converter
+from .chapter_chunks import generate_chunks
 
 
 def main():
@@ -43,26 +40,7 @@ def main():
     
     print(f"\nText processed into {len(chunks)} chunks")
     
-    # Generate audio
-    engine = TTSEngine(language="es_mx")
-    silence_gen = SilenceGenerator()
-    
-    print("\nGenerating audio chunks...")
-    for i, chunk in enumerate(chunks, 1):
-        print(f"  [{i}/{len(chunks)}]", end=" ")
-        
-        chunk_path = output_dir / f"chunk_{i:03d}.wav"
-        
-        if chunk.startswith('<silence:'):
-            duration = float(chunk.split(':')[1].rstrip('>'))
-            print(f"Silence {duration}s")
-            silence_gen.generate_silence(
-                duration,
-                str(chunk_path)
-            )
-        else:
-            print(f"{len(chunk)} chars")
-            engine.synthesize(chunk, str(chunk_path))
+    generate_chunks(chunks, output_dir)
     
     # Merge
     print("\nMerging chunks...")
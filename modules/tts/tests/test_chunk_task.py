@@ -0,0 +1,18 @@
+"""
+Unit tests for the chunk synthesis task.
+"""
+from modules.tts.domain.audio.pcm_io import PcmIO
+from modules.tts.tasks.tts_tasks import synthesize_chunk
+from .eager_celery import eager
+
+
+def test_chunk_task_writes_wav(eager, tmp_path):
+    """The task renders markup with pauses to a WAV."""
+    result = synthesize_chunk.delay(
+        "Hola<silence:0.5>mundo", "00001",
+        chunk_dir=str(tmp_path)
+    ).get()
+
+    samples, params = PcmIO.read_wav(result["path"])
+    assert len(samples) > params.framerate * 0.5
+    assert result["metrics"]["audio_seconds"] > 0.5
@@ -0,0 +1,70 @@
+"""
+Unit tests for the Celery fan-out with an eager broker.
+"""
+from click.testing import CliRunner
+
+from modules.tts.application.work_chords import WorkChords
+from modules.tts.commands.process_all_cmd import process_all
+from modules.tts.domain.audio.chapter_merger import ChapterMerger
+from modules.tts.storage.job_journal import JobJournal
+from .eager_celery import WORK, chord_runner, eager
+
+
+def test_chord_merges_each_work(eager, tmp_path):
+    """Every work comes back encoded with its metrics."""
+    works = [WORK]
+    runner = chord_runner(tmp_path)
+    reported = []
+
+    results = runner.run(works, reported.append)
+
+    assert reported == results
+    done, = results
+    assert done.success, done.error
+    assert done.output_file.endswith(
+        f"{works[0].folder_name}/work.mp3"
+    )
+    assert done.metrics.audio_seconds > 1.0
+    assert 0 < done.elapsed < 60
+    assert not list((tmp_path / "out").rglob("*.wav"))
+
+
+def test_failed_merge_is_reported(eager, tmp_path, monkeypatch):
+    """A chord error becomes a failed result, not a crash."""
+    monkeypatch.setattr(
+        ChapterMerger, "merge_chapter", lambda *a, **k: False
+    )
+    runner = chord_runner(tmp_path)
+
+    result, = runner.run([WORK], lambda result: None)
+
+    assert not result.success
+    assert "Merge failed" in result.error
+
+
+def test_journaled_works_are_skipped(eager, tmp_path, monkeypatch):
+    """A rerun does not resend works already encoded."""
+    journal = JobJournal(tmp_path / ".jobs")
+    first, = chord_runner(tmp_path, journal).run([WORK], lambda r: None)
+    sent = []
+    monkeypatch.setattr(
+        WorkChords, "send", lambda self, *a: sent.append(a)
+    )
+
+    again, = chord_runner(tmp_path, journal).run([WORK], lambda r: None)
+
+    assert again.success and again.output_file == first.output_file
+    assert sent == []
+
+
+def test_local_flags_are_rejected(tmp_path):
+    """--distributed refuses flags its workers would ignore."""
+    manifest = tmp_path / "m.json"
+    manifest.write_text("{}", encoding='utf-8')
+
+    result = CliRunner().invoke(process_all, [
+        str(manifest), "--distributed", "--workers", "2"
+    ])
+
+    assert result.exit_code == 2
+    assert "not supported with --distributed" in result.output
@@ -0,0 +1,27 @@
+"""
+Unit tests for the ffmpeg block decoder.
+"""
+import shutil
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from modules.tts.domain.audio.ffmpeg_decoder import decoded_blocks
+
+# Far more than a pipe buffer, so the feeder is still writing
+JUNK = np.random.default_rng(5).bytes(8 << 20)
+
+
+def test_ffmpeg_error_is_raised():
+    """Undecodable input raises with ffmpeg's message."""
+    with pytest.raises(RuntimeError, match="Cannot decode .+: .+"):
+        list(decoded_blocks(JUNK, 16000, 4096))
+
+
+def test_unread_input_is_not_a_short_stream(monkeypatch):
+    """A converter quitting mid-input raises, even with status 0."""
+    monkeypatch.setattr(AudioSegment, "converter", shutil.which("true"))
+
+    with pytest.raises(RuntimeError, match="before reading all input"):
+        list(decoded_blocks(JUNK, 16000, 4096))
@@ -0,0 +1,44 @@
+"""
+Unit tests for the kernel-assisted byte range copy.
+"""
+import errno
+import os
+
+import pytest
+
+from modules.tts.domain.audio import file_range_copy
+
+
+def _failing_kernel(code):
+    """A kernel copy step that always fails with code."""
+    def kernel_copy(src_fd, dst_fd, offset, count):
+        raise OSError(code, os.strerror(code))
+    return kernel_copy
+
+
+def test_unsupported_fast_path_falls_back(tmp_path, monkeypatch):
+    """EXDEV from the kernel copy is served in user space."""
+    src = tmp_path / "src.bin"
+    src.write_bytes(bytes(range(256)) * 8)
+    monkeypatch.setattr(
+        file_range_copy, "_kernel_copy", _failing_kernel(errno.EXDEV)
+    )
+
+    with open(src, 'rb') as s, open(tmp_path / "dst.bin", 'wb') as d:
+        file_range_copy.copy_range(s, d, 100, 1000)
+
+    expected = src.read_bytes()[100:1100]
+    assert (tmp_path / "dst.bin").read_bytes() == expected
+
+
+def test_real_copy_errors_propagate(tmp_path, monkeypatch):
+    """An I/O error is raised, not hidden by the fallback."""
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"x" * 64)
+    monkeypatch.setattr(
+        file_range_copy, "_kernel_copy", _failing_kernel(errno.EIO)
+    )
+
+    with open(src, 'rb') as s, open(tmp_path / "dst.bin", 'wb') as d:
+        with pytest.raises(OSError):
+            file_range_copy.copy_range(s, d, 0, 64)
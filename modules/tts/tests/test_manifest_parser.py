@@ -0,0 +1,69 @@
+"""
+Unit tests for manifest title resolution.
+"""
+from modules.tts.benchmarks.bench_manifest_parser import legacy_start
+from modules.tts.domain.manifest.manifest_parser import (
+    ManifestParser
+)
+
+BOOK = """Franz Kafka
+ÍNDICE
+$ El proceso (1925)
+$ La condena (1913)
+$ Carta al padre
+$ Obra perdida
+$ La condena (1913)
+FIN DEL ÍNDICE
+
+EL PROCESO
+Alguien debía de haber calumniado a Josef K.
+  la condena  \r
+Georg Bendemann estaba sentado.
+
+Carta al padre
+Querido padre.
+LA CONDENA
+Otra vez.
+"""
+
+QUERIES = [
+    "El proceso", "La condena", "Carta al padre", "Obra perdida",
+    "  carta AL padre ", "", "FIN DEL ÍNDICE", "Franz Kafka",
+]
+
+
+def _parser(tmp_path, text=BOOK):
+    book = tmp_path / "kafka.txt"
+    book.write_text(text, encoding='utf-8')
+    parser = ManifestParser(str(book))
+    parser._load_file()
+    return parser
+
+
+def test_title_map_matches_legacy_scan(tmp_path):
+    """One-pass lookups equal the old two-scan resolver."""
+    parser = _parser(tmp_path)
+
+    for title in QUERIES:
+        assert parser._find_work_start(title) == (
+            legacy_start(parser, title)
+        ), title
+
+
+def test_without_index_end_whole_file_is_searched(tmp_path):
+    """No FIN DEL ÍNDICE: both scan from the first line."""
+    parser = _parser(tmp_path, BOOK.replace("FIN DEL ÍNDICE", "--"))
+
+    for title in QUERIES:
+        assert parser._find_work_start(title) == (
+            legacy_start(parser, title)
+        ), title
+
+
+def test_parse_orders_works_and_skips_duplicates(tmp_path):
+    """First body occurrence wins; index-only titles drop out."""
+    manifest = _parser(tmp_path).parse()
+
+    assert [(w.title, w.start_line) for w in manifest.works] == [
+        ("El proceso", 10), ("La condena", 12), ("Carta al padre", 15)
+    ]
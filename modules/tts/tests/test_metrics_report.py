@@ -0,0 +1,45 @@
+"""
+Unit tests for the run-level metrics report.
+"""
+import json
+
+import click
+from click.testing import CliRunner
+
+from modules.tts.application.work_result import WorkResult
+from modules.tts.commands.metrics_report import echo_metrics_table
+from modules.tts.commands.run_logging import log_run
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.storage.run_log import RunLog
+
+
+def _results():
+    results = []
+    for work_id in (1, 2, 3):
+        result = WorkResult(work_id, f"W{work_id}", True, elapsed=10.0)
+        result.metrics = StageMetrics(audio_seconds=100.0)
+        results.append(result)
+    return results
+
+
+def test_run_line_uses_wall_time_not_summed_works(tmp_path):
+    """Three works run at once in 10 s give RTF 10 / 300."""
+    log = RunLog(tmp_path / "m.jsonl")
+
+    log_run(log, _results(), 10.0)
+
+    run = json.loads(log.path.read_text().splitlines()[-1])
+    assert run["elapsed"] == 10.0
+    assert run["real_time_factor"] == round(10 / 300, 4)
+
+
+def test_table_total_row_uses_wall_time():
+    """The total row shows the run's wall clock."""
+    command = click.command()(
+        lambda: echo_metrics_table(_results(), 12.0)
+    )
+
+    output = CliRunner().invoke(command).output
+
+    total = output.strip().splitlines()[-1]
+    assert total.split()[:4] == ["total", "300s", "12.0s", "0.040"]
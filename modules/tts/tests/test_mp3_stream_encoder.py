@@ -0,0 +1,76 @@
+"""
+Unit tests for the piped ffmpeg MP3 encoder.
+"""
+import subprocess
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from modules.tts.application.work_encoders import StreamingWorkEncoder
+from modules.tts.domain.audio.mp3_stream_encoder import (
+    Mp3StreamEncoder
+)
+from modules.tts.domain.core.stage_metrics import StageMetrics
+
+RATE = 16000
+
+
+def _tone(seconds):
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16)
+
+
+def _decode(path):
+    """MP3 back to int16 at RATE, with ffmpeg alone."""
+    pcm = subprocess.run(
+        [AudioSegment.converter, "-loglevel", "error", "-i", path,
+         "-f", "s16le", "-ac", "1", "-ar", str(RATE), "-"],
+        capture_output=True, check=True
+    ).stdout
+    return np.frombuffer(pcm, np.int16)
+
+
+def test_round_trip_through_stdin_pipe(tmp_path):
+    """Blocks written over the pipe decode to the same length."""
+    encoder = Mp3StreamEncoder(tmp_path / "out" / "a.mp3", RATE)
+    for _ in range(4):
+        encoder.write(_tone(0.5))
+
+    path = encoder.finish()
+
+    samples = _decode(path)
+    assert abs(len(samples) - 2 * RATE) < 0.1 * RATE
+    assert np.abs(samples).max() > 4000
+
+
+def test_ffmpeg_failure_reports_stderr(tmp_path):
+    """A rejected setting raises with ffmpeg's message."""
+    encoder = Mp3StreamEncoder(tmp_path / "a.mp3", RATE, "nonsense")
+
+    with pytest.raises(RuntimeError, match="MP3 encoding failed: .+"):
+        encoder.finish()
+    assert not (tmp_path / "a.mp3").exists()
+
+
+class FailingRenderer:
+    """Writes one chunk, then fails like a crashed voice."""
+
+    sample_rate = RATE
+
+    def __init__(self):
+        self.metrics = StageMetrics()
+
+    def render(self, chunks, sink, on_chunk=None):
+        sink.write(_tone(0.5))
+        raise ValueError("voice died")
+
+
+def test_abort_removes_partial_mp3(tmp_path):
+    """A failed render kills ffmpeg and drops work.mp3."""
+    with pytest.raises(ValueError):
+        StreamingWorkEncoder().encode(
+            FailingRenderer(), [("x",)], tmp_path
+        )
+
+    assert not (tmp_path / "work.mp3").exists()
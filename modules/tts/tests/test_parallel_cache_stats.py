@@ -0,0 +1,27 @@
+"""
+Unit tests for cache statistics across renderer workers.
+"""
+from modules.tts.application.parallel_chunk_renderer import (
+    ParallelChunkRenderer
+)
+from modules.tts.storage.synthesis_cache import SynthesisCache
+from .test_parallel_chunk_renderer import OPTIONS, _render, stub_voice
+
+
+def test_cache_stats_sum_across_workers(tmp_path):
+    """Second pass is served from the shared disk cache."""
+    cache = SynthesisCache(str(tmp_path))
+    renderer = ParallelChunkRenderer(
+        2, "es", batch_size=1, cache=cache, options=OPTIONS
+    )
+    try:
+        _render(renderer)
+        first = renderer.cache_stats
+        _render(renderer)
+    finally:
+        renderer.close()
+
+    second = renderer.cache_stats - first
+    assert (first.hits, first.misses) == (0, 12)
+    assert (second.hits, second.misses) == (12, 0)
+
@@ -0,0 +1,75 @@
+"""
+Unit tests for the process-pool chunk renderer.
+"""
+import numpy as np
+import pytest
+
+from modules.tts.application.chunk_renderer import ChunkRenderer
+from modules.tts.application.parallel_chunk_renderer import (
+    ParallelChunkRenderer
+)
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.stub_voice import StubVoice
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.text.pause_tokens import Pause
+
+CHUNKS = [
+    (f"Frase número {i}, " + "larga " * (i % 5),)
+    for i in range(12)
+] + [(Pause(0.3),)]
+
+OPTIONS = EngineOptions(enhance_level="work")
+
+
+class ListSink:
+    def __init__(self):
+        self.blocks = []
+
+    def write(self, samples):
+        self.blocks.append(samples)
+
+
+@pytest.fixture(autouse=True)
+def stub_voice(monkeypatch):
+    """Forked workers inherit the patched model loader."""
+    def load_model(engine):
+        engine.voice = StubVoice()
+    monkeypatch.setattr(TTSEngine, "load_model", load_model)
+
+
+def _render(renderer):
+    sink, progress = ListSink(), []
+    renderer.render(
+        CHUNKS, sink, lambda done, total: progress.append(done)
+    )
+    return sink.blocks, progress
+
+
+def test_pool_output_matches_sequential_order():
+    """Chunks come back in index order, identical audio."""
+    expected, _ = _render(
+        ChunkRenderer(TTSEngine(options=OPTIONS))
+    )
+    renderer = ParallelChunkRenderer(
+        2, "es", batch_size=2, options=OPTIONS
+    )
+    try:
+        blocks, progress = _render(renderer)
+    finally:
+        renderer.close()
+
+    assert progress == list(range(1, len(CHUNKS) + 1))
+    assert len(blocks) == len(expected)
+    for got, want in zip(blocks, expected):
+        assert np.array_equal(got, want)
+    assert renderer.metrics.audio_seconds > 0
+
+
+def test_close_shuts_the_pool_down():
+    """No work is accepted after close()."""
+    renderer = ParallelChunkRenderer(1, "es", options=OPTIONS)
+    assert renderer.sample_rate == 22050
+    renderer.close()
+
+    with pytest.raises(RuntimeError):
+        renderer.pool.submit(int)
@@ -0,0 +1,72 @@
+"""
+Unit tests for work scheduling and the parallel runner.
+"""
+from modules.tts.domain.manifest import Work
+from modules.tts.application.work_result import WorkResult
+from modules.tts.application.work_scheduler import WorkScheduler
+from modules.tts.application.parallel_runner import (
+    ParallelWorkRunner
+)
+
+
+def _work(work_id, lines):
+    return Work(
+        id=work_id, title=f"W{work_id}", year=None,
+        start_line=0, end_line=lines
+    )
+
+
+class FakePool:
+    """Pool whose first pass loses every work."""
+
+    def __init__(self, crashes: int):
+        self.crashes = crashes
+        self.batches = []
+
+    def execute(self, works, on_result):
+        self.batches.append([w.id for w in works])
+        if self.crashes:
+            self.crashes -= 1
+            return [], list(works)
+        results = [
+            WorkResult(w.id, w.title, success=True)
+            for w in works
+        ]
+        for result in results:
+            on_result(result)
+        return results, []
+
+
+def test_largest_first_orders_by_size():
+    """Test long works are scheduled first."""
+    works = [_work(1, 10), _work(2, 500), _work(3, 500)]
+
+    ordered = WorkScheduler.largest_first(works)
+
+    assert [w.id for w in ordered] == [2, 3, 1]
+
+
+def test_runner_retries_crashed_works():
+    """Test interrupted works run again in a new pool."""
+    pool = FakePool(crashes=1)
+    seen = []
+
+    results = ParallelWorkRunner(pool).run(
+        [_work(1, 5), _work(2, 50)], seen.append
+    )
+
+    assert pool.batches == [[2, 1], [2, 1]]
+    assert all(r.success for r in results)
+    assert len(seen) == 2
+
+
+def test_runner_reports_works_lost_after_retries():
+    """Test persistent crashes become failures."""
+    pool = FakePool(crashes=5)
+
+    results = ParallelWorkRunner(pool, max_retries=1).run(
+        [_work(1, 5)], lambda result: None
+    )
+
+    assert len(pool.batches) == 2
+    assert not results[0].success
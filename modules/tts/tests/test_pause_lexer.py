@@ -0,0 +1,80 @@
+"""
+Unit tests for the one-pass punctuation lexer.
+"""
+import hashlib
+import re
+
+from modules.tts.domain.text.chunk_hash import chunk_hash
+from modules.tts.domain.core.enhanced_text_processor import (
+    EnhancedTextProcessor
+)
+from modules.tts.domain.text.pause_config import PauseConfig
+from modules.tts.domain.text.pause_tokens import Pause, to_markup
+from modules.tts.domain.text.punctuation_pauser import (
+    PunctuationPauser
+)
+
+TEXT = (
+    "CAPÍTULO I§PAUSE2000§¿Quién era?... Nadie—dijo; "
+    "o acaso: él, ella, ¡todos!\n\nY luego – nada..¡¿.\n"
+    "§PAUSE500§Fin,, sin más"
+)
+
+
+TEMP_MARKERS = [
+    ('...', '§ELLIPSIS§'), ('—', '§EMDASH§'), ('–', '§ENDASH§'),
+    (';', '§SEMICOLON§'), (':', '§COLON§'), (',', '§COMMA§'),
+    ('¿', ''), ('¡', ''), ('?', '§QUESTION§'),
+    ('!', '§EXCLAMATION§'), ('.', '§PERIOD§'),
+]
+
+
+def _legacy_add_pauses(text):
+    for mark, temp in TEMP_MARKERS:
+        text = text.replace(mark, temp)
+    for mark, temp in TEMP_MARKERS:
+        if temp:
+            seconds = PauseConfig.get_pause_seconds(mark)
+            text = text.replace(temp, f"<silence:{seconds}>")
+    text = text.replace('§PAUSE2000§', '<silence:2.0>')
+    return text.replace('§PAUSE500§', '<silence:0.5>')
+
+
+def _legacy_chunks(text):
+    chunks = []
+    for i, part in enumerate(re.split(r'<silence:([\d.]+)>', text)):
+        if i % 2 and float(part) >= 1.5:
+            chunks.append(f"<silence:{part}>")
+        elif i % 2 and chunks and not chunks[-1].startswith('<'):
+            chunks[-1] += f" <silence:{part}>"
+        elif i % 2:
+            chunks.append(f"<silence:{part}>")
+        elif part.strip():
+            chunks.append(part)
+    return chunks
+
+
+def test_add_pauses_matches_replace_chain():
+    """Markup output is identical to the old replace passes."""
+    assert PunctuationPauser().add_pauses(TEXT) == (
+        _legacy_add_pauses(TEXT)
+    )
+
+
+def test_chunks_match_markup_chunking():
+    """Token chunks render to the old chunk strings."""
+    processor = EnhancedTextProcessor()
+    chunks = processor._chunk_tokens(
+        processor.pauser.tokenize(TEXT)
+    )
+    expected = _legacy_chunks(_legacy_add_pauses(TEXT))
+    assert [to_markup(c, sep=" ") for c in chunks] == expected
+    assert chunk_hash(chunks[1]) == hashlib.sha1(
+        expected[1].encode()
+    ).hexdigest()[:16]
+
+
+def test_numbers_between_marks_stay_text():
+    """'3,14' is speech, not a 14-second pause."""
+    tokens = list(PunctuationPauser().tokenize("3,14"))
+    assert tokens == ["3", Pause(0.5), "14"]
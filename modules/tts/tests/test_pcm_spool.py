@@ -0,0 +1,78 @@
+"""
+Unit tests for the PCM spool and raw PCM files.
+"""
+import numpy as np
+
+from modules.tts.application.work_finalizer import WorkFinalizer
+from modules.tts.domain.audio.pcm_spool import PcmSpool
+from modules.tts.domain.audio.raw_pcm_file import RawPcmFile
+
+
+def _blocks(sizes):
+    rng = np.random.default_rng(3)
+    return [
+        rng.integers(-5000, 5000, n).astype(np.int16)
+        for n in sizes
+    ]
+
+
+def test_raw_file_reads_back_in_bounded_blocks(tmp_path):
+    """Samples come back in order, block_samples at a time."""
+    blocks = _blocks((700, 300, 1))
+    raw = RawPcmFile(tmp_path / "a.pcm")
+    for block in blocks:
+        raw.write(block)
+
+    read = list(raw.iter_blocks(block_samples=256))
+
+    assert max(len(b) for b in read) == 256
+    assert np.array_equal(np.concatenate(read), np.concatenate(blocks))
+    raw.discard()
+    assert not (tmp_path / "a.pcm").exists()
+
+
+def test_raw_file_resumes_after_kept_prefix(tmp_path):
+    """keep_bytes truncates a torn tail and appends after it."""
+    first = RawPcmFile(tmp_path / "a.pcm")
+    first.write(np.arange(10, dtype=np.int16))
+    first.flush()
+
+    again = RawPcmFile(tmp_path / "a.pcm", keep_bytes=8)
+    again.write(np.array([99], np.int16))
+
+    samples = np.concatenate(list(again.iter_blocks()))
+    assert samples.tolist() == [0, 1, 2, 3, 99]
+
+
+def test_spool_spills_past_budget(tmp_path):
+    """Over budget, all audio moves to disk, order intact."""
+    blocks = _blocks((400, 400, 400))
+    spool = PcmSpool(16000, tmp_path / "w.pcm", memory_budget=1000)
+
+    spool.write(blocks[0])
+    assert spool.spill is None
+    for block in blocks[1:]:
+        spool.write(block)
+
+    assert spool.spill is not None and spool.blocks == []
+    assert spool.total_samples == 1200
+    assert np.array_equal(
+        np.concatenate(list(spool.iter_blocks())),
+        np.concatenate(blocks)
+    )
+    spool.close()
+    assert not (tmp_path / "w.pcm").exists()
+
+
+def test_finalizer_streams_spilled_spool(tmp_path):
+    """A spilled spool encodes without an intermediate WAV."""
+    spool = PcmSpool(16000, tmp_path / "w.pcm", memory_budget=100)
+    for block in _blocks((16000, 16000)):
+        spool.write(block)
+
+    mp3 = WorkFinalizer().finalize(spool, tmp_path)
+    spool.close()
+
+    assert mp3 == str(tmp_path / "work.mp3")
+    assert (tmp_path / "work.mp3").stat().st_size > 1000
+    assert not (tmp_path / "work.wav").exists()
@@ -0,0 +1,37 @@
+"""
+Unit tests for the pipeline benchmark with the stub voice.
+"""
+from modules.tts.application.benchmark_report import STAGES
+from modules.tts.application.pipeline_benchmark import (
+    PipelineBenchmark
+)
+from modules.tts.domain.core.engine_options import EngineOptions
+from modules.tts.domain.core.stub_voice import StubVoice
+from modules.tts.domain.core.tts_engine import TTSEngine
+
+
+def test_report_covers_every_stage(tmp_path):
+    """A stub-voice run times all stages and the audio."""
+    engine = TTSEngine(options=EngineOptions(enhance_level="work"))
+    engine.voice = StubVoice()
+    text = "TÍTULO\nHola, mundo. ¿Qué tal?\n\nBien; gracias."
+
+    report = PipelineBenchmark(engine, tmp_path).run(text)
+
+    assert set(report["stages"]) == set(STAGES)
+    assert report["chars"] == len(text)
+    assert report["audio_seconds"] > 2.0
+    assert 0 < report["real_time_factor"]
+    assert (tmp_path / "bench.mp3").exists()
+
+
+def test_chunk_level_engine_and_empty_text(tmp_path):
+    """Raw speech comes from any engine; no audio gives RTF 0."""
+    engine = TTSEngine()
+    engine.voice = StubVoice()
+    bench = PipelineBenchmark(engine, tmp_path)
+
+    assert bench.run("Hola.")["audio_seconds"] > 0
+    report = bench.run("")
+    assert report["audio_seconds"] == 0
+    assert report["real_time_factor"] == 0.0
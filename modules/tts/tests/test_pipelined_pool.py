@@ -0,0 +1,57 @@
+"""
+Unit tests for the pipelined renderer's worker pool.
+"""
+import threading
+
+from modules.tts.application.pipelined_renderer import (
+    PipelinedChunkRenderer
+)
+from modules.tts.domain.audio import lazy_enhancer
+from .test_pipelined_renderer import (
+    CHUNKS, ListSink, _engine, _slow_invert
+)
+
+
+def test_in_flight_chunks_are_bounded():
+    """Synthesis stalls once queue_depth chunks are pending."""
+    engine = _engine()
+    engine.enhance_pcm = _slow_invert
+    synthesize = engine.synthesize_tokens
+    counts = {"synthesized": 0, "written": 0, "peak": 0}
+
+    def counting_synthesize(tokens, enhance=True):
+        counts["synthesized"] += 1
+        return synthesize(tokens, enhance)
+
+    def on_write():
+        counts["written"] += 1
+        in_flight = counts["synthesized"] - counts["written"]
+        counts["peak"] = max(counts["peak"], in_flight)
+
+    engine.synthesize_tokens = counting_synthesize
+    chunks = [("Frase número %d." % i,) for i in range(12)]
+
+    PipelinedChunkRenderer(engine, 1, queue_depth=2).render(
+        chunks, ListSink(on_write)
+    )
+
+    assert counts["written"] == 12
+    assert counts["peak"] <= 2
+
+
+def test_enhancer_is_built_once_before_the_pool(monkeypatch):
+    """Pool threads share one enhancer made on the caller."""
+    built = []
+    real = lazy_enhancer.AudioEnhancer
+
+    def recording(rate):
+        built.append(threading.current_thread().name)
+        return real(rate)
+
+    monkeypatch.setattr(lazy_enhancer, "AudioEnhancer", recording)
+
+    PipelinedChunkRenderer(_engine(), workers=3).render(
+        CHUNKS, ListSink()
+    )
+
+    assert built == [threading.current_thread().name]
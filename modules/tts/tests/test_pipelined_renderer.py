@@ -0,0 +1,73 @@
+"""
+Unit tests for the pipelined enhancement renderer.
+"""
+import time
+
+import numpy as np
+import pytest
+
+from modules.tts.application.pipelined_renderer import (
+    PipelinedChunkRenderer
+)
+from modules.tts.domain.core.stub_voice import StubVoice
+from modules.tts.domain.core.tts_engine import TTSEngine
+from modules.tts.domain.text.pause_tokens import Pause
+
+CHUNKS = [
+    ("Primera frase.",),
+    (Pause(0.5),),
+    ("Segunda", Pause(0.2), "y tercera."),
+    ("Una frase bastante más larga que las otras.",),
+    ("Fin.",),
+]
+
+
+class ListSink:
+    def __init__(self, on_write=None):
+        self.blocks = []
+        self.on_write = on_write
+
+    def write(self, samples):
+        if self.on_write:
+            self.on_write()
+        self.blocks.append(samples)
+
+
+def _engine():
+    engine = TTSEngine()
+    engine.voice = StubVoice()
+    return engine
+
+
+def _slow_invert(raw, metrics):
+    """Deterministic 'enhancement' finishing out of order."""
+    time.sleep(0.02 if len(raw) % 2 else 0.001)
+    with metrics.timed("enhancement", raw.nbytes):
+        return -raw
+
+
+def test_output_matches_sequential_order():
+    """Chunks reach the sink in order, enhanced."""
+    engine = _engine()
+    expected = [
+        -engine.synthesize_tokens(c, enhance=False)
+        for c in CHUNKS
+    ]
+    engine.enhance_pcm = _slow_invert
+    sink = ListSink()
+    progress = []
+
+    renderer = PipelinedChunkRenderer(engine, workers=3)
+    renderer.render(
+        CHUNKS, sink, lambda done, total: progress.append(done)
+    )
+
+    assert len(sink.blocks) == len(expected)
+    for got, want in zip(sink.blocks, expected):
+        assert np.array_equal(got, want)
+    assert progress == list(range(1, len(CHUNKS) + 1))
+    assert renderer.metrics.seconds["enhancement"] > 0
+    assert renderer.metrics.audio_seconds == pytest.approx(sum(
+        len(b) for b in expected
+    ) / engine.sample_rate)
+
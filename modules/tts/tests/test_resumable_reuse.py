@@ -0,0 +1,37 @@
+"""
+Unit tests for reusing or discarding journaled work.
+"""
+import pytest
+
+from .test_resumable_work import (
+    CHUNKS, FakeEncoder, FakeRenderer, _work
+)
+
+
+def test_skips_encoded_work_with_same_text(tmp_path):
+    """A finished work is not rendered again."""
+    mp3 = _work(tmp_path).encode(
+        FakeEncoder(), FakeRenderer(), CHUNKS
+    )
+    (tmp_path / "work.mp3").touch()
+
+    renderer = FakeRenderer()
+    again = _work(tmp_path).encode(
+        FakeEncoder(), renderer, CHUNKS
+    )
+
+    assert again == mp3
+    assert renderer.rendered == []
+
+
+def test_changed_voice_settings_start_over(tmp_path):
+    """Logged audio from other settings is not replayed."""
+    with pytest.raises(RuntimeError):
+        _work(tmp_path).encode(
+            FakeEncoder(), FakeRenderer("tres"), CHUNKS
+        )
+
+    renderer = FakeRenderer(signature="voice-b")
+    _work(tmp_path).encode(FakeEncoder(), renderer, CHUNKS)
+
+    assert renderer.rendered == CHUNKS
@@ -0,0 +1,40 @@
+"""
+Unit tests for a spilling buffered encoder under the journal.
+"""
+import numpy as np
+import pytest
+
+from modules.tts.application.buffered_work_encoder import (
+    BufferedWorkEncoder
+)
+from modules.tts.application.work_finalizer import WorkFinalizer
+from .test_resumable_work import CHUNKS, FakeRenderer, _work
+
+
+@pytest.fixture
+def encoded(monkeypatch):
+    """Samples the finalizer would have encoded."""
+    samples = []
+
+    def finalize(self, spool, work_dir):
+        samples[:] = np.concatenate(list(spool.iter_blocks()))
+        return str(work_dir / "work.mp3")
+
+    monkeypatch.setattr(WorkFinalizer, "finalize", finalize)
+    return samples
+
+
+def test_spilled_spool_keeps_the_log(tmp_path, encoded):
+    """A spill neither corrupts the output nor the PCM log."""
+    with pytest.raises(RuntimeError):
+        _work(tmp_path).encode(
+            BufferedWorkEncoder(1), FakeRenderer("tres"), CHUNKS
+        )
+    assert (tmp_path / "work.pcm").stat().st_size == 12
+
+    renderer = FakeRenderer()
+    _work(tmp_path).encode(BufferedWorkEncoder(1), renderer, CHUNKS)
+
+    assert renderer.rendered == ["tres", "cuatro"]
+    assert encoded == [0]*3 + [1]*3 + [2]*3 + [3]*3
+    assert not (tmp_path / "work.spool.pcm").exists()
@@ -0,0 +1,65 @@
+"""
+Unit tests for journal-backed work resumption.
+"""
+import numpy as np
+import pytest
+
+from modules.tts.application.resumable_work import ResumableWork
+from modules.tts.domain.core.stage_metrics import StageMetrics
+from modules.tts.storage.job_journal import JobJournal
+
+CHUNKS = ["uno", "dos", "tres", "cuatro"]
+
+
+class FakeRenderer:
+    """Renders chunk i as samples of value i, may crash."""
+
+    sample_rate = 22050
+    cache_stats = None
+
+    def __init__(self, fail_at=None, signature="voice-a"):
+        self.fail_at = fail_at
+        self.signature = signature
+        self.rendered = []
+        self.metrics = StageMetrics()
+
+    def render(self, chunks, sink, on_chunk=None):
+        for i, chunk in enumerate(chunks, 1):
+            if chunk == self.fail_at:
+                raise RuntimeError("worker died")
+            self.rendered.append(chunk)
+            sink.write(np.full(3, CHUNKS.index(chunk), np.int16))
+            on_chunk(i, len(chunks))
+
+
+class FakeEncoder:
+    """Collects every sample it is sent."""
+
+    def encode(self, renderer, chunks, work_dir, on_chunk):
+        self.samples = []
+        renderer.render(chunks, self, on_chunk)
+        return str(work_dir / "work.mp3")
+
+    def write(self, samples):
+        self.samples.extend(samples.tolist())
+
+
+def _work(tmp_path):
+    journal = JobJournal(tmp_path / ".jobs").work(1)
+    journal.save_interval = 0
+    return ResumableWork(journal, tmp_path)
+
+
+def test_resumes_at_first_missing_chunk(tmp_path):
+    """Only unfinished chunks are rendered after a crash."""
+    with pytest.raises(RuntimeError):
+        _work(tmp_path).encode(
+            FakeEncoder(), FakeRenderer("tres"), CHUNKS
+        )
+
+    renderer, encoder = FakeRenderer(), FakeEncoder()
+    _work(tmp_path).encode(encoder, renderer, CHUNKS)
+
+    assert renderer.rendered == ["tres", "cuatro"]
+    assert encoder.samples == [0]*3 + [1]*3 + [2]*3 + [3]*3
+
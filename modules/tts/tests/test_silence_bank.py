@@ -0,0 +1,43 @@
+"""
+Unit tests for the shared silence buffers.
+"""
+import wave
+
+import numpy as np
+import pytest
+
+from modules.tts.domain.audio.silence_bank import silence_block
+from modules.tts.domain.audio.silence_generator import (
+    SilenceGenerator
+)
+
+DURATIONS = (0.1, 0.3, 0.45, 0.7, 1.2, 2.0)
+
+
+def test_buffers_are_shared_and_read_only():
+    """One zeroed buffer per (rate, duration), not writable."""
+    first = silence_block(22050, 0.3)
+
+    assert silence_block(22050, 0.3) is first
+    assert silence_block(16000, 0.3) is not first
+    assert not first.any() and first.dtype == np.int16
+    with pytest.raises(ValueError):
+        first[0] = 1
+
+
+def test_lengths_match_silence_generator_wavs(tmp_path):
+    """Same sample counts as the WAVs SilenceGenerator writes."""
+    for rate in (16000, 22050):
+        generator = SilenceGenerator(rate)
+        for duration in DURATIONS:
+            path = generator.generate_silence(
+                duration, str(tmp_path / f"{rate}-{duration}.wav")
+            )
+            with wave.open(path, 'rb') as wav:
+                frames = wav.getnframes()
+
+            assert frames == int(rate * duration)
+            assert len(silence_block(rate, duration)) == frames
+            assert generator.silence_samples(duration) is (
+                silence_block(rate, duration)
+            )
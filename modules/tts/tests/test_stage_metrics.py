@@ -0,0 +1,62 @@
+"""
+Unit tests for stage metrics and per-chunk records.
+"""
+import numpy as np
+
+from modules.tts.application.chunk_metrics import (
+    ChunkMetricsRecorder
+)
+from modules.tts.domain.audio.metered_sink import MeteredSink
+from modules.tts.domain.core.stage_metrics import StageMetrics
+
+
+class FakeRenderer:
+    """Each chunk costs 1s of synthesis and yields 0.5s."""
+
+    def __init__(self):
+        self.metrics = StageMetrics()
+
+    def render(self, chunks, sink, on_chunk):
+        for i, _ in enumerate(chunks, 1):
+            self.metrics.record("synthesis", 1.0, 100)
+            self.metrics.audio_seconds += 0.5
+            sink.write(np.zeros(50, np.int16))
+            on_chunk(i, len(chunks))
+
+
+class NullSink:
+    """Discards samples."""
+
+    def write(self, samples):
+        pass
+
+
+def test_recorder_slices_metrics_per_chunk():
+    """Records hold only what each chunk added."""
+    renderer = FakeRenderer()
+    renderer.metrics.record("synthesis", 7.0)
+    seen = []
+    recorder = ChunkMetricsRecorder(
+        renderer, lambda done, total: seen.append(done)
+    )
+    sink = MeteredSink(NullSink(), renderer.metrics, "merge")
+
+    renderer.render(["a", "b"], sink, recorder)
+
+    assert seen == [1, 2]
+    assert [r["seconds"]["synthesis"] for r in recorder.records] == [
+        1.0, 1.0
+    ]
+    assert recorder.records[1]["bytes"]["merge"] == 100
+    assert recorder.total.audio_seconds == 1.0
+    assert recorder.total.seconds["synthesis"] == 2.0
+
+
+def test_in_place_sum_keeps_sink_reference():
+    """+= updates the object sinks already report to."""
+    metrics = StageMetrics()
+    alias = metrics
+    metrics += StageMetrics({"encode": 2.0}, {"encode": 10}, 3.0)
+    assert alias is metrics
+    assert alias.to_dict()["bytes"]["encode"] == 10
+    assert (metrics - StageMetrics()).audio_seconds == 3.0
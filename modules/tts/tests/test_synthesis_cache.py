@@ -0,0 +1,58 @@
+"""
+Unit tests for the content-addressed synthesis cache.
+"""
+import os
+
+import numpy as np
+
+from modules.tts.storage.synthesis_cache import SynthesisCache
+
+
+def test_key_ignores_whitespace_but_not_params():
+    """Normalized text shares a key; params change it."""
+    key = SynthesisCache.key
+    assert key("hola  mundo ", "m", 1) == key("hola mundo", "m", 1)
+    assert key("hola mundo", "m", 1) != key("hola mundo", "m", 2)
+
+
+def test_roundtrip_counts_hits_and_misses(tmp_path):
+    """A put segment is returned and counted as a hit."""
+    cache = SynthesisCache(str(tmp_path))
+    samples = np.arange(100, dtype=np.int16)
+
+    assert cache.get("ab12") is None
+    cache.put("ab12", samples)
+
+    assert np.array_equal(cache.get("ab12"), samples)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    """Over the cap, the oldest entry is removed first."""
+    block = np.zeros(1000, dtype=np.int16)
+    cache = SynthesisCache(str(tmp_path), max_bytes=5000)
+
+    cache.put("aa01", block)
+    os.utime(cache._path("aa01"), (1, 1))
+    cache.put("bb02", block)
+    os.utime(cache._path("bb02"), (2, 2))
+    cache.put("cc03", block)
+
+    assert cache.get("aa01") is None
+    assert cache.get("bb02") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_overwrite_replaces_size_instead_of_adding(tmp_path):
+    """Re-putting a key does not count its bytes twice."""
+    block = np.zeros(1000, dtype=np.int16)
+    cache = SynthesisCache(str(tmp_path))
+
+    cache.put("aa01", block)
+    for _ in range(3):
+        cache.put("bb02", block)
+
+    on_disk = sum(
+        p.stat().st_size for p in tmp_path.glob("*/*.npy")
+    )
+    assert cache._current_size() == on_disk
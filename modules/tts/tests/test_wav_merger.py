@@ -0,0 +1,59 @@
+"""
+Unit tests for the frame-copying WAV merger.
+"""
+import struct
+import wave
+
+import numpy as np
+
+from modules.tts.domain.audio.pcm_io import PcmIO
+from modules.tts.domain.audio.wav_merger import WavMerger
+
+
+def _write(path, samples, rate=22050):
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+    return str(path)
+
+
+def _with_list_chunk(path):
+    """Insert a LIST chunk between fmt and data."""
+    data = open(path, 'rb').read()
+    at = data.index(b'data')
+    extra = b'LIST' + struct.pack('<I', 5) + b'INFO!\0'
+    data = data[:at] + extra + data[at:]
+    riff = struct.pack('<I', len(data) - 8)
+    open(path, 'wb').write(data[:4] + riff + data[8:])
+    return path
+
+
+def test_merge_concatenates_data_sections(tmp_path):
+    """Samples come out in order, extra chunks skipped."""
+    rng = np.random.default_rng(3)
+    parts = [
+        rng.integers(-3000, 3000, n).astype(np.int16)
+        for n in (300000, 7, 4096)
+    ]
+    inputs = [
+        _write(tmp_path / f"{i}.wav", part)
+        for i, part in enumerate(parts)
+    ]
+    _with_list_chunk(inputs[1])
+    out = tmp_path / "out" / "merged.wav"
+
+    assert WavMerger().merge(inputs, str(out))
+
+    samples, params = PcmIO.read_wav(str(out))
+    assert params.framerate == 22050
+    assert np.array_equal(samples, np.concatenate(parts))
+
+
+def test_mismatched_params_fail(tmp_path):
+    """Inputs at different rates are rejected."""
+    a = _write(tmp_path / "a.wav", np.zeros(100, np.int16))
+    b = _write(tmp_path / "b.wav", np.zeros(100, np.int16), 16000)
+
+    assert not WavMerger().merge([a, b], str(tmp_path / "out.wav"))
@@ -0,0 +1,64 @@
+"""
+Unit tests for byte-range work extraction.
+"""
+from modules.tts.domain.manifest import Work
+from modules.tts.domain.work.line_index import LineIndex
+from modules.tts.domain.work.source_stamp import SourceStamp
+from modules.tts.domain.work.work_processor import WorkExtractor
+
+BOOK = "ÍNDICE\nCAPÍTULO\n\nÁrbol y señal.\nFin.\nOTRO\n\núltima"
+
+
+def _work(end_line, **ranges):
+    return Work(
+        id=1, title="Capítulo", year=None,
+        start_line=2, end_line=end_line, **ranges
+    )
+
+
+def test_extract_matches_readlines(tmp_path):
+    """Byte slices decode to the same text as line slices."""
+    book = tmp_path / "book.txt"
+    book.write_text(BOOK, encoding='utf-8')
+    lines = book.read_text(encoding='utf-8').splitlines(True)
+    extractor = WorkExtractor(str(book), SourceStamp.of(book))
+    assert extractor.trust_ranges
+
+    for end in (5, 6, 8, 20):
+        expected = "Capítulo\n" + "".join(lines[3:end])
+        assert extractor.extract(_work(end)) == expected
+
+        start, stop = LineIndex.from_file(book).byte_range(3, end)
+        ranged = _work(end, start_byte=start, end_byte=stop)
+        assert extractor.extract(ranged) == expected
+
+
+def test_crlf_source_reads_like_text_mode(tmp_path):
+    """Windows newlines come back as '\\n'."""
+    book = tmp_path / "book.txt"
+    book.write_bytes(BOOK.replace("\n", "\r\n").encode('utf-8'))
+    with open(book, encoding='utf-8') as f:
+        lines = f.readlines()
+
+    text = WorkExtractor(str(book)).extract(_work(6))
+    assert text == "Capítulo\n" + "".join(lines[3:6])
+
+
+def test_stale_ranges_fall_back_to_line_index(tmp_path):
+    """After the book changes, stored byte ranges are ignored."""
+    book = tmp_path / "book.txt"
+    book.write_text(BOOK, encoding='utf-8')
+    start, stop = LineIndex.from_file(book).byte_range(3, 5)
+    stamp = SourceStamp.of(book)
+    edited = "ÑÑ\n" + BOOK
+    book.write_text(edited, encoding='utf-8')
+    lines = edited.splitlines(True)
+
+    with WorkExtractor(str(book), stamp) as extractor:
+        text = extractor.extract(
+            _work(6, start_byte=start, end_byte=stop)
+        )
+
+    assert not extractor.trust_ranges
+    assert extractor.data.closed
+    assert text == "Capítulo\n" + "".join(lines[3:6])
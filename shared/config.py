@@ -49,6 +49,30 @@ class TTSConfig:
     chunk_size: int = int(os.getenv("CHUNK_SIZE", "500"))
 
 
+@dataclass
+class OnnxConfig:
+    intra_op_threads: int = int(
+        os.getenv("ORT_INTRA_OP_THREADS", "0")
+    )
+    inter_op_threads: int = int(
+        os.getenv("ORT_INTER_OP_THREADS", "0")
+    )
+    optimization: str = os.getenv("ORT_OPTIMIZATION", "all")
+    execution_mode: str = os.getenv(
+        "ORT_EXECUTION_MODE",
+        "sequential"
+    )
+    cpu_mem_arena: bool = os.getenv(
+        "ORT_CPU_MEM_ARENA",
+        "true"
+    ).lower() == "true"
+    optimized_model_dir: str = os.getenv(
+        "ORT_OPTIMIZED_MODEL_DIR",
+        ""
+    )
+
+
 redis_config = RedisConfig()
 minio_config = MinIOConfig()
 tts_config = TTSConfig()
+onnx_config = OnnxConfig()